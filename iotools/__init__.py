@@ -9,6 +9,9 @@ __all__ = [
     'write_avi',
     'load_avi',
     'save_avi',
+    'iter_avi',
+    'probe_avi',
+    'open_avi_writer',
     'help_avi',
     'decode_bytes',
     'encode_bytes',
@@ -30,6 +33,9 @@ __all__ = [
     'write_gif',
     'load_gif',
     'save_gif',
+    'iter_gif',
+    'probe_gif',
+    'open_gif_writer',
     'help_gif',
     'decode_gz',
     'encode_gz',
@@ -44,6 +50,9 @@ __all__ = [
     'write_image',
     'load_image',
     'save_image',
+    'decode_images',
+    'load_images',
+    'probe_image',
     'help_image',
     'decode_jpg',
     'encode_jpg',
@@ -51,6 +60,9 @@ __all__ = [
     'write_jpg',
     'load_jpg',
     'save_jpg',
+    'decode_jpgs',
+    'load_jpgs',
+    'probe_jpg',
     'help_jpg',
     'decode_json',
     'encode_json',
@@ -65,14 +77,26 @@ __all__ = [
     'write_mp4',
     'load_mp4',
     'save_mp4',
+    'iter_mp4',
+    'probe_mp4',
+    'open_mp4_writer',
     'help_mp4',
     'decode_npy',
     'encode_npy',
+    'encode_npy_into',
     'read_npy',
     'write_npy',
     'load_npy',
     'save_npy',
+    'open_npy_appender',
     'help_npy',
+    'decode_npz',
+    'encode_npz',
+    'read_npz',
+    'write_npz',
+    'load_npz',
+    'save_npz',
+    'help_npz',
     'decode_pickle',
     'encode_pickle',
     'read_pickle',
@@ -86,6 +110,9 @@ __all__ = [
     'write_png',
     'load_png',
     'save_png',
+    'decode_pngs',
+    'load_pngs',
+    'probe_png',
     'help_png',
     'decode_tar',
     'encode_tar',
@@ -93,6 +120,9 @@ __all__ = [
     'write_tar',
     'load_tar',
     'save_tar',
+    'open_tar_writer',
+    'iter_tar',
+    'build_tar_index',
     'help_tar',
     'decode_txt',
     'encode_txt',
@@ -107,6 +137,9 @@ __all__ = [
     'write_video',
     'load_video',
     'save_video',
+    'iter_video',
+    'probe_video',
+    'open_video_writer',
     'help_video',
     'decode_xml',
     'encode_xml',
@@ -124,6 +157,7 @@ __all__ = [
     'help_yaml',
     'decode_zip',
     'encode_zip',
+    'encode_zip_into',
     'read_zip',
     'write_zip',
     'load_zip',
@@ -131,6 +165,7 @@ __all__ = [
     'help_zip',
     'decode_zst',
     'encode_zst',
+    'encode_zst_into',
     'read_zst',
     'write_zst',
     'load_zst',
@@ -147,6 +182,9 @@ def __getattr__(attr):
         'write_avi',
         'load_avi',
         'save_avi',
+        'iter_avi',
+        'probe_avi',
+        'open_avi_writer',
         'help_avi',
     }:
         aviio = _importlib.import_module('iotools.aviio')
@@ -180,6 +218,9 @@ def __getattr__(attr):
         'write_gif',
         'load_gif',
         'save_gif',
+        'iter_gif',
+        'probe_gif',
+        'open_gif_writer',
         'help_gif',
     }:
         gifio = _importlib.import_module('iotools.gifio')
@@ -202,6 +243,9 @@ def __getattr__(attr):
         'write_image',
         'load_image',
         'save_image',
+        'decode_images',
+        'load_images',
+        'probe_image',
         'help_image',
     }:
         imageio = _importlib.import_module('iotools.imageio')
@@ -213,6 +257,9 @@ def __getattr__(attr):
         'write_jpg',
         'load_jpg',
         'save_jpg',
+        'decode_jpgs',
+        'load_jpgs',
+        'probe_jpg',
         'help_jpg',
     }:
         jpgio = _importlib.import_module('iotools.jpgio')
@@ -235,6 +282,9 @@ def __getattr__(attr):
         'write_mp4',
         'load_mp4',
         'save_mp4',
+        'iter_mp4',
+        'probe_mp4',
+        'open_mp4_writer',
         'help_mp4',
     }:
         mp4io = _importlib.import_module('iotools.mp4io')
@@ -242,14 +292,27 @@ def __getattr__(attr):
     if attr in {
         'decode_npy',
         'encode_npy',
+        'encode_npy_into',
         'read_npy',
         'write_npy',
         'load_npy',
         'save_npy',
+        'open_npy_appender',
         'help_npy',
     }:
         npyio = _importlib.import_module('iotools.npyio')
         return getattr(npyio, attr)
+    if attr in {
+        'decode_npz',
+        'encode_npz',
+        'read_npz',
+        'write_npz',
+        'load_npz',
+        'save_npz',
+        'help_npz',
+    }:
+        npzio = _importlib.import_module('iotools.npzio')
+        return getattr(npzio, attr)
     if attr in {
         'decode_pickle',
         'encode_pickle',
@@ -268,6 +331,9 @@ def __getattr__(attr):
         'write_png',
         'load_png',
         'save_png',
+        'decode_pngs',
+        'load_pngs',
+        'probe_png',
         'help_png',
     }:
         pngio = _importlib.import_module('iotools.pngio')
@@ -279,6 +345,9 @@ def __getattr__(attr):
         'write_tar',
         'load_tar',
         'save_tar',
+        'open_tar_writer',
+        'iter_tar',
+        'build_tar_index',
         'help_tar',
     }:
         tario = _importlib.import_module('iotools.tario')
@@ -301,6 +370,9 @@ def __getattr__(attr):
         'write_video',
         'load_video',
         'save_video',
+        'iter_video',
+        'probe_video',
+        'open_video_writer',
         'help_video',
     }:
         videoio = _importlib.import_module('iotools.videoio')
@@ -330,6 +402,7 @@ def __getattr__(attr):
     if attr in {
         'decode_zip',
         'encode_zip',
+        'encode_zip_into',
         'read_zip',
         'write_zip',
         'load_zip',
@@ -341,6 +414,7 @@ def __getattr__(attr):
     if attr in {
         'decode_zst',
         'encode_zst',
+        'encode_zst_into',
         'read_zst',
         'write_zst',
         'load_zst',
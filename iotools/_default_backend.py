@@ -0,0 +1,49 @@
+"""
+Backend selection of default functions (e.g. 'load_image'), which use the first installed backend.
+The backend is selected once, and selected again only when settings change
+"""
+
+import warnings
+
+from iotools.settings import settings
+from iotools._missing_module_helper import _EmptyModule
+
+
+class _DefaultBackend:
+    """
+    Callable forwarding its arguments to the function of the first installed backend
+
+    Args:
+        backends (list): (module, function, warning message) of each backend, in the order they are tried.
+            The warning message (None for the first backend) is emitted once when the backend is selected,
+            if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"] is True
+        error_msg (str): message of the error raised if no backend is installed
+        auto (tuple): (setting name, function) the function is used instead of the backends when this
+            setting is 'auto' (and at least one backend is installed). Defaults to None
+    """
+
+    def __init__(self, backends, error_msg, auto=None):
+        self._backends = backends
+        self._error_msg = error_msg
+        self._auto = auto
+        self._function = None
+        self._settings_version = None
+
+    def _select(self):
+        self._function = None
+        for module, function, warning_msg in self._backends:
+            if not isinstance(module, _EmptyModule):
+                if (warning_msg is not None) and settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
+                    warnings.warn(warning_msg, stacklevel=4)  # points to the caller of the default function
+                self._function = function
+                break
+        if (self._auto is not None) and (self._function is not None) and (settings.get(self._auto[0]) == "auto"):
+            self._function = self._auto[1]
+        self._settings_version = settings.version
+
+    def __call__(self, *args, **kwargs):
+        if self._settings_version != settings.version:
+            self._select()
+        if self._function is None:
+            raise ModuleNotFoundError(self._error_msg)
+        return self._function(*args, **kwargs)
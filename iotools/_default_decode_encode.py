@@ -1,5 +1,126 @@
 
-from io import StringIO, BytesIO
+from io import StringIO, BytesIO, RawIOBase, SEEK_SET, SEEK_CUR, SEEK_END
+
+
+class _BytesReader(RawIOBase):
+    """
+    Read-only file-like object reading a buffer (bytearray, memoryview, mmap, numpy array, ...)
+    without copying it when it is opened, unlike 'io.BytesIO' which copies all buffers except bytes.
+    The bytes read are still copied, only 'getbuffer' and 'readinto' give access to data without a copy
+    """
+
+    def __init__(self, data):
+        super().__init__()
+        self._buffer = memoryview(data).cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        return self._buffer
+
+    def readinto(self, b):
+        b = memoryview(b).cast("B")
+        data = self._buffer[self._position:self._position + len(b)]
+        b[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def read(self, size=-1):
+        end = len(self._buffer) if (size is None or size < 0) else self._position + size
+        data = self._buffer[self._position:end].tobytes()  # only the bytes read are copied
+        self._position += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_SET:
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position += offset
+        elif whence == SEEK_END:
+            self._position = len(self._buffer) + offset
+        else:
+            raise ValueError("Invalid whence ({}, should be 0, 1 or 2)".format(whence))
+        if self._position < 0:
+            raise ValueError("Negative seek position {}".format(self._position))
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        super().close()
+        self._buffer.release()  # the buffer is no longer exported, bytearrays can be resized again
+
+
+class _BytesWriter(RawIOBase):
+    """
+    File-like object writing in a preallocated writable buffer (bytearray, memoryview, mmap, numpy array, ...),
+    the number of bytes written is given by 'size'
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buffer = memoryview(buffer).cast("B")
+        if self._buffer.readonly:
+            raise TypeError("Buffer is read-only, a writable buffer is required (bytearray, memoryview, ...)")
+        self._position = 0
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        return self._buffer[:self.size]
+
+    def write(self, b):
+        b = memoryview(b).cast("B")
+        end = self._position + len(b)
+        if end > len(self._buffer):
+            raise ValueError("Buffer too small ({} bytes), at least {} bytes are needed".format(len(self._buffer), end))
+        self._buffer[self._position:end] = b
+        self._position = end
+        self.size = max(self.size, end)
+        return len(b)
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_SET:
+            self._position = offset
+        elif whence == SEEK_CUR:
+            self._position += offset
+        elif whence == SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError("Invalid whence ({}, should be 0, 1 or 2)".format(whence))
+        if self._position < 0:
+            raise ValueError("Negative seek position {}".format(self._position))
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        super().close()
+        self._buffer.release()  # the buffer is no longer exported, bytearrays can be resized again
+
+
+def _bytes_reader(data):
+    """
+    File-like object reading data without copying it when it is opened (bytes are not copied by 'io.BytesIO')
+    """
+    if isinstance(data, bytes):
+        return BytesIO(data)
+    return _BytesReader(data)
 
 
 def _default_decode_str(func, data, **kwargs):
@@ -12,14 +133,13 @@ def _default_decode_str(func, data, **kwargs):
 def _default_encode_str(func, data, **kwargs):
     filelike = StringIO()
     func(filelike, data, **kwargs)
-    filelike.seek(0)
-    ret = filelike.read()
+    ret = filelike.getvalue()
     filelike.close()
     return ret
 
 
 def _default_decode_bytes(func, data, **kwargs):
-    filelike = BytesIO(data)
+    filelike = _bytes_reader(data)
     ret = func(filelike, **kwargs)
     filelike.close()
     return ret
@@ -28,8 +148,15 @@ def _default_decode_bytes(func, data, **kwargs):
 def _default_encode_bytes(func, data, **kwargs):
     filelike = BytesIO()
     func(filelike, data, **kwargs)
-    filelike.seek(0)
-    ret = filelike.read()
+    ret = filelike.getvalue()  # unlike 'seek(0)' and 'read()', the buffer of BytesIO is returned without a copy
+    filelike.close()
+    return ret
+
+
+def _default_encode_bytes_into(func, buffer, data, **kwargs):
+    filelike = _BytesWriter(buffer)
+    func(filelike, data, **kwargs)
+    ret = filelike.size
     filelike.close()
     return ret
 
@@ -0,0 +1,74 @@
+"""
+Parsing of image headers (jpg and png), to get image properties without decoding the image
+"""
+
+import struct
+
+JPG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+JPG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}  # number of channels for each png color type
+
+
+def _sniff_image_format(header):
+    """
+    Guess the image format from the first 8 bytes of a file (its magic number), None if unknown
+    """
+    if header[:3] == b"\xff\xd8\xff":
+        return "jpg"
+    if header[:8] == PNG_SIGNATURE:
+        return "png"
+    return None
+
+
+def _probe_jpg(openfile):
+    # markers are skipped one by one until the start of frame, which contains the image size
+    openfile.seek(2)
+    while True:
+        byte = openfile.read(1)
+        if byte != b"\xff":
+            raise ValueError("Invalid jpg marker")
+        while byte == b"\xff":  # markers may be preceded by any number of fill bytes
+            byte = openfile.read(1)
+        if len(byte) == 0:
+            raise ValueError("No start of frame found in jpg file")
+        marker = byte[0]
+        if marker in JPG_STANDALONE_MARKERS:
+            continue
+        if marker == 0xD9:  # end of image
+            raise ValueError("No start of frame found in jpg file")
+        length, = struct.unpack(">H", openfile.read(2))
+        if marker in JPG_SOF_MARKERS:
+            bit_depth, height, width, channels = struct.unpack(">BHHB", openfile.read(6))
+            return {"format": "jpg", "width": width, "height": height, "channels": channels, "bit_depth": bit_depth}
+        openfile.seek(length - 2, 1)
+
+
+def _probe_png(openfile):
+    # the first chunk of a png file is always 'IHDR', which contains the image size
+    openfile.seek(8)
+    header = openfile.read(18)
+    if len(header) < 18 or header[4:8] != b"IHDR":
+        raise ValueError("No 'IHDR' chunk found at the beginning of png file")
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", header[8:18])
+    channels = PNG_CHANNELS.get(color_type)
+    return {"format": "png", "width": width, "height": height, "channels": channels, "bit_depth": bit_depth}
+
+
+def _probe_image_file(openfile):
+    """
+    Get image properties from the headers of an open image file
+
+    Args:
+        openfile (file-like): file to read, must be seekable
+
+    Returns:
+        dict: image properties (format, width, height, channels and bit_depth)
+    """
+    openfile.seek(0)
+    format = _sniff_image_format(openfile.read(8))
+    if format == "jpg":
+        return _probe_jpg(openfile)
+    if format == "png":
+        return _probe_png(openfile)
+    raise ValueError("Unknown image format, only jpg and png headers can be read")
@@ -0,0 +1,29 @@
+"""
+Deferred import of optional backends: importing a iotools module only checks which
+backends are installed, each backend is imported the first time it is used
+"""
+
+import importlib
+import importlib.util
+
+
+def _is_installed(*names):
+    """
+    Check that top level modules are installed, without importing them
+    """
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+class _LazyModule:
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, x):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, x)
+
+    def __repr__(self):
+        return "<lazy module '{}'>".format(self._name)
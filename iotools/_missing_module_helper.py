@@ -20,14 +20,14 @@ def _error_msg_sev(*args):
 
 
 def _warning_msg_default_one(*args):
-    msg = "Warning: Function '{}' does not have the default behavior, " \
+    msg = "Function '{}' does not have the default behavior, " \
           "because library '{}' is not installed." \
           "\nPlease install it or use function '{}' instead."
     return msg.format(*args)
 
 
 def _warning_msg_default_sev(func1, libs, func2):
-    msg = "Warning: Function '{}' does not have the default behavior, " \
+    msg = "Function '{}' does not have the default behavior, " \
           "because libraries '{}' and '{}' are not installed." \
           "\nPlease install them or use function '{}' instead."
     return msg.format(func1, "', '".join(libs[:-1]), libs[-1], func2)
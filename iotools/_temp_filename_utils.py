@@ -1,22 +1,65 @@
-
 import os
 import random
+import shutil
 import string
 import tempfile
+from contextlib import contextmanager
+
+from iotools.settings import settings
 
 TEMP_FILENAME = os.path.join(tempfile.gettempdir(), "iotools_")
+MEMORY_TEMP_DIR = "/dev/shm"  # tmpfs on Linux: files are kept in memory, not on the hard drive
+MEMORY_TEMP_FILENAME = os.path.join(MEMORY_TEMP_DIR, "iotools_")
+
+
+def _is_temp_in_memory(size=None):
+    """
+    Returns True if temporary files are created in memory instead of on the hard drive.
+    The memory space left must be at least twice the size of the file (/dev/shm is often small, e.g. 64 MB
+    in docker containers). Files whose size is unknown (e.g. encoded videos) are created on the hard drive,
+    since they could fill the memory
+
+    Args:
+        size (int): estimated size of the temporary file, in bytes. Defaults to None (unknown)
+    """
+    if (size is None) or not settings["USE_MEMORY_TEMP_FILES"]:
+        return False
+    if not (os.path.isdir(MEMORY_TEMP_DIR) and os.access(MEMORY_TEMP_DIR, os.W_OK)):
+        return False
+    return shutil.disk_usage(MEMORY_TEMP_DIR).free >= 2 * size
 
 
-def _get_temp_filename(format=None):
+def _get_temp_filename(format=None, size=None, in_memory=None):
     """
-    Returns a temporary filename
+    Returns a temporary filename, in memory if possible (see settings["USE_MEMORY_TEMP_FILES"] and '_is_temp_in_memory')
+
+    Args:
+        format (str): extension of the file. Defaults to None (no extension)
+        size (int): estimated size of the file, in bytes. Defaults to None (unknown, the file is on the hard drive)
+        in_memory (bool): False to always create the file on the hard drive. Defaults to None (in memory if possible)
     """
     if isinstance(format, str):
         format = "." + format.lower()
     else:
         format = ""
+    if in_memory is None:
+        in_memory = _is_temp_in_memory(size)
+    prefix = MEMORY_TEMP_FILENAME if in_memory else TEMP_FILENAME
     for _ in range(10):
-        temp_filename = TEMP_FILENAME + "".join(random.choice(string.ascii_letters) for i in range(8)) + format
+        temp_filename = prefix + "".join(random.choice(string.ascii_letters) for i in range(8)) + format
         if not os.path.exists(temp_filename):
             return temp_filename
     raise OSError("Could not find a non-used temporary file")
+
+
+@contextmanager
+def _temp_file(format=None, size=None, in_memory=None):
+    """
+    Yields a temporary filename, the file is removed on exit if it was created (arguments: see '_get_temp_filename')
+    """
+    temp_filename = _get_temp_filename(format, size=size, in_memory=in_memory)
+    try:
+        yield temp_filename
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
@@ -0,0 +1,258 @@
+"""
+Parsing of video containers headers (mp4, avi and gif), to get video properties without decoding any frame
+"""
+
+import struct
+
+MP4_CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _empty_properties(format):
+    return {
+        "format": format,
+        "codec": None,
+        "fps": None,
+        "nframes": None,
+        "duration": None,
+        "width": None,
+        "height": None,
+    }
+
+
+def _sniff_format(header):
+    """
+    Guess the video format from the first 12 bytes of a file (its magic number), None if unknown
+    """
+    if header[:4] == b"RIFF" and header[8:12] == b"AVI ":
+        return "avi"
+    if header[4:8] == b"ftyp":
+        return "mp4"
+    if header[:6] in {b"GIF87a", b"GIF89a"}:
+        return "gif"
+    return None
+
+
+# +-----+
+# | mp4 |
+# +-----+
+
+
+def _iter_mp4_boxes(data, start=0, end=None):
+    """
+    Yield (box type, content start, content end) of the mp4 boxes found in data[start:end]
+    """
+    end = len(data) if end is None else end
+    position = start
+    while position + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[position:position + 8])
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[position + 8:position + 16])[0]
+            header_size = 16
+        elif size == 0:  # box extends to the end
+            size = end - position
+        if size < header_size:
+            raise ValueError("Invalid mp4 box size")
+        yield box_type, position + header_size, min(position + size, end)
+        position += size
+
+
+def _find_mp4_moov(openfile):
+    """
+    Read the 'moov' box of an mp4 file, which contains the video properties.
+    Top level boxes are skipped without being read, since 'moov' may be at the end of the file
+    """
+    position = 0
+    while True:
+        openfile.seek(position)
+        header = openfile.read(16)
+        if len(header) < 8:
+            raise ValueError("No 'moov' box found in mp4 file")
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        if box_type == b"moov":
+            openfile.seek(position + header_size)
+            if size == 0:  # box extends to the end of the file
+                return openfile.read()
+            return openfile.read(size - header_size)
+        if size < header_size:  # size 0 means that the box extends to the end of the file
+            raise ValueError("No 'moov' box found in mp4 file")
+        position += size
+
+
+def _parse_mp4_trak(data, start, end):
+    """
+    Parse a 'trak' box, returns None if it is not a video track
+    """
+    track = {}
+    boxes = [(box_type, s, e) for box_type, s, e in _iter_mp4_boxes(data, start, end)]
+    while len(boxes) > 0:
+        box_type, s, e = boxes.pop(0)
+        version = data[s] if s < e else 0
+        if box_type in MP4_CONTAINER_BOXES:
+            boxes.extend(_iter_mp4_boxes(data, s, e))
+        elif box_type == b"tkhd":
+            offset = s + (88 if version == 1 else 76)
+            width, height = struct.unpack(">II", data[offset:offset + 8])
+            track["width"], track["height"] = width >> 16, height >> 16
+        elif box_type == b"hdlr":
+            track["handler"] = bytes(data[s + 8:s + 12])
+        elif box_type == b"mdhd":
+            if version == 1:
+                track["timescale"], track["duration"] = struct.unpack(">IQ", data[s + 20:s + 32])
+            else:
+                track["timescale"], track["duration"] = struct.unpack(">II", data[s + 12:s + 20])
+        elif box_type == b"stsd" and e - s >= 16:
+            track["codec"] = bytes(data[s + 12:s + 16]).decode("latin-1")
+        elif box_type == b"stts":
+            nb_entries = struct.unpack(">I", data[s + 4:s + 8])[0]
+            counts = struct.unpack(">" + "I" * (2 * nb_entries), data[s + 8:s + 8 + 8 * nb_entries])
+            track["nframes"] = sum(counts[::2])
+    if track.get("handler") != b"vide":
+        return None
+    return track
+
+
+def _probe_mp4(openfile):
+    properties = _empty_properties("mp4")
+    moov = memoryview(_find_mp4_moov(openfile))
+    for box_type, start, end in _iter_mp4_boxes(moov):
+        if box_type == b"trak":
+            track = _parse_mp4_trak(moov, start, end)
+            if track is not None:
+                break
+    else:
+        raise ValueError("No video track found in mp4 file")
+    properties["codec"] = track.get("codec")
+    properties["width"] = track.get("width")
+    properties["height"] = track.get("height")
+    properties["nframes"] = track.get("nframes")
+    if track.get("timescale"):
+        properties["duration"] = track["duration"] / track["timescale"]
+    if properties["nframes"] and properties["duration"]:
+        properties["fps"] = properties["nframes"] / properties["duration"]
+    return properties
+
+
+# +-----+
+# | avi |
+# +-----+
+
+
+def _iter_avi_chunks(data, start=0, end=None):
+    """
+    Yield (chunk id, list type, content start, content end) of the avi chunks found in data[start:end].
+    List type is None if the chunk is not a 'LIST'
+    """
+    end = len(data) if end is None else end
+    position = start
+    while position + 8 <= end:
+        chunk_id, size = struct.unpack("<4sI", data[position:position + 8])
+        if chunk_id == b"LIST":
+            yield chunk_id, bytes(data[position + 8:position + 12]), position + 12, min(position + 8 + size, end)
+        else:
+            yield chunk_id, None, position + 8, min(position + 8 + size, end)
+        position += 8 + size + (size % 2)  # chunks are padded to an even size
+
+
+def _probe_avi(openfile):
+    properties = _empty_properties("avi")
+    openfile.seek(0)
+    header = openfile.read(24)
+    chunk_id, size, list_type = struct.unpack("<4sI4s", header[12:24])
+    if chunk_id != b"LIST" or list_type != b"hdrl":
+        raise ValueError("No 'hdrl' list found at the beginning of avi file")
+    hdrl = memoryview(openfile.read(size - 4))
+    if len(hdrl) < size - 4:
+        raise ValueError("Truncated 'hdrl' list in avi file")
+    total_frames = None
+    chunks = list(_iter_avi_chunks(hdrl))
+    while len(chunks) > 0:
+        chunk_id, list_type, start, end = chunks.pop(0)
+        if list_type in {b"strl", b"odml"}:
+            chunks.extend(_iter_avi_chunks(hdrl, start, end))
+        elif chunk_id == b"avih":
+            total_frames, = struct.unpack("<I", hdrl[start + 16:start + 20])
+            properties["width"], properties["height"] = struct.unpack("<II", hdrl[start + 32:start + 40])
+        elif chunk_id == b"dmlh":  # OpenDML (> 1GB) files store their total number of frames here
+            total_frames, = struct.unpack("<I", hdrl[start:start + 4])
+        elif chunk_id == b"strh" and bytes(hdrl[start:start + 4]) == b"vids" and properties["codec"] is None:
+            properties["codec"] = bytes(hdrl[start + 4:start + 8]).decode("latin-1").strip("\x00 ") or None
+            scale, rate = struct.unpack("<II", hdrl[start + 20:start + 28])
+            if scale:
+                properties["fps"] = rate / scale
+    properties["nframes"] = total_frames
+    if properties["nframes"] is not None and properties["fps"]:
+        properties["duration"] = properties["nframes"] / properties["fps"]
+    return properties
+
+
+# +-----+
+# | gif |
+# +-----+
+
+
+def _skip_gif_sub_blocks(data, position):
+    while data[position] != 0:
+        position += data[position] + 1
+    return position + 1
+
+
+def _probe_gif(openfile):
+    # gif files have no header containing the number of frames, so blocks are skipped one by one
+    properties = _empty_properties("gif")
+    properties["codec"] = "gif"
+    openfile.seek(0)
+    data = memoryview(openfile.read())
+    properties["width"], properties["height"], flags = struct.unpack("<HHB", data[6:11])
+    position = 13
+    if flags & 0x80:  # global color table
+        position += 3 * 2 ** ((flags & 0x07) + 1)
+    nframes = 0
+    duration = 0
+    while position < len(data) and data[position] != 0x3B:  # 0x3B is the trailer
+        if data[position] == 0x21:  # extension
+            if data[position + 1] == 0xF9:  # graphic control extension, contains frame duration
+                duration += struct.unpack("<H", data[position + 4:position + 6])[0] / 100
+            position = _skip_gif_sub_blocks(data, position + 2)
+        elif data[position] == 0x2C:  # image
+            nframes += 1
+            flags = data[position + 9]
+            position += 10
+            if flags & 0x80:  # local color table
+                position += 3 * 2 ** ((flags & 0x07) + 1)
+            position = _skip_gif_sub_blocks(data, position + 1)
+        else:
+            raise ValueError("Invalid gif block")
+    if position > len(data):  # the last block is cut
+        raise ValueError("Truncated gif file")
+    properties["nframes"] = nframes
+    properties["duration"] = duration
+    if duration > 0:
+        properties["fps"] = nframes / duration
+    return properties
+
+
+def _probe_video_file(openfile):
+    """
+    Get video properties from the headers of an open video file
+
+    Args:
+        openfile (file-like): file to read, must be seekable
+
+    Returns:
+        dict: video properties, values that could not be found are None.
+            ValueError is raised if the format is unknown or if the headers are invalid or truncated
+    """
+    openfile.seek(0)
+    format = _sniff_format(openfile.read(12))
+    probe = {"mp4": _probe_mp4, "avi": _probe_avi, "gif": _probe_gif}.get(format)
+    if probe is None:
+        raise ValueError("Unknown video format, only mp4, avi and gif headers can be read")
+    try:
+        return probe(openfile)
+    except (IndexError, struct.error) as e:  # headers shorter than expected
+        raise ValueError("Invalid or truncated {} headers".format(format)) from e
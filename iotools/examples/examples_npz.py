@@ -0,0 +1,11 @@
+# Loading:
+from iotools.npzio import load_npz
+with load_npz("filename.npz") as data:  # arrays are read when they are accessed
+    x = data["x"]
+
+
+# Saving:
+from iotools.npzio import save_npz
+import numpy as np
+data = {"x": np.asarray([1, 2, 3]), "y": np.asarray([4, 5])}
+save_npz("filename.npz", data, compress=True)
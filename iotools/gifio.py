@@ -7,8 +7,9 @@ from iotools._help_utils import _help_default, _help_multi_packages
 from iotools.videoio import (
     decode_video_using_imageio, encode_video_using_imageio,
     read_video_using_imageio, write_video_using_imageio,
-    load_video_using_imageio, save_video_using_imageio,
-    decode_video, encode_video, read_video, write_video, load_video, save_video
+    load_video_using_imageio, save_video_using_imageio, iter_video_using_imageio, open_video_writer_using_imageio,
+    decode_video, encode_video, read_video, write_video, load_video, save_video, iter_video, probe_video,
+    open_video_writer
 )
 
 
@@ -50,12 +51,23 @@ def save_gif_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
     return save_video_using_imageio(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def iter_gif_using_imageio(filename, fs=None, **kwargs):
+    return iter_video_using_imageio(filename, fs=fs, **kwargs)
+
+
+def open_gif_writer_using_imageio(filename, fs=None, makedirs=False, **kwargs):
+    kwargs["format"] = "gif"
+    return open_video_writer_using_imageio(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
 decode_gif_using_imageio.__doc__ = decode_video_using_imageio.__doc__.replace(" video ", " gif video ")
 encode_gif_using_imageio.__doc__ = encode_video_using_imageio.__doc__.replace(" video ", " gif video ")
 read_gif_using_imageio.__doc__ = read_video_using_imageio.__doc__.replace(" video ", " gif video ")
 write_gif_using_imageio.__doc__ = write_video_using_imageio.__doc__.replace(" video ", " gif video ")
 load_gif_using_imageio.__doc__ = load_video_using_imageio.__doc__.replace(" video ", " gif video ")
 save_gif_using_imageio.__doc__ = save_video_using_imageio.__doc__.replace(" video ", " gif video ")
+iter_gif_using_imageio.__doc__ = iter_video_using_imageio.__doc__.replace(" video ", " gif video ")
+open_gif_writer_using_imageio.__doc__ = open_video_writer_using_imageio.__doc__.replace(" video ", " gif video ")
 
 
 def help_gif_using_imageio():
@@ -103,12 +115,28 @@ def save_gif(filename, data, fs=None, makedirs=False, **kwargs):
     return save_video(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def iter_gif(filename, fs=None, **kwargs):
+    return iter_video(filename, fs=fs, **kwargs)
+
+
+def open_gif_writer(filename, fs=None, makedirs=False, **kwargs):
+    kwargs["format"] = "gif"
+    return open_video_writer(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
+def probe_gif(filename, fs=None):
+    return probe_video(filename, fs=fs)
+
+
 decode_gif.__doc__ = decode_video.__doc__.replace(" video ", " gif video ")
 encode_gif.__doc__ = encode_video.__doc__.replace(" video ", " gif video ")
 read_gif.__doc__ = read_video.__doc__.replace(" video ", " gif video ")
 write_gif.__doc__ = write_video.__doc__.replace(" video ", " gif video ")
 load_gif.__doc__ = load_video.__doc__.replace(" video ", " gif video ")
 save_gif.__doc__ = save_video.__doc__.replace(" video ", " gif video ")
+iter_gif.__doc__ = iter_video.__doc__.replace(" video ", " gif video ")
+open_gif_writer.__doc__ = open_video_writer.__doc__.replace(" video ", " gif video ")
+probe_gif.__doc__ = probe_video.__doc__.replace(" video ", " gif video ")
 
 
 def help_gif():
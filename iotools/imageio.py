@@ -3,12 +3,24 @@ This module provides io for images (.jpg, .png extensions)
 See iotools.imageio.help_image() for more info
 """
 
+import io
+import json
 import os
+import shutil
+import sys
+import threading
+import timeit
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from iotools.settings import settings
+from iotools._default_backend import _DefaultBackend
 from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes
 from iotools._generic_open import _generic_open, _generic_makedirs
 from iotools._help_utils import _help_default, _help_multi_packages
+from iotools._image_headers import _probe_image_file, _sniff_image_format
+from iotools._lazy_module import _is_installed, _LazyModule
 from iotools._missing_module_helper import _error_msg_sev, _EmptyModule, _warning_msg_default_one
 from iotools._temp_filename_utils import _get_temp_filename
 from iotools.localfs import is_localfs
@@ -17,8 +29,15 @@ from iotools.localfs import is_localfs
 DEFAULT_FORMAT = "png"
 AVAILABLE_FORMATS = {"jpeg", "jpg", "png"}
 DEFAULT_PROPERTIES = {
-    "jpg": {"quality": 90},
+    "jpg": {"quality": 90, "check_alpha": True},
 }
+PROBE_BLOCK_SIZE = 2 ** 12  # size of the ranged reads done to read image headers on remote file systems
+REDUCTION_FACTORS = (8, 4, 2, 1)  # scales supported by jpg DCT scaling are 1/8, 1/4, 1/2 and 1
+IMAGE_BACKENDS = ("imageio", "skimage", "pil", "cv2")  # in the order used by default functions
+AUTOTUNE_FORMATS = ("jpg", "png")
+AUTOTUNE_SHAPE = (256, 256, 3)  # shape of the synthetic images used to time backends
+AUTOTUNE_REPEATS = 5
+AUTOTUNE_CACHE_FILENAME = "image_backends.json"
 
 
 class _Image(dict):
@@ -36,31 +55,30 @@ except ModuleNotFoundError:
 
 _import_ok = set()
 
-try:
-    import imageio
+if _is_installed("imageio"):
+    imageio = _LazyModule("imageio")
     _import_ok.add("imageio")
-except ModuleNotFoundError:
+else:
     imageio = _EmptyModule("imageio")
 
-try:
-    import skimage.io as skimageio
+if _is_installed("skimage"):
+    skimageio = _LazyModule("skimage.io")
     _import_ok.add("skimage")
-except ModuleNotFoundError:
+else:
     skimageio = _EmptyModule("scikit-image")
 
-try:
-    import PIL.Image as PilImage
+if _is_installed("PIL"):
+    PilImage = _LazyModule("PIL.Image")
     _import_ok.add("PilImage")
-except ModuleNotFoundError:
+else:
     PilImage = _EmptyModule("Pillow")
 
-try:
-    import cv2
+if _is_installed("cv2"):
+    cv2 = _LazyModule("cv2")
     _import_ok.add("cv2")
-except ModuleNotFoundError:
+else:
     cv2 = _EmptyModule("opencv-python")
 
-
 if len(_import_ok) == 0:
     if settings["SHOW_IMPORT_WARNINGS"]:
         print("Warning:", _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
@@ -125,14 +143,90 @@ def _insert_properties_in_data(filename, data, kwargs):
     return res, kwargs
 
 
-def _del_alpha_channel(img):
+def _map_in_threads(function, items, workers=None, **kwargs):
+    """
+    Apply function to each item using a thread pool (image codecs release the GIL)
+
+    Args:
+        function (callable): function to apply
+        items (iterable): items to apply the function to
+        workers (int): number of threads. Defaults to None (chosen by 'concurrent.futures.ThreadPoolExecutor')
+        **kwargs: passed on to function
+
+    Returns:
+        list: results, in the same order as items
+    """
+    if workers == 1:
+        return [function(item, **kwargs) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(function, **kwargs), items))
+
+
+def _get_reduction_factor(size, scale=None, max_size=None):
+    """
+    Get the reduction factor (8, 4, 2 or 1) to use when decoding a reduced image
+
+    Args:
+        size (tuple): (width, height) of the full image
+        scale (float): 1, 1/2, 1/4 or 1/8. Defaults to None (no constraint)
+        max_size (int): smallest allowed size for the largest side of the reduced image. Defaults to None
+
+    Returns:
+        int: largest reduction factor allowed by both scale and max_size
+    """
+    factor = max(REDUCTION_FACTORS)
+    if scale is not None:
+        if scale not in {1 / f for f in REDUCTION_FACTORS}:
+            raise ValueError("scale must be 1, 1/2, 1/4 or 1/8, got {}".format(scale))
+        factor = round(1 / scale)
+    if max_size is not None:
+        for f in REDUCTION_FACTORS:
+            if f <= factor and -(-max(size) // f) >= max_size:  # libjpeg rounds reduced sizes up
+                factor = f
+                break
+        else:
+            factor = 1
+    return factor
+
+
+def _get_reduced_flags_using_cv2(openfile, scale=None, max_size=None):
+    """
+    Get the 'cv2.IMREAD_REDUCED_*' flag to use, from the image header
+    """
+    properties = _probe_image_file(openfile)
+    factor = _get_reduction_factor((properties["width"], properties["height"]), scale=scale, max_size=max_size)
+    if factor == 1:
+        return cv2.IMREAD_UNCHANGED
+    if properties["channels"] == 1:
+        return getattr(cv2, "IMREAD_REDUCED_GRAYSCALE_{}".format(factor))
+    return getattr(cv2, "IMREAD_REDUCED_COLOR_{}".format(factor))
+
+
+def _pop_flags_using_cv2(kwargs, default, openfile, scale=None, max_size=None):
+    """
+    Get the flags of 'cv2.imread' or 'cv2.imdecode': the flags given in kwargs, else default,
+    or the 'cv2.IMREAD_REDUCED_*' flag when the image is decoded at a reduced scale
     """
-    Deletes the alpha channel
+    if (scale is None) and (max_size is None):
+        return kwargs.pop("flags", default)
+    if "flags" in kwargs:
+        raise ValueError("'flags' cannot be used with 'scale' or 'max_size', which set the flags of cv2")
+    with openfile() as f:
+        return _get_reduced_flags_using_cv2(f, scale=scale, max_size=max_size)
+
+
+def _del_alpha_channel(img, check_alpha=True):
+    """
+    Deletes the alpha channel (without copy, a view of the color channels is returned).
+    If check_alpha is True, a warning is printed if the image is not fully opaque
     """
     if isinstance(img, np.ndarray) and (img.ndim == 3) and (img.shape[2] == 4):
-        alpha = set(np.unique(img[:, :, 3]).tolist())
-        if alpha != {255}:
-            print("Warning: 'jpg' format does not support alpha channel. Ignoring alpha channel.")
+        if check_alpha:
+            alpha = img[:, :, 3]
+            # a min reduction does not sort nor allocate, unlike np.unique. For uint8 images, a minimum of 255
+            # means that the image is fully opaque, the maximum is only checked for other types
+            if (alpha.min() != 255) or ((alpha.dtype != np.uint8) and (alpha.max() != 255)):
+                print("Warning: 'jpg' format does not support alpha channel. Ignoring alpha channel.")
         return img[:, :, :3]
     return img
 
@@ -202,7 +296,7 @@ def write_image_using_imageio(openfile, data, **kwargs):
     if not isinstance(data, _Image):
         data, kwargs = _insert_properties_in_data(openfile, data, kwargs)
     if data["format"] == "jpg":
-        image = _del_alpha_channel(data["image"])
+        image = _del_alpha_channel(data["image"], check_alpha=data["check_alpha"])
         imageio.imsave(openfile, image, format=data["format"], quality=data["quality"], **kwargs)
     else:
         imageio.imsave(openfile, data["image"], format=data["format"], **kwargs)
@@ -244,6 +338,39 @@ def save_image_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
         write_image_using_imageio(f, data, **kwargs)
 
 
+def decode_images_using_imageio(data, workers=None, **kwargs):
+    """
+    Decode a list of image bytes, using a thread pool
+    Backend used: imageio.v3.imread (imageio package)
+
+    Args:
+        data (list): list of image bytes to decode
+        workers (int): number of threads decoding image bytes. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'imageio.v3.imread'
+
+    Returns:
+        list: decoded image arrays, in the same order as data
+    """
+    return _map_in_threads(decode_image_using_imageio, data, workers=workers, **kwargs)
+
+
+def load_images_using_imageio(filenames, fs=None, workers=None, **kwargs):
+    """
+    Load several image files, using a thread pool
+    Backend used: imageio.v3.imread (imageio package)
+
+    Args:
+        filenames (list): file names to load
+        fs: file system to use. Defaults to None (local filesystem)
+        workers (int): number of threads loading image files. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'imageio.v3.imread'
+
+    Returns:
+        list: loaded image arrays, in the same order as filenames
+    """
+    return _map_in_threads(load_image_using_imageio, filenames, workers=workers, fs=fs, **kwargs)
+
+
 def help_image_using_imageio():
     """
     Print help for image io using imageio library
@@ -316,7 +443,7 @@ def write_image_using_skimage(openfile, data, **kwargs):
     if not isinstance(data, _Image):
         data, kwargs = _insert_properties_in_data(openfile, data, kwargs)
     if data["format"] == "jpg":
-        image = _del_alpha_channel(data["image"])
+        image = _del_alpha_channel(data["image"], check_alpha=data["check_alpha"])
         skimageio.imsave(openfile, image, extension="." + data["format"], quality=data["quality"], **kwargs)
     else:
         skimageio.imsave(openfile, data["image"], extension="." + data["format"], **kwargs)
@@ -358,6 +485,39 @@ def save_image_using_skimage(filename, data, fs=None, makedirs=False, **kwargs):
         write_image_using_skimage(f, data, **kwargs)
 
 
+def decode_images_using_skimage(data, workers=None, **kwargs):
+    """
+    Decode a list of image bytes, using a thread pool
+    Backend used: skimage.io.imread (scikit-image package)
+
+    Args:
+        data (list): list of image bytes to decode
+        workers (int): number of threads decoding image bytes. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'skimage.io.imread'
+
+    Returns:
+        list: decoded image arrays, in the same order as data
+    """
+    return _map_in_threads(decode_image_using_skimage, data, workers=workers, **kwargs)
+
+
+def load_images_using_skimage(filenames, fs=None, workers=None, **kwargs):
+    """
+    Load several image files, using a thread pool
+    Backend used: skimage.io.imread (scikit-image package)
+
+    Args:
+        filenames (list): file names to load
+        fs: file system to use. Defaults to None (local filesystem)
+        workers (int): number of threads loading image files. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'skimage.io.imread'
+
+    Returns:
+        list: loaded image arrays, in the same order as filenames
+    """
+    return _map_in_threads(load_image_using_skimage, filenames, workers=workers, fs=fs, **kwargs)
+
+
 def help_image_using_skimage():
     """
     Print help for image io using skimage library
@@ -370,19 +530,23 @@ def help_image_using_skimage():
 # +-----------+
 
 
-def decode_image_using_pil(data, **kwargs):
+def decode_image_using_pil(data, scale=None, max_size=None, **kwargs):
     """
     Decode image data from bytes
     Backend used: PIL.Image.open (Pillow package)
 
     Args:
         data (bytes): image data to decode
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'PIL.Image.open'
 
     Returns:
         array: image data decoded
     """
-    return _default_decode_bytes(read_image_using_pil, data, **kwargs)
+    return _default_decode_bytes(read_image_using_pil, data, scale=scale, max_size=max_size, **kwargs)
 
 
 def encode_image_using_pil(data, **kwargs):
@@ -400,13 +564,17 @@ def encode_image_using_pil(data, **kwargs):
     return _default_encode_bytes(write_image_using_pil, data, **kwargs)
 
 
-def read_image_using_pil(openfile, **kwargs):
+def read_image_using_pil(openfile, scale=None, max_size=None, **kwargs):
     """
     Read a open image file
     Backend used: PIL.Image.open (Pillow package)
 
     Args:
         openfile (file-like): file to read, must have been opened
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'PIL.Image.open'
 
     Returns:
@@ -414,6 +582,10 @@ def read_image_using_pil(openfile, **kwargs):
     """
     kwargs.pop("format", None)
     image = PilImage.open(openfile, **kwargs)
+    if (scale is not None) or (max_size is not None):
+        factor = _get_reduction_factor(image.size, scale=scale, max_size=max_size)
+        if factor > 1:  # 'draft' configures libjpeg DCT scaling, it does nothing for other formats
+            image.draft(None, (max(1, image.width // factor), max(1, image.height // factor)))
     image.load()
     return image
 
@@ -439,7 +611,7 @@ def write_image_using_pil(openfile, data, **kwargs):
         data["image"].save(openfile, format=data["format"], **kwargs)
 
 
-def load_image_using_pil(filename, fs=None, **kwargs):
+def load_image_using_pil(filename, fs=None, scale=None, max_size=None, **kwargs):
     """
     Load a image file
     Backend used: PIL.Image.open (Pillow package)
@@ -447,13 +619,17 @@ def load_image_using_pil(filename, fs=None, **kwargs):
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'PIL.Image.open'
 
     Returns:
         array: loaded data
     """
     with _generic_open(filename, 'rb', fs=fs) as f:
-        data = read_image_using_pil(f, **kwargs)
+        data = read_image_using_pil(f, scale=scale, max_size=max_size, **kwargs)
     return data
 
 
@@ -475,6 +651,39 @@ def save_image_using_pil(filename, data, fs=None, makedirs=False, **kwargs):
         write_image_using_pil(f, data, **kwargs)
 
 
+def decode_images_using_pil(data, workers=None, **kwargs):
+    """
+    Decode a list of image bytes, using a thread pool
+    Backend used: PIL.Image.open (Pillow package)
+
+    Args:
+        data (list): list of image bytes to decode
+        workers (int): number of threads decoding image bytes. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'PIL.Image.open'
+
+    Returns:
+        list: decoded image arrays, in the same order as data
+    """
+    return _map_in_threads(decode_image_using_pil, data, workers=workers, **kwargs)
+
+
+def load_images_using_pil(filenames, fs=None, workers=None, **kwargs):
+    """
+    Load several image files, using a thread pool
+    Backend used: PIL.Image.open (Pillow package)
+
+    Args:
+        filenames (list): file names to load
+        fs: file system to use. Defaults to None (local filesystem)
+        workers (int): number of threads loading image files. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'PIL.Image.open'
+
+    Returns:
+        list: loaded image arrays, in the same order as filenames
+    """
+    return _map_in_threads(load_image_using_pil, filenames, workers=workers, fs=fs, **kwargs)
+
+
 def help_image_using_pil():
     """
     Print help for image io using PIL library
@@ -487,19 +696,25 @@ def help_image_using_pil():
 # +-----------+
 
 
-def decode_image_using_cv2(data, **kwargs):
+def decode_image_using_cv2(data, scale=None, max_size=None, **kwargs):
     """
     Decode image data from bytes
     Backend used: cv2.imdecode (opencv-python package)
 
     Args:
         data (bytes): image data to decode
+        scale (float): decode the image at a reduced scale (1, 1/2, 1/4 or 1/8), without alpha channel.
+            jpg images are decoded directly at that scale, which is much faster than resizing them after
+            decoding. Defaults to None (full scale)
+        max_size (int): decode the image at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'cv2.imdecode'
 
     Returns:
         array: image data decoded
     """
-    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED, **kwargs)
+    flags = _pop_flags_using_cv2(kwargs, cv2.IMREAD_UNCHANGED, lambda: io.BytesIO(data), scale, max_size)
+    return cv2.imdecode(np.frombuffer(data, np.uint8), flags, **kwargs)
 
 
 def encode_image_using_cv2(data, **kwargs):
@@ -517,27 +732,32 @@ def encode_image_using_cv2(data, **kwargs):
     if not isinstance(data, _Image):
         data, kwargs = _insert_properties_in_data(None, data, kwargs)
     if data["format"] == "jpg":
-        data["image"] = _del_alpha_channel(data["image"])
+        data["image"] = _del_alpha_channel(data["image"], check_alpha=data["check_alpha"])
         res = cv2.imencode("." + data["format"], data["image"], [cv2.IMWRITE_JPEG_QUALITY, data["quality"]], **kwargs)
     else:
         res = cv2.imencode("." + data["format"], data["image"], **kwargs)
     return res[1].tobytes()
 
 
-def read_image_using_cv2(openfile, **kwargs):
+def read_image_using_cv2(openfile, scale=None, max_size=None, **kwargs):
     """
     Read a open image file
     Backend used: cv2.imdecode (opencv-python package)
 
     Args:
         openfile (file-like): file to read, must have been opened
+        scale (float): decode the image at a reduced scale (1, 1/2, 1/4 or 1/8), without alpha channel.
+            jpg images are decoded directly at that scale, which is much faster than resizing them after
+            decoding. Defaults to None (full scale)
+        max_size (int): decode the image at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'cv2.imdecode'
 
     Returns:
         array: image data read from the file provided
     """
     data_encoded = openfile.read()
-    return decode_image_using_cv2(data_encoded, **kwargs)
+    return decode_image_using_cv2(data_encoded, scale=scale, max_size=max_size, **kwargs)
 
 
 def write_image_using_cv2(openfile, data, **kwargs):
@@ -554,7 +774,7 @@ def write_image_using_cv2(openfile, data, **kwargs):
     openfile.write(data_encoded)
 
 
-def load_image_using_cv2(filename, fs=None, **kwargs):
+def load_image_using_cv2(filename, fs=None, scale=None, max_size=None, **kwargs):
     """
     Load a image file
     Backend used: cv2.imread (opencv-python package)
@@ -562,6 +782,11 @@ def load_image_using_cv2(filename, fs=None, **kwargs):
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        scale (float): decode the image at a reduced scale (1, 1/2, 1/4 or 1/8), without alpha channel.
+            jpg images are decoded directly at that scale, which is much faster than resizing them after
+            decoding. Defaults to None (full scale)
+        max_size (int): decode the image at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'cv2.imread'
 
     Returns:
@@ -569,10 +794,11 @@ def load_image_using_cv2(filename, fs=None, **kwargs):
     """
     if is_localfs(fs):
         kwargs.pop("format", None)
-        data = cv2.imread(filename, **kwargs)
+        flags = _pop_flags_using_cv2(kwargs, cv2.IMREAD_COLOR, lambda: open(filename, "rb"), scale, max_size)
+        data = cv2.imread(filename, flags, **kwargs)
     else:
         with _generic_open(filename, 'rb', fs=fs) as f:
-            data = read_image_using_cv2(f, **kwargs)
+            data = read_image_using_cv2(f, scale=scale, max_size=max_size, **kwargs)
     return data
 
 
@@ -596,19 +822,52 @@ def save_image_using_cv2(filename, data, fs=None, makedirs=False, **kwargs):
         if filename.endswith("." + data["format"]):
             temp_filename = filename
         else:
-            temp_filename = _get_temp_filename(data["format"])
+            temp_filename = _get_temp_filename(data["format"], size=data["image"].nbytes)
         if data["format"] == "jpg":
-            data["image"] = _del_alpha_channel(data["image"])
+            data["image"] = _del_alpha_channel(data["image"], check_alpha=data["check_alpha"])
             cv2.imwrite(temp_filename, data["image"], [cv2.IMWRITE_JPEG_QUALITY, data["quality"]], **kwargs)
         else:
             cv2.imwrite(temp_filename, data["image"], **kwargs)
         if temp_filename != filename:
-            os.rename(temp_filename, filename)
+            shutil.move(temp_filename, filename)
     else:
         with _generic_open(filename, 'wb', fs=fs, makedirs=makedirs) as f:
             write_image_using_cv2(f, data, **kwargs)
 
 
+def decode_images_using_cv2(data, workers=None, **kwargs):
+    """
+    Decode a list of image bytes, using a thread pool
+    Backend used: cv2.imdecode (opencv-python package)
+
+    Args:
+        data (list): list of image bytes to decode
+        workers (int): number of threads decoding image bytes. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'cv2.imdecode'
+
+    Returns:
+        list: decoded image arrays, in the same order as data
+    """
+    return _map_in_threads(decode_image_using_cv2, data, workers=workers, **kwargs)
+
+
+def load_images_using_cv2(filenames, fs=None, workers=None, **kwargs):
+    """
+    Load several image files, using a thread pool
+    Backend used: cv2.imread (opencv-python package)
+
+    Args:
+        filenames (list): file names to load
+        fs: file system to use. Defaults to None (local filesystem)
+        workers (int): number of threads loading image files. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'cv2.imread'
+
+    Returns:
+        list: loaded image arrays, in the same order as filenames
+    """
+    return _map_in_threads(load_image_using_cv2, filenames, workers=workers, fs=fs, **kwargs)
+
+
 def help_image_using_cv2():
     """
     Print help for image io using cv2 library
@@ -616,12 +875,300 @@ def help_image_using_cv2():
     _help_default("image_using_cv2")
 
 
+# +----------+
+# | Autotune |
+# +----------+
+
+
+_autotuned_backends = {}
+_autotune_lock = threading.Lock()
+
+
+def _get_installed_backends():
+    modules = {"imageio": imageio, "skimage": skimageio, "pil": PilImage, "cv2": cv2}
+    return [backend for backend in IMAGE_BACKENDS if not isinstance(modules[backend], _EmptyModule)]
+
+
+def _get_autotune_cache_filename():
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "iotools", AUTOTUNE_CACHE_FILENAME)
+
+
+def _get_image_format(data, kwargs, filename=None):
+    """
+    Format an image will be encoded to, as found by '_insert_properties_in_data'
+    """
+    if isinstance(data, dict) and ("format" in data):
+        format = data["format"]
+    elif "format" in kwargs:
+        format = kwargs["format"]
+    else:
+        format = _guess_format_from_filename(filename)
+    format = format.strip('.').lower()
+    return "jpg" if format == "jpeg" else format
+
+
+def _peek_image_format(openfile):
+    if not openfile.seekable():
+        return None
+    position = openfile.tell()
+    header = openfile.read(8)
+    openfile.seek(position)
+    return _sniff_image_format(header)
+
+
+def _sniff_buffer_format(data):
+    """
+    Image format of data supporting the buffer protocol (bytes, memoryview, numpy.ndarray...)
+    """
+    return _sniff_image_format(bytes(memoryview(data).cast("B")[:8]))
+
+
+def _as_rgb_array(image, backend):
+    """
+    Convert an image decoded by a backend to what imageio returns (RGB or RGBA array)
+    """
+    if backend == "pil":
+        return np.asarray(image)
+    if (backend == "cv2") and isinstance(image, np.ndarray) and (image.ndim == 3):
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB if image.shape[2] == 3 else cv2.COLOR_BGRA2RGBA)
+    return image
+
+
+def _from_rgb_array(data, backend, format):
+    """
+    Convert image data given as to imageio (RGB or RGBA array) to what a backend expects
+    """
+    image = data["image"] if isinstance(data, dict) else data
+    if not isinstance(image, np.ndarray) or (backend not in {"pil", "cv2"}):
+        return data
+    if backend == "pil":
+        if format == "jpg":
+            image = _del_alpha_channel(image)  # Pillow cannot save RGBA jpg images
+        image = PilImage.fromarray(image)
+    elif image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR if image.shape[2] == 3 else cv2.COLOR_RGBA2BGRA)
+    if isinstance(data, dict):
+        return dict(data, image=image)
+    return image
+
+
+def _decoding_using(function, backend, many=False):
+    """
+    Wrap a decoding function of a backend, so that it returns the same images as imageio
+    """
+    def decode(image_format, /, *args, **kwargs):
+        if backend == "cv2":  # 'cv2.imread' converts images to BGR by default, unlike imageio
+            kwargs.setdefault("flags", cv2.IMREAD_UNCHANGED)
+        images = function(*args, **kwargs)
+        if many:
+            return [_as_rgb_array(image, backend) for image in images]
+        return _as_rgb_array(images, backend)
+    return decode
+
+
+def _encoding_using(function, backend, data_index=0):
+    """
+    Wrap an encoding function of a backend, so that it takes the same images as imageio
+    """
+    def encode(image_format, /, *args, **kwargs):
+        args = list(args)
+        args[data_index] = _from_rgb_array(args[data_index], backend, image_format)
+        return function(*args, **kwargs)
+    return encode
+
+
+def _time_backend(function, *args, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return min(timeit.repeat(lambda: function(*args, **kwargs), number=1, repeat=AUTOTUNE_REPEATS))
+
+
+def _run_autotune():
+    installed = _get_installed_backends()
+    functions = globals()
+    height, width, channels = AUTOTUNE_SHAPE
+    # smooth gradients with noise, closer to real images than pure noise
+    x, y = np.meshgrid(np.linspace(0, 255, width), np.linspace(0, 255, height))
+    noise = np.random.default_rng(0).integers(0, 32, AUTOTUNE_SHAPE)
+    image = (np.stack([x, y, (x + y) / 2][:channels], axis=2) * 7 / 8 + noise).astype(np.uint8)
+    results = {"decode": {}, "encode": {}}
+    for format in AUTOTUNE_FORMATS:
+        timings = {"decode": {}, "encode": {}}
+        data = None
+        for backend in installed:
+            encode = _encoding_using(functions["encode_image_using_" + backend], backend)
+            decode = _decoding_using(functions["decode_image_using_" + backend], backend)
+            try:
+                timings["encode"][backend] = _time_backend(encode, format, image, format=format)
+                data = encode(format, image, format=format) if data is None else data
+                timings["decode"][backend] = _time_backend(decode, format, data)
+            except Exception:  # a backend that fails is never selected
+                continue
+        for operation in results:
+            if len(timings[operation]) > 0:
+                results[operation][format] = min(timings[operation], key=timings[operation].get)
+    return results
+
+
+def _get_autotuned_backends():
+    """
+    Results of autotune, computed (or loaded from the cache file) at the first call
+    """
+    if len(_autotuned_backends) == 0:
+        with _autotune_lock:
+            if len(_autotuned_backends) == 0:
+                autotune()
+    return _autotuned_backends
+
+
+def autotune(force=False):
+    """
+    Find the fastest installed backend to decode and to encode each image format, by timing them on
+    synthetic images. Results are cached in the user cache directory, they are used by the default
+    functions (decode_image, load_image, save_image, ...) when settings["IMAGE_BACKEND"] is 'auto'.
+    Backends are timed again when installed backends change, or when force is True
+
+    Args:
+        force (bool): if True, time backends even if results are cached. Defaults to False
+
+    Returns:
+        dict: fastest backend ('imageio', 'skimage', 'pil' or 'cv2') for each operation and format,
+            example: {'decode': {'jpg': 'cv2', 'png': 'cv2'}, 'encode': {'jpg': 'cv2', 'png': 'pil'}}
+    """
+    installed = _get_installed_backends()
+    cache_key = {"backends": installed, "python": "{}.{}".format(*sys.version_info[:2])}
+    cache_filename = _get_autotune_cache_filename()
+    results = None
+    if not force and os.path.isfile(cache_filename):
+        try:
+            with open(cache_filename, "r") as f:
+                cache = json.load(f)
+            if cache.get("key") == cache_key:
+                results = cache["results"]
+        except (OSError, ValueError):
+            pass
+    if results is None:
+        results = _run_autotune()
+        try:
+            os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
+            with open(cache_filename, "w") as f:
+                json.dump({"key": cache_key, "results": results}, f)
+        except OSError:
+            pass  # results are kept in memory only
+    _autotuned_backends.clear()
+    _autotuned_backends.update(results)
+    return results
+
+
+class _AutoBackend:
+    """
+    Callable forwarding its arguments to the fastest backend for the image format (see autotune)
+
+    Args:
+        operation (str): 'decode' or 'encode'
+        functions (dict): function wrapped by '_decoding_using' or '_encoding_using', for each backend
+        get_format (callable): function returning the image format from the arguments, or None if unknown
+    """
+
+    def __init__(self, operation, functions, get_format):
+        self._operation = operation
+        self._functions = functions
+        self._get_format = get_format
+
+    def __call__(self, *args, **kwargs):
+        format = self._get_format(*args, **kwargs)
+        format = "jpg" if format == "jpeg" else format
+        backend = _get_autotuned_backends()[self._operation].get(format)
+        if backend not in self._functions:
+            backend = next(b for b in IMAGE_BACKENDS if b in self._functions)
+        return self._functions[backend](format, *args, **kwargs)
+
+
 # +------------------+
 # | Default behavior |
 # +------------------+
 
 
-def decode_image(data, **kwargs):
+def _image_default(
+    function_name, using_imageio, using_skimage, using_pil, using_cv2, get_format, data_index=None, many=False
+):
+    """
+    Default backend of an image function: imageio, or else skimage, Pillow and cv2.
+    If settings["IMAGE_BACKEND"] is 'auto', the fastest backend for the image format is used instead (see autotune).
+    get_format returns the image format from the function arguments, data_index is the position of the image
+    argument of encoding functions (None for decoding functions) and many is True for functions of several images
+    """
+    backends = [(imageio, using_imageio, None)]
+    for module, function in [(skimageio, using_skimage), (PilImage, using_pil), (cv2, using_cv2)]:
+        backends.append((module, function, _warning_msg_default_one(function_name, "imageio", function.__name__)))
+    functions = dict(zip(IMAGE_BACKENDS, [using_imageio, using_skimage, using_pil, using_cv2]))
+    if data_index is None:
+        wrapped = {b: _decoding_using(functions[b], b, many=many) for b in _get_installed_backends()}
+        auto = _AutoBackend("decode", wrapped, get_format)
+    else:
+        wrapped = {b: _encoding_using(functions[b], b, data_index=data_index) for b in _get_installed_backends()}
+        auto = _AutoBackend("encode", wrapped, get_format)
+    return _DefaultBackend(
+        backends, _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"),
+        auto=("IMAGE_BACKEND", auto))
+
+
+def _reduced_image_default(function_name, using_pil, using_cv2):
+    """
+    Default backend of an image function when a reduced image is asked: Pillow, or else cv2,
+    since imageio and skimage cannot decode reduced images
+    """
+    def using_pil_as_array(*args, **kwargs):
+        return np.asarray(using_pil(*args, **kwargs))
+
+    backends = [
+        (PilImage, using_pil_as_array, None),
+        (cv2, using_cv2, _warning_msg_default_one(function_name, "Pillow", using_cv2.__name__)),
+    ]
+    return _DefaultBackend(backends, _error_msg_sev("iotools.imageio", "Pillow", "opencv-python"))
+
+
+_decode_image_default = _image_default(
+    "decode_image",
+    decode_image_using_imageio, decode_image_using_skimage, decode_image_using_pil, decode_image_using_cv2,
+    lambda data, **kwargs: _sniff_buffer_format(data))
+_encode_image_default = _image_default(
+    "encode_image",
+    encode_image_using_imageio, encode_image_using_skimage, encode_image_using_pil, encode_image_using_cv2,
+    lambda data, **kwargs: _get_image_format(data, kwargs), data_index=0)
+_read_image_default = _image_default(
+    "read_image",
+    read_image_using_imageio, read_image_using_skimage, read_image_using_pil, read_image_using_cv2,
+    lambda openfile, **kwargs: _peek_image_format(openfile))
+_write_image_default = _image_default(
+    "write_image",
+    write_image_using_imageio, write_image_using_skimage, write_image_using_pil, write_image_using_cv2,
+    lambda openfile, data, **kwargs: _get_image_format(data, kwargs), data_index=1)
+_load_image_default = _image_default(
+    "load_image",
+    load_image_using_imageio, load_image_using_skimage, load_image_using_pil, load_image_using_cv2,
+    lambda filename, **kwargs: _guess_format_from_filename(filename, None))
+_save_image_default = _image_default(
+    "save_image",
+    save_image_using_imageio, save_image_using_skimage, save_image_using_pil, save_image_using_cv2,
+    lambda filename, data, **kwargs: _get_image_format(data, kwargs, filename), data_index=1)
+_decode_images_default = _image_default(
+    "decode_images",
+    decode_images_using_imageio, decode_images_using_skimage, decode_images_using_pil, decode_images_using_cv2,
+    lambda data, **kwargs: _sniff_buffer_format(data[0]) if len(data) > 0 else None,
+    many=True)
+_load_images_default = _image_default(
+    "load_images",
+    load_images_using_imageio, load_images_using_skimage, load_images_using_pil, load_images_using_cv2,
+    lambda filenames, **kwargs: _guess_format_from_filename(filenames[0], None) if len(filenames) > 0 else None,
+    many=True)
+_decode_image_reduced_default = _reduced_image_default("decode_image", decode_image_using_pil, decode_image_using_cv2)
+_read_image_reduced_default = _reduced_image_default("read_image", read_image_using_pil, read_image_using_cv2)
+_load_image_reduced_default = _reduced_image_default("load_image", load_image_using_pil, load_image_using_cv2)
+
+
+def decode_image(data, scale=None, max_size=None, **kwargs):
     """
     Decode image data from bytes
     It tries the following libraries (in the same order):
@@ -629,32 +1176,25 @@ def decode_image(data, **kwargs):
         skimage.io.imread
         PIL.Image.open
         cv2.imread
-    If 'imageio.imread' does not work, a warning is printed since this function may have a
+    If 'imageio.imread' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
+    If 'scale' or 'max_size' is used, 'PIL.Image.open' is tried first (then 'cv2.imread'), since the
+    other libraries cannot decode reduced images
 
     Args:
         data (bytes): image data to decode
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'imageio.imread'
 
     Returns:
         array: image data decoded
     """
-    if not isinstance(imageio, _EmptyModule):
-        return decode_image_using_imageio(data, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("decode_image", "imageio", "decode_image_using_skimage"))
-        return decode_image_using_skimage(data, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("decode_image", "imageio", "decode_image_using_pil"))
-        return decode_image_using_pil(data, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("decode_image", "imageio", "decode_image_using_cv2"))
-        return decode_image_using_cv2(data, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
+    if (scale is not None) or (max_size is not None):
+        return _decode_image_reduced_default(data, scale=scale, max_size=max_size, **kwargs)
+    return _decode_image_default(data, **kwargs)
 
 
 def encode_image(data, **kwargs):
@@ -665,7 +1205,7 @@ def encode_image(data, **kwargs):
         skimage.io.imsave
         PIL.Image.save
         cv2.imwrite
-    If 'imageio.imsave' does not work, a warning is printed since this function may have a
+    If 'imageio.imsave' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -675,25 +1215,10 @@ def encode_image(data, **kwargs):
     Returns:
         bytes: image data encoded
     """
-    if not isinstance(imageio, _EmptyModule):
-        return encode_image_using_imageio(data, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("encode_image", "imageio", "encode_image_using_skimage"))
-        return encode_image_using_skimage(data, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("encode_image", "imageio", "encode_image_using_pil"))
-        return encode_image_using_pil(data, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("encode_image", "imageio", "encode_image_using_cv2"))
-        return encode_image_using_cv2(data, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
-
-
-def read_image(openfile, **kwargs):
+    return _encode_image_default(data, **kwargs)
+
+
+def read_image(openfile, scale=None, max_size=None, **kwargs):
     """
     Read a open image file
     It tries the following libraries (in the same order):
@@ -701,32 +1226,25 @@ def read_image(openfile, **kwargs):
         skimage.io.imread
         PIL.Image.open
         cv2.imread
-    If 'imageio.imread' does not work, a warning is printed since this function may have a
+    If 'imageio.imread' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
+    If 'scale' or 'max_size' is used, 'PIL.Image.open' is tried first (then 'cv2.imread'), since the
+    other libraries cannot decode reduced images
 
     Args:
         openfile (file-like): file to read, must have been opened
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'imageio.imread'
 
     Returns:
         array: image data read from the file provided
     """
-    if not isinstance(imageio, _EmptyModule):
-        return read_image_using_imageio(openfile, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("read_image", "imageio", "read_image_using_skimage"))
-        return read_image_using_skimage(openfile, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("read_image", "imageio", "read_image_using_pil"))
-        return read_image_using_pil(openfile, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("read_image", "imageio", "read_image_using_cv2"))
-        return read_image_using_cv2(openfile, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
+    if (scale is not None) or (max_size is not None):
+        return _read_image_reduced_default(openfile, scale=scale, max_size=max_size, **kwargs)
+    return _read_image_default(openfile, **kwargs)
 
 
 def write_image(openfile, data, **kwargs):
@@ -737,7 +1255,7 @@ def write_image(openfile, data, **kwargs):
         skimage.io.imsave
         PIL.Image.save
         cv2.imwrite
-    If 'imageio.imsave' does not work, a warning is printed since this function may have a
+    If 'imageio.imsave' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -745,25 +1263,10 @@ def write_image(openfile, data, **kwargs):
         data (array): image data to save
         **kwargs: same as in 'imageio.imsave'
     """
-    if not isinstance(imageio, _EmptyModule):
-        return write_image_using_imageio(openfile, data, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("write_image", "imageio", "write_image_using_skimage"))
-        return write_image_using_skimage(openfile, data, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("write_image", "imageio", "write_image_using_pil"))
-        return write_image_using_pil(openfile, data, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("write_image", "imageio", "write_image_using_cv2"))
-        return write_image_using_cv2(openfile, data, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
-
-
-def load_image(filename, fs=None, **kwargs):
+    return _write_image_default(openfile, data, **kwargs)
+
+
+def load_image(filename, fs=None, scale=None, max_size=None, **kwargs):
     """
     Load a image file
     It tries the following libraries (in the same order):
@@ -771,33 +1274,26 @@ def load_image(filename, fs=None, **kwargs):
         skimage.io.imread
         PIL.Image.open
         cv2.imread
-    If 'imageio.imread' does not work, a warning is printed since this function may have a
+    If 'imageio.imread' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
+    If 'scale' or 'max_size' is used, 'PIL.Image.open' is tried first (then 'cv2.imread'), since the
+    other libraries cannot decode reduced images
 
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        scale (float): decode jpg images at a reduced scale (1, 1/2, 1/4 or 1/8), which is much faster
+            than resizing them after decoding. Defaults to None (full scale)
+        max_size (int): decode jpg images at the smallest reduced scale whose largest side is still at
+            least max_size pixels. Defaults to None
         **kwargs: same as in 'imageio.imread'
 
     Returns:
         array: loaded data
     """
-    if not isinstance(imageio, _EmptyModule):
-        return load_image_using_imageio(filename, fs=fs, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("load_image", "imageio", "load_image_using_skimage"))
-        return load_image_using_skimage(filename, fs=fs, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("load_image", "imageio", "load_image_using_pil"))
-        return load_image_using_pil(filename, fs=fs, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("load_image", "imageio", "load_image_using_cv2"))
-        return load_image_using_cv2(filename, fs=fs, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
+    if (scale is not None) or (max_size is not None):
+        return _load_image_reduced_default(filename, fs=fs, scale=scale, max_size=max_size, **kwargs)
+    return _load_image_default(filename, fs=fs, **kwargs)
 
 
 def save_image(filename, data, fs=None, makedirs=False, **kwargs):
@@ -808,7 +1304,7 @@ def save_image(filename, data, fs=None, makedirs=False, **kwargs):
         skimage.io.imsave
         PIL.Image.save
         cv2.imwrite
-    If 'imageio.imsave' does not work, a warning is printed since this function may have a
+    If 'imageio.imsave' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -818,22 +1314,70 @@ def save_image(filename, data, fs=None, makedirs=False, **kwargs):
         makedirs (bool): if True, creates directory of filename (default is False)
         **kwargs: same as in 'imageio.imsave'
     """
-    if not isinstance(imageio, _EmptyModule):
-        return save_image_using_imageio(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    if not isinstance(skimageio, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("save_image", "imageio", "save_image_using_skimage"))
-        return save_image_using_skimage(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    if not isinstance(PilImage, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("save_image", "imageio", "save_image_using_pil"))
-        return save_image_using_pil(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_one("save_image", "imageio", "save_image_using_cv2"))
-        return save_image_using_cv2(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    raise ModuleNotFoundError(
-        _error_msg_sev("iotools.imageio", "imageio", "scikit-image", "Pillow", "opencv-python"))
+    return _save_image_default(filename, data, fs=fs, makedirs=makedirs, **kwargs)
+
+
+def decode_images(data, workers=None, **kwargs):
+    """
+    Decode a list of image bytes, using a thread pool
+    It tries the following libraries (in the same order):
+        imageio.imread
+        skimage.io.imread
+        PIL.Image.open
+        cv2.imread
+    If 'imageio.imread' does not work, a warning is emitted once since this function may have a
+    different behavior in other environments
+
+    Args:
+        data (list): list of image bytes to decode
+        workers (int): number of threads decoding image bytes. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'imageio.imread'
+
+    Returns:
+        list: decoded image arrays, in the same order as data
+    """
+    return _decode_images_default(data, workers=workers, **kwargs)
+
+
+def load_images(filenames, fs=None, workers=None, **kwargs):
+    """
+    Load several image files, using a thread pool
+    It tries the following libraries (in the same order):
+        imageio.imread
+        skimage.io.imread
+        PIL.Image.open
+        cv2.imread
+    If 'imageio.imread' does not work, a warning is emitted once since this function may have a
+    different behavior in other environments
+
+    Args:
+        filenames (list): file names to load
+        fs: file system to use. Defaults to None (local filesystem)
+        workers (int): number of threads loading image files. Defaults to None (chosen by 'ThreadPoolExecutor')
+        **kwargs: same as in 'imageio.imread'
+
+    Returns:
+        list: loaded image arrays, in the same order as filenames
+    """
+    return _load_images_default(filenames, fs=fs, workers=workers, **kwargs)
+
+
+def probe_image(filename, fs=None):
+    """
+    Load the properties of a image file, reading only its headers (the image is not decoded).
+    On remote file systems, only the first bytes of the file are downloaded
+    Backend used: none (jpg and png headers are parsed by iotools)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+
+    Returns:
+        dict: image properties, with the keys 'format', 'width', 'height', 'channels' (palette images
+            have 3 channels) and 'bit_depth'
+    """
+    with _generic_open(filename, 'rb', fs=fs, block_size=PROBE_BLOCK_SIZE) as f:
+        return _probe_image_file(f)
 
 
 def help_image():
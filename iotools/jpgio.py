@@ -7,26 +7,20 @@ from iotools._help_utils import _help_default, _help_multi_packages
 from iotools.imageio import (
     decode_image_using_imageio, encode_image_using_imageio,
     read_image_using_imageio, write_image_using_imageio,
-    load_image_using_imageio, save_image_using_imageio,
+    load_image_using_imageio, save_image_using_imageio, decode_images_using_imageio, load_images_using_imageio,
     decode_image_using_skimage, encode_image_using_skimage,
     read_image_using_skimage, write_image_using_skimage,
-    load_image_using_skimage, save_image_using_skimage,
+    load_image_using_skimage, save_image_using_skimage, decode_images_using_skimage, load_images_using_skimage,
     decode_image_using_pil, encode_image_using_pil,
     read_image_using_pil, write_image_using_pil,
-    load_image_using_pil, save_image_using_pil,
+    load_image_using_pil, save_image_using_pil, decode_images_using_pil, load_images_using_pil,
     decode_image_using_cv2, encode_image_using_cv2,
     read_image_using_cv2, write_image_using_cv2,
-    load_image_using_cv2, save_image_using_cv2,
-    decode_image, encode_image, read_image, write_image, load_image, save_image
+    load_image_using_cv2, save_image_using_cv2, decode_images_using_cv2, load_images_using_cv2,
+    decode_image, encode_image, read_image, write_image, load_image, save_image,
+    decode_images, load_images, probe_image
 )
 
-try:
-    import imageio
-except ModuleNotFoundError:
-    from iotools._missing_module_helper import _EmptyModule
-    imageio = _EmptyModule("imageio")
-
-
 # +---------------+
 # | Using imageio |
 # +---------------+
@@ -59,12 +53,22 @@ def save_jpg_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
     return save_image_using_imageio(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def decode_jpgs_using_imageio(data, workers=None, **kwargs):
+    return decode_images_using_imageio(data, workers=workers, **kwargs)
+
+
+def load_jpgs_using_imageio(filenames, fs=None, workers=None, **kwargs):
+    return load_images_using_imageio(filenames, fs=fs, workers=workers, **kwargs)
+
+
 decode_jpg_using_imageio.__doc__ = decode_image_using_imageio.__doc__.replace(" image ", " jpg image ")
 encode_jpg_using_imageio.__doc__ = encode_image_using_imageio.__doc__.replace(" image ", " jpg image ")
 read_jpg_using_imageio.__doc__ = read_image_using_imageio.__doc__.replace(" image ", " jpg image ")
 write_jpg_using_imageio.__doc__ = write_image_using_imageio.__doc__.replace(" image ", " jpg image ")
 load_jpg_using_imageio.__doc__ = load_image_using_imageio.__doc__.replace(" image ", " jpg image ")
 save_jpg_using_imageio.__doc__ = save_image_using_imageio.__doc__.replace(" image ", " jpg image ")
+decode_jpgs_using_imageio.__doc__ = decode_images_using_imageio.__doc__.replace(" image ", " jpg image ")
+load_jpgs_using_imageio.__doc__ = load_images_using_imageio.__doc__.replace(" image ", " jpg image ")
 
 
 def help_jpg_using_imageio():
@@ -106,12 +110,22 @@ def save_jpg_using_skimage(filename, data, fs=None, makedirs=False, **kwargs):
     return save_image_using_skimage(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def decode_jpgs_using_skimage(data, workers=None, **kwargs):
+    return decode_images_using_skimage(data, workers=workers, **kwargs)
+
+
+def load_jpgs_using_skimage(filenames, fs=None, workers=None, **kwargs):
+    return load_images_using_skimage(filenames, fs=fs, workers=workers, **kwargs)
+
+
 decode_jpg_using_skimage.__doc__ = decode_image_using_skimage.__doc__.replace(" image ", " jpg image ")
 encode_jpg_using_skimage.__doc__ = encode_image_using_skimage.__doc__.replace(" image ", " jpg image ")
 read_jpg_using_skimage.__doc__ = read_image_using_skimage.__doc__.replace(" image ", " jpg image ")
 write_jpg_using_skimage.__doc__ = write_image_using_skimage.__doc__.replace(" image ", " jpg image ")
 load_jpg_using_skimage.__doc__ = load_image_using_skimage.__doc__.replace(" image ", " jpg image ")
 save_jpg_using_skimage.__doc__ = save_image_using_skimage.__doc__.replace(" image ", " jpg image ")
+decode_jpgs_using_skimage.__doc__ = decode_images_using_skimage.__doc__.replace(" image ", " jpg image ")
+load_jpgs_using_skimage.__doc__ = load_images_using_skimage.__doc__.replace(" image ", " jpg image ")
 
 
 def help_jpg_using_skimage():
@@ -153,12 +167,22 @@ def save_jpg_using_pil(filename, data, fs=None, makedirs=False, **kwargs):
     return save_image_using_pil(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def decode_jpgs_using_pil(data, workers=None, **kwargs):
+    return decode_images_using_pil(data, workers=workers, **kwargs)
+
+
+def load_jpgs_using_pil(filenames, fs=None, workers=None, **kwargs):
+    return load_images_using_pil(filenames, fs=fs, workers=workers, **kwargs)
+
+
 decode_jpg_using_pil.__doc__ = decode_image_using_pil.__doc__.replace(" image ", " jpg image ")
 encode_jpg_using_pil.__doc__ = encode_image_using_pil.__doc__.replace(" image ", " jpg image ")
 read_jpg_using_pil.__doc__ = read_image_using_pil.__doc__.replace(" image ", " jpg image ")
 write_jpg_using_pil.__doc__ = write_image_using_pil.__doc__.replace(" image ", " jpg image ")
 load_jpg_using_pil.__doc__ = load_image_using_pil.__doc__.replace(" image ", " jpg image ")
 save_jpg_using_pil.__doc__ = save_image_using_pil.__doc__.replace(" image ", " jpg image ")
+decode_jpgs_using_pil.__doc__ = decode_images_using_pil.__doc__.replace(" image ", " jpg image ")
+load_jpgs_using_pil.__doc__ = load_images_using_pil.__doc__.replace(" image ", " jpg image ")
 
 
 def help_jpg_using_pil():
@@ -200,12 +224,22 @@ def save_jpg_using_cv2(filename, data, fs=None, makedirs=False, **kwargs):
     return save_image_using_cv2(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def decode_jpgs_using_cv2(data, workers=None, **kwargs):
+    return decode_images_using_cv2(data, workers=workers, **kwargs)
+
+
+def load_jpgs_using_cv2(filenames, fs=None, workers=None, **kwargs):
+    return load_images_using_cv2(filenames, fs=fs, workers=workers, **kwargs)
+
+
 decode_jpg_using_cv2.__doc__ = decode_image_using_cv2.__doc__.replace(" image ", " jpg image ")
 encode_jpg_using_cv2.__doc__ = encode_image_using_cv2.__doc__.replace(" image ", " jpg image ")
 read_jpg_using_cv2.__doc__ = read_image_using_cv2.__doc__.replace(" image ", " jpg image ")
 write_jpg_using_cv2.__doc__ = write_image_using_cv2.__doc__.replace(" image ", " jpg image ")
 load_jpg_using_cv2.__doc__ = load_image_using_cv2.__doc__.replace(" image ", " jpg image ")
 save_jpg_using_cv2.__doc__ = save_image_using_cv2.__doc__.replace(" image ", " jpg image ")
+decode_jpgs_using_cv2.__doc__ = decode_images_using_cv2.__doc__.replace(" image ", " jpg image ")
+load_jpgs_using_cv2.__doc__ = load_images_using_cv2.__doc__.replace(" image ", " jpg image ")
 
 
 def help_jpg_using_cv2():
@@ -247,12 +281,27 @@ def save_jpg(filename, data, fs=None, makedirs=False, **kwargs):
     return save_image(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def decode_jpgs(data, workers=None, **kwargs):
+    return decode_images(data, workers=workers, **kwargs)
+
+
+def load_jpgs(filenames, fs=None, workers=None, **kwargs):
+    return load_images(filenames, fs=fs, workers=workers, **kwargs)
+
+
+def probe_jpg(filename, fs=None):
+    return probe_image(filename, fs=fs)
+
+
 decode_jpg.__doc__ = decode_image.__doc__.replace(" image ", " jpg image ")
 encode_jpg.__doc__ = encode_image.__doc__.replace(" image ", " jpg image ")
 read_jpg.__doc__ = read_image.__doc__.replace(" image ", " jpg image ")
 write_jpg.__doc__ = write_image.__doc__.replace(" image ", " jpg image ")
 load_jpg.__doc__ = load_image.__doc__.replace(" image ", " jpg image ")
 save_jpg.__doc__ = save_image.__doc__.replace(" image ", " jpg image ")
+decode_jpgs.__doc__ = decode_images.__doc__.replace(" image ", " jpg image ")
+load_jpgs.__doc__ = load_images.__doc__.replace(" image ", " jpg image ")
+probe_jpg.__doc__ = probe_image.__doc__.replace(" image ", " jpg image ")
 
 
 def help_jpg():
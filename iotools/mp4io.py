@@ -7,11 +7,12 @@ from iotools._help_utils import _help_default, _help_multi_packages
 from iotools.videoio import (
     decode_video_using_imageio, encode_video_using_imageio,
     read_video_using_imageio, write_video_using_imageio,
-    load_video_using_imageio, save_video_using_imageio,
+    load_video_using_imageio, save_video_using_imageio, iter_video_using_imageio, open_video_writer_using_imageio,
     decode_video_using_cv2, encode_video_using_cv2,
     read_video_using_cv2, write_video_using_cv2,
-    load_video_using_cv2, save_video_using_cv2,
-    decode_video, encode_video, read_video, write_video, load_video, save_video
+    load_video_using_cv2, save_video_using_cv2, iter_video_using_cv2, open_video_writer_using_cv2,
+    decode_video, encode_video, read_video, write_video, load_video, save_video, iter_video, probe_video,
+    open_video_writer
 )
 
 
@@ -53,12 +54,23 @@ def save_mp4_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
     return save_video_using_imageio(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def iter_mp4_using_imageio(filename, fs=None, **kwargs):
+    return iter_video_using_imageio(filename, fs=fs, **kwargs)
+
+
+def open_mp4_writer_using_imageio(filename, fs=None, makedirs=False, **kwargs):
+    kwargs["format"] = "mp4"
+    return open_video_writer_using_imageio(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
 decode_mp4_using_imageio.__doc__ = decode_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
 encode_mp4_using_imageio.__doc__ = encode_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
 read_mp4_using_imageio.__doc__ = read_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
 write_mp4_using_imageio.__doc__ = write_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
 load_mp4_using_imageio.__doc__ = load_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
 save_mp4_using_imageio.__doc__ = save_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
+iter_mp4_using_imageio.__doc__ = iter_video_using_imageio.__doc__.replace(" video ", " mp4 video ")
+open_mp4_writer_using_imageio.__doc__ = open_video_writer_using_imageio.__doc__.replace(" video ", " mp4 video ")
 
 
 def help_mp4_using_imageio():
@@ -106,12 +118,23 @@ def save_mp4_using_cv2(filename, data, fs=None, makedirs=False, **kwargs):
     return save_video_using_cv2(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def iter_mp4_using_cv2(filename, fs=None, **kwargs):
+    return iter_video_using_cv2(filename, fs=fs, **kwargs)
+
+
+def open_mp4_writer_using_cv2(filename, fs=None, makedirs=False, **kwargs):
+    kwargs["format"] = "mp4"
+    return open_video_writer_using_cv2(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
 decode_mp4_using_cv2.__doc__ = decode_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
 encode_mp4_using_cv2.__doc__ = encode_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
 read_mp4_using_cv2.__doc__ = read_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
 write_mp4_using_cv2.__doc__ = write_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
 load_mp4_using_cv2.__doc__ = load_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
 save_mp4_using_cv2.__doc__ = save_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
+iter_mp4_using_cv2.__doc__ = iter_video_using_cv2.__doc__.replace(" video ", " mp4 video ")
+open_mp4_writer_using_cv2.__doc__ = open_video_writer_using_cv2.__doc__.replace(" video ", " mp4 video ")
 
 
 def help_mp4_using_cv2():
@@ -159,12 +182,28 @@ def save_mp4(filename, data, fs=None, makedirs=False, **kwargs):
     return save_video(filename, data, fs=fs, makedirs=makedirs, **kwargs)
 
 
+def iter_mp4(filename, fs=None, **kwargs):
+    return iter_video(filename, fs=fs, **kwargs)
+
+
+def open_mp4_writer(filename, fs=None, makedirs=False, **kwargs):
+    kwargs["format"] = "mp4"
+    return open_video_writer(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
+def probe_mp4(filename, fs=None):
+    return probe_video(filename, fs=fs)
+
+
 decode_mp4.__doc__ = decode_video.__doc__.replace(" video ", " mp4 video ")
 encode_mp4.__doc__ = encode_video.__doc__.replace(" video ", " mp4 video ")
 read_mp4.__doc__ = read_video.__doc__.replace(" video ", " mp4 video ")
 write_mp4.__doc__ = write_video.__doc__.replace(" video ", " mp4 video ")
 load_mp4.__doc__ = load_video.__doc__.replace(" video ", " mp4 video ")
 save_mp4.__doc__ = save_video.__doc__.replace(" video ", " mp4 video ")
+iter_mp4.__doc__ = iter_video.__doc__.replace(" video ", " mp4 video ")
+open_mp4_writer.__doc__ = open_video_writer.__doc__.replace(" video ", " mp4 video ")
+probe_mp4.__doc__ = probe_video.__doc__.replace(" video ", " mp4 video ")
 
 
 def help_mp4():
@@ -3,33 +3,308 @@ This module provides io for numpy files (.npy extension)
 See iotools.npyio.help_npy() for more info
 """
 
+import math
+import shutil
+import struct
+from contextlib import ExitStack
+
 from iotools._help_utils import _help_default
 from iotools._generic_open import _generic_open
-from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes
+from iotools._temp_filename_utils import _temp_file
+from iotools.localfs import check_fs, is_localfs
+from iotools.settings import settings
+from iotools._default_decode_encode import _bytes_reader, _default_encode_bytes, _default_encode_bytes_into
 
 try:
     import numpy as np
 except ModuleNotFoundError:
-    from iotools.settings import settings
     from iotools._missing_module_helper import _EmptyModule, _error_msg_one
     if settings["SHOW_IMPORT_WARNINGS"]:
         print("Warning:", _error_msg_one("iotools.npyio", "numpy"))
     np = _EmptyModule("numpy")
 
 
-def decode_npy(data, **kwargs):
+NPY_MAGIC = b"\x93NUMPY"
+NPY_HEADER_READERS = {(1, 0): "read_array_header_1_0", (2, 0): "read_array_header_2_0"}  # in numpy.lib.format
+NPY_HEADER_BLOCK_SIZE = 2 ** 12  # bytes read at once to parse the header of a remote npy file
+NPY_APPENDER_BUFFER_SIZE = 2 ** 24  # rows appended are buffered, and written by blocks of this size (in bytes)
+NPY_MAX_LENGTH_DIGITS = 19  # header space reserved for the first dimension, which is unknown until the file is closed
+
+
+def _read_npy_header(read_range):
+    """
+    Parse the header of a npy file, reading as few bytes as possible
+
+    Args:
+        read_range (callable): function reading the bytes between 2 offsets of the file (start and end)
+
+    Returns:
+        tuple: shape, fortran_order, dtype and offset of the array data in the file
+    """
+    block = read_range(0, NPY_HEADER_BLOCK_SIZE)
+    if block[:len(NPY_MAGIC)] != NPY_MAGIC:
+        raise ValueError("Not a npy file (npz files are not supported)")
+    version = (block[6], block[7])
+    if version not in NPY_HEADER_READERS:
+        raise ValueError("Unsupported npy format version {}".format(version))
+    length_size = 2 if version == (1, 0) else 4
+    header_end = 8 + length_size + int.from_bytes(block[8:8 + length_size], "little")
+    if header_end > len(block):
+        block = read_range(0, header_end)
+    with _bytes_reader(block) as f:
+        np.lib.format.read_magic(f)
+        shape, fortran_order, dtype = getattr(np.lib.format, NPY_HEADER_READERS[version])(f)
+    return shape, fortran_order, dtype, header_end
+
+
+class _LazyNpyArray:
+    """
+    Read-only proxy of a npy file: the header is parsed once, each slice is then read
+    from the file using a ranged read of the smallest contiguous block of bytes containing it.
+    Only integers, slices and Ellipsis are supported as indices, use 'numpy.asarray(array)' to read the whole array
+    """
+
+    def __init__(self, read_range, mmap_mode="r"):
+        self._read_range = read_range
+        self._writeable = mmap_mode == "c"
+        self.shape, self._fortran_order, self.dtype, self._offset = _read_npy_header(read_range)
+        if self.dtype.hasobject:
+            raise ValueError("Arrays of objects are pickled, they cannot be read lazily")
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return math.prod(self.shape)
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        if self.ndim == 0:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self):
+        return "<lazy npy array shape={} dtype={}>".format(self.shape, self.dtype)
+
+    def __array__(self, dtype=None, copy=None):
+        array = np.asarray(self[...])
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def _expand_key(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        for k in key:
+            if not isinstance(k, (int, np.integer, slice)) and k is not Ellipsis:
+                raise IndexError("Only integers, slices and Ellipsis are supported, not {}".format(type(k).__name__))
+        if key.count(Ellipsis) > 1:
+            raise IndexError("An index can only have a single Ellipsis")
+        if Ellipsis in key:
+            i = key.index(Ellipsis)
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1:]
+        if len(key) > self.ndim:
+            raise IndexError("Too many indices for array: array is {}-dimensional".format(self.ndim))
+        return key + (slice(None),) * (self.ndim - len(key))
+
+    def __getitem__(self, key):
+        key, shape = self._expand_key(key), self.shape
+        if self._fortran_order:  # the data is then stored as the transposed array in C order
+            key, shape = key[::-1], shape[::-1]
+        strides = [math.prod(shape[i + 1:]) * self.dtype.itemsize for i in range(len(shape))]
+        # leading integers select a contiguous block of the array
+        offset, axis = self._offset, 0
+        while axis < len(shape) and not isinstance(key[axis], slice):
+            index = int(key[axis])
+            if not -shape[axis] <= index < shape[axis]:
+                raise IndexError("Index {} is out of bounds for axis {} with size {}".format(index, axis, shape[axis]))
+            offset += (index % shape[axis]) * strides[axis]
+            axis += 1
+        if axis == len(shape):
+            return np.frombuffer(self._read_range(offset, offset + self.dtype.itemsize), dtype=self.dtype)[0]
+        # then only the rows between the first and the last rows of the first slice are read
+        rows = range(*key[axis].indices(shape[axis]))
+        first, last = (min(rows), max(rows)) if len(rows) > 0 else (0, -1)
+        raw = self._read_range(offset + first * strides[axis], offset + (last + 1) * strides[axis])
+        block = np.frombuffer(raw, dtype=self.dtype).reshape((last + 1 - first,) + tuple(shape[axis + 1:]))
+        array = block[(slice(rows.start - first if len(rows) > 0 else 0, None, rows.step),) + key[axis + 1:]]
+        if self._fortran_order:
+            array = array.T
+        return array.copy() if self._writeable else array
+
+
+def _npy_header(dtype, shape, header_size=None):
+    """
+    Build the header of a C-ordered npy file, padded with spaces to header_size bytes if given
+    (else to a multiple of 64 bytes as numpy does)
+    """
+    header = "{{'descr': {!r}, 'fortran_order': False, 'shape': {!r}, }}".format(
+        np.lib.format.dtype_to_descr(dtype), tuple(shape)
+    )
+    if header_size is None:
+        header_size = len(NPY_MAGIC) + 4 + len(header) + 1
+        header_size += -header_size % np.lib.format.ARRAY_ALIGN
+    if header_size - len(NPY_MAGIC) - 4 < 2 ** 16:  # the header length fits in 2 bytes (version 1.0)
+        header = (header.ljust(header_size - len(NPY_MAGIC) - 5) + "\n").encode("latin1")
+        return np.lib.format.magic(1, 0) + struct.pack("<H", len(header)) + header
+    header = (header.ljust(header_size - len(NPY_MAGIC) - 7) + "\n").encode("latin1")
+    return np.lib.format.magic(2, 0) + struct.pack("<I", len(header)) + header
+
+
+class _NpyAppender:
+    """
+    Npy writer returned by 'open_npy_appender': rows are buffered and written by large blocks,
+    the first dimension of the array is written in the header when the file is closed
+    """
+
+    def __init__(self, filename, dtype, shape_tail=(), fs=None, makedirs=False):
+        self.filename = filename
+        self.fs = fs
+        self.dtype = np.dtype(dtype)
+        if self.dtype.hasobject:
+            raise ValueError("Arrays of objects are pickled, they cannot be appended to a npy file")
+        self.shape_tail = tuple(int(n) for n in shape_tail)
+        self.length = 0
+        self.closed = False
+        self._exit_stack = ExitStack()
+        self._temp_filename = None
+        if is_localfs(fs) or not isinstance(filename, str):
+            self._file = self._exit_stack.enter_context(_generic_open(filename, 'wb', fs=fs, makedirs=makedirs))
+        else:
+            # the header is written last, which needs a seekable file, so the file is uploaded once written.
+            # Its final size is unknown, so the temporary file is on disk instead of in memory
+            if settings["SHOW_DISK_USE_WARNINGS"]:
+                print(
+                    "Warning: appending to a npy file on a remote file system creates a temporary file"
+                    + " on local hard drive (it is removed automatically)."
+                )
+            self._makedirs = makedirs
+            self._temp_filename = self._exit_stack.enter_context(_temp_file("npy", in_memory=False))
+            self._file = self._exit_stack.enter_context(open(self._temp_filename, 'wb'))
+        self._start = self._file.tell()
+        self._header_size = len(_npy_header(self.dtype, (10 ** NPY_MAX_LENGTH_DIGITS - 1,) + self.shape_tail))
+        self._file.write(_npy_header(self.dtype, (0,) + self.shape_tail, self._header_size))
+        row_size = max(1, math.prod(self.shape_tail) * self.dtype.itemsize)
+        self._buffer = np.empty((max(1, NPY_APPENDER_BUFFER_SIZE // row_size),) + self.shape_tail, dtype=self.dtype)
+        self._buffered = 0
+
+    @property
+    def shape(self):
+        return (self.length,) + self.shape_tail
+
+    def append(self, row):
+        row = np.asarray(row, dtype=self.dtype)
+        if row.shape != self.shape_tail:
+            raise ValueError("Row of shape {} cannot be appended to rows of shape {}".format(
+                row.shape, self.shape_tail
+            ))
+        self._buffer[self._buffered] = row
+        self._buffered += 1
+        self.length += 1
+        if self._buffered == len(self._buffer):
+            self._flush()
+
+    def extend(self, rows):
+        if not hasattr(rows, "__len__"):  # generators of rows
+            for row in rows:
+                self.append(row)
+            return
+        rows = np.asarray(rows, dtype=self.dtype)
+        if rows.shape[1:] != self.shape_tail:
+            raise ValueError("Rows of shape {} cannot be appended to rows of shape {}".format(
+                rows.shape[1:], self.shape_tail
+            ))
+        if len(rows) > len(self._buffer) - self._buffered:
+            self._flush()
+        if len(rows) >= len(self._buffer):  # large blocks are written directly
+            self._file.write(np.ascontiguousarray(rows).data.cast("B"))
+        else:
+            self._buffer[self._buffered:self._buffered + len(rows)] = rows
+            self._buffered += len(rows)
+        self.length += len(rows)
+
+    def _flush(self):
+        if self._buffered > 0:
+            self._file.write(self._buffer[:self._buffered].data.cast("B"))
+            self._buffered = 0
+
+    def _abort(self):
+        """
+        Close the npy file without writing its header: the temporary file is not uploaded and is removed,
+        a local file is removed
+        """
+        if self.closed:
+            return
+        try:
+            self._exit_stack.close()
+            if self._temp_filename is None and isinstance(self.filename, str):
+                fs = check_fs(self.fs)
+                if fs.exists(self.filename):
+                    fs.rm(self.filename)
+        finally:
+            self.closed = True
+            self._buffer = None
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._flush()
+            self._file.seek(self._start)
+            self._file.write(_npy_header(self.dtype, self.shape, self._header_size))
+            self._file.seek(0, 2)
+            if self._temp_filename is not None:
+                self._file.close()
+                with open(self._temp_filename, "rb") as f, _generic_open(
+                    self.filename, 'wb', fs=self.fs, makedirs=self._makedirs
+                ) as remote_f:
+                    shutil.copyfileobj(f, remote_f)
+        finally:
+            self.closed = True
+            self._buffer = None
+            self._exit_stack.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._abort()
+        else:
+            self.close()
+
+
+def decode_npy(data, copy=True, **kwargs):
     """
     Decode npy data from bytes
-    Backend used: numpy.load (numpy package)
+    Backend used: numpy.frombuffer, or numpy.load for arrays of objects (numpy package)
 
     Args:
-        data (bytes): numpy data to decode
+        data (bytes): numpy data to decode, or any object supporting the buffer protocol
+            (bytearray, memoryview, mmap, numpy array, ...)
+        copy (bool): if False, the array decoded shares the memory of data instead of copying it,
+            it is then read-only if data is read-only (example: bytes). Defaults to True
         **kwargs: same as in 'numpy.load'
 
     Returns:
         numpy.ndarray: numpy data decoded
     """
-    return _default_decode_bytes(np.load, data, **kwargs)
+    with _bytes_reader(data) as f:
+        is_npy = f.read(len(NPY_MAGIC)) == NPY_MAGIC  # else it may be a npz file
+        f.seek(0)
+        if is_npy and set(kwargs).issubset({"allow_pickle"}):
+            read_header = NPY_HEADER_READERS.get(np.lib.format.read_magic(f))
+            if read_header is not None:
+                shape, fortran_order, dtype = getattr(np.lib.format, read_header)(f)
+                if not dtype.hasobject:  # arrays of objects are pickled, they are loaded by numpy.load
+                    buffer = memoryview(data).cast("B")
+                    array = np.frombuffer(buffer, dtype=dtype, count=math.prod(shape), offset=f.tell())
+                    array = array.reshape(shape, order="F" if fortran_order else "C")
+                    return array.copy() if copy else array
+            f.seek(0)
+        return np.load(f, **kwargs)
 
 
 def encode_npy(data, **kwargs):
@@ -47,6 +322,23 @@ def encode_npy(data, **kwargs):
     return _default_encode_bytes(np.save, data, **kwargs)
 
 
+def encode_npy_into(buffer, data, **kwargs):
+    """
+    Encode numpy data in a preallocated buffer, without allocating bytes
+    Backend used: numpy.save (numpy package)
+
+    Args:
+        buffer (bytearray | memoryview | mmap.mmap | numpy.ndarray): writable buffer to encode data into,
+            ValueError is raised if it is too small
+        data (numpy.ndarray): numpy data to encode
+        **kwargs: same as in 'numpy.save'
+
+    Returns:
+        int: number of bytes written at the beginning of buffer
+    """
+    return _default_encode_bytes_into(np.save, buffer, data, **kwargs)
+
+
 def read_npy(openfile, **kwargs):
     """
     Read a open npy file
@@ -75,7 +367,7 @@ def write_npy(openfile, data, **kwargs):
     np.save(openfile, data, **kwargs)
 
 
-def load_npy(filename, fs=None, **kwargs):
+def load_npy(filename, fs=None, mmap_mode=None, **kwargs):
     """
     Load a npy file
     Backend used: numpy.load (numpy package)
@@ -83,11 +375,21 @@ def load_npy(filename, fs=None, **kwargs):
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        mmap_mode (str): if not None, the file is memory-mapped instead of being read, with this mode
+            ('r', 'r+' or 'c', see 'numpy.memmap'). For remote file systems, a read-only lazy array is returned
+            instead, which reads the slices requested with ranged reads ('r' or 'c' only). Defaults to None
         **kwargs: same as in 'numpy.load'
 
     Returns:
         numpy.ndarray: loaded numpy data
     """
+    if mmap_mode is not None and not is_localfs(fs) and isinstance(filename, str):
+        if mmap_mode not in ("r", "c"):
+            raise ValueError("mmap_mode '{}' is not supported on remote file systems, use 'r' or 'c'".format(mmap_mode))
+        fs = check_fs(fs)
+        return _LazyNpyArray(lambda start, end: fs.cat_file(filename, start=start, end=end), mmap_mode=mmap_mode)
+    if mmap_mode is not None:
+        return np.load(filename, mmap_mode=mmap_mode, **kwargs)
     with _generic_open(filename, 'rb', fs=fs) as f:
         data = read_npy(f, **kwargs)
     return data
@@ -109,6 +411,29 @@ def save_npy(filename, data, fs=None, makedirs=False, **kwargs):
         write_npy(f, data, **kwargs)
 
 
+def open_npy_appender(filename, dtype, shape_tail=(), fs=None, makedirs=False):
+    """
+    Open a npy file to append rows to it, instead of saving the whole array at once
+    On remote file systems, rows are written in a temporary file on local hard drive (never in memory,
+    since the final size is unknown), which is uploaded when the appender is closed
+    Backend used: numpy.lib.format (numpy package)
+
+    Args:
+        filename (str): file name to save data to
+        dtype (numpy.dtype): data type of the array
+        shape_tail (tuple): shape of each row, the array saved has a shape (number of rows, *shape_tail).
+            Defaults to () (1D array)
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+
+    Returns:
+        npy appender: appender with methods 'append(row)', 'extend(rows)' and 'close()'.
+            It can be used in a 'with' statement, the file is then closed automatically
+            (and removed if an error is raised in the 'with' statement)
+    """
+    return _NpyAppender(filename, dtype, shape_tail, fs=fs, makedirs=makedirs)
+
+
 def help_npy():
     """
     Print help for npy io
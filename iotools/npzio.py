@@ -0,0 +1,240 @@
+"""
+This module provides io for numpy archives (.npz extension)
+See iotools.npzio.help_npz() for more info
+"""
+
+import struct
+import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from iotools._help_utils import _help_default
+from iotools._generic_open import _generic_open
+from iotools._default_decode_encode import _bytes_reader, _default_encode_bytes
+from iotools.localfs import check_fs, is_localfs
+from iotools.npyio import _read_npy_header, _LazyNpyArray
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    from iotools.settings import settings
+    from iotools._missing_module_helper import _EmptyModule, _error_msg_one
+    if settings["SHOW_IMPORT_WARNINGS"]:
+        print("Warning:", _error_msg_one("iotools.npzio", "numpy"))
+    np = _EmptyModule("numpy")
+
+
+ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")  # local file header preceding each member of a zip file
+
+
+class _Npz(Mapping):
+    """
+    Lazy mapping returned by the npz functions: {name: numpy.ndarray}
+    Each array is read (and decompressed) from the archive when its name is accessed, it is not cached.
+    Use 'load(names, workers)' to read several arrays at once using a thread pool
+    """
+
+    def __init__(self, openfile, allow_pickle=False, close_file=False, filename=None, fs=None, mmap_mode=None):
+        self.closed = True  # until the archive is opened
+        self._openfile = openfile
+        self._close_file = close_file
+        try:
+            self._zip = zipfile.ZipFile(openfile)
+        except Exception:
+            if close_file:
+                openfile.close()
+            raise
+        self._members = {
+            info.filename[:-len(".npy")] if info.filename.endswith(".npy") else info.filename: info
+            for info in self._zip.infolist() if not info.filename.endswith("/")
+        }
+        self.allow_pickle = allow_pickle
+        self.filename = filename
+        self.fs = fs
+        self.mmap_mode = mmap_mode
+        self.closed = False
+
+    @property
+    def files(self):
+        return list(self._members)
+
+    def __getitem__(self, name):
+        info = self._members[name]
+        if self.mmap_mode is not None and info.compress_type == zipfile.ZIP_STORED and isinstance(self.filename, str):
+            return self._map_member(info)
+        with self._zip.open(info, "r") as f:
+            return np.lib.format.read_array(f, allow_pickle=self.allow_pickle)
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        return "<npz archive files={}>".format(self.files)
+
+    def _map_member(self, info):
+        """
+        Memory-map an uncompressed member: its offset in the archive file is read from its local header
+        """
+        fs = check_fs(self.fs)
+        local_header = ZIP_LOCAL_HEADER.unpack(
+            fs.cat_file(self.filename, start=info.header_offset, end=info.header_offset + ZIP_LOCAL_HEADER.size)
+        )
+        start = info.header_offset + ZIP_LOCAL_HEADER.size + local_header[-2] + local_header[-1]
+
+        def read_range(member_start, member_end):
+            return fs.cat_file(self.filename, start=start + member_start, end=start + member_end)
+
+        if not is_localfs(self.fs):
+            return _LazyNpyArray(read_range, mmap_mode=self.mmap_mode)
+        shape, fortran_order, dtype, offset = _read_npy_header(read_range)
+        if dtype.hasobject or 0 in shape:  # arrays of objects and empty arrays cannot be memory-mapped
+            with self._zip.open(info, "r") as f:
+                return np.lib.format.read_array(f, allow_pickle=self.allow_pickle)
+        return np.memmap(
+            self.filename, dtype=dtype, mode=self.mmap_mode, offset=start + offset, shape=shape,
+            order="F" if fortran_order else "C"
+        )
+
+    def load(self, names=None, workers=None):
+        """
+        Read several arrays at once, members are decompressed in parallel using a thread pool (zlib releases the GIL)
+
+        Args:
+            names (list): names of the arrays to read. Defaults to None (all arrays)
+            workers (int): number of threads. Defaults to None (chosen by 'concurrent.futures.ThreadPoolExecutor')
+
+        Returns:
+            dict{name: numpy.ndarray}: arrays read
+        """
+        names = self.files if names is None else list(names)
+        if workers == 1:
+            return {name: self[name] for name in names}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(names, executor.map(self.__getitem__, names)))
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._zip.close()
+        if self._close_file:
+            self._openfile.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+def decode_npz(data, allow_pickle=False):
+    """
+    Decode npz data from bytes
+    Backend used: zipfile.ZipFile and numpy.lib.format.read_array (numpy package)
+
+    Args:
+        data (bytes): npz data to decode, or any object supporting the buffer protocol (it is not copied as a whole)
+        allow_pickle (bool): allow loading arrays of objects, which are pickled. Defaults to False
+
+    Returns:
+        Mapping{name: numpy.ndarray}: npz data decoded, each array is decoded when it is accessed
+    """
+    return _Npz(_bytes_reader(data), allow_pickle=allow_pickle, close_file=True)
+
+
+def encode_npz(data, compress=False):
+    """
+    Encode npz data to bytes
+    Backend used: numpy.savez or numpy.savez_compressed (numpy package)
+
+    Args:
+        data (dict{name: numpy.ndarray}): npz data to encode
+        compress (bool): if True, arrays are compressed using deflate. Defaults to False
+
+    Returns:
+        bytes: npz data encoded
+    """
+    return _default_encode_bytes(write_npz, data, compress=compress)
+
+
+def read_npz(openfile, allow_pickle=False):
+    """
+    Read a open npz file
+    Backend used: zipfile.ZipFile and numpy.lib.format.read_array (numpy package)
+
+    Args:
+        openfile (file-like): file to read, must have been opened and must stay open while arrays are accessed
+        allow_pickle (bool): allow loading arrays of objects, which are pickled. Defaults to False
+
+    Returns:
+        Mapping{name: numpy.ndarray}: npz data read from the file provided, each array is read when it is accessed
+    """
+    return _Npz(openfile, allow_pickle=allow_pickle)
+
+
+def write_npz(openfile, data, compress=False):
+    """
+    Write in a open npz file
+    Backend used: numpy.savez or numpy.savez_compressed (numpy package)
+
+    Args:
+        openfile (file-like): file to write, must have been opened
+        data (dict{name: numpy.ndarray}): npz data to save
+        compress (bool): if True, arrays are compressed using deflate. Defaults to False
+    """
+    (np.savez_compressed if compress else np.savez)(openfile, **data)
+
+
+def load_npz(filename, fs=None, allow_pickle=False, mmap_mode=None):
+    """
+    Load a npz file
+    Backend used: zipfile.ZipFile and numpy.lib.format.read_array (numpy package)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+        allow_pickle (bool): allow loading arrays of objects, which are pickled. Defaults to False
+        mmap_mode (str): if not None, uncompressed arrays are memory-mapped from the archive instead of being read,
+            with this mode ('r' or 'c', see 'numpy.memmap'). 'r+' is not supported, since writing in the archive
+            would not update the checksums of its members. For remote file systems, read-only lazy arrays
+            are returned instead, which read the slices requested with ranged reads. Defaults to None
+
+    Returns:
+        Mapping{name: numpy.ndarray}: npz data loaded, each array is read when it is accessed.
+            The file is closed with 'close()' (or when exiting a 'with' statement)
+    """
+    if mmap_mode not in (None, "r", "c"):
+        raise ValueError("mmap_mode '{}' is not supported for npz files, use 'r' or 'c'".format(mmap_mode))
+    return _Npz(
+        _generic_open(filename, 'rb', fs=fs), allow_pickle=allow_pickle, close_file=True,
+        filename=filename, fs=fs, mmap_mode=mmap_mode
+    )
+
+
+def save_npz(filename, data, fs=None, makedirs=False, compress=False):
+    """
+    Save a npz file
+    Backend used: numpy.savez or numpy.savez_compressed (numpy package)
+
+    Args:
+        filename (str): file name to save data to
+        data (dict{name: numpy.ndarray}): npz data to save
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+        compress (bool): if True, arrays are compressed using deflate. Defaults to False
+    """
+    with _generic_open(filename, 'wb', fs=fs, makedirs=makedirs) as f:
+        write_npz(f, data, compress=compress)
+
+
+def help_npz():
+    """
+    Print help for npz io
+    """
+    _help_default("npz")
@@ -1,6 +1,51 @@
+class _Settings(dict):
+    """
+    dict of settings, counting its modifications so that values computed from settings can be cached
+    """
 
-settings = {
+    version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+settings = _Settings({
     "SHOW_IMPORT_WARNINGS": True,
     "SHOW_DEFAULT_BEHAVIOR_WARNINGS": True,
     "SHOW_DISK_USE_WARNINGS": True,
-}
+    "USE_MEMORY_TEMP_FILES": True,
+    "CACHE_VIDEO_FORMATS": False,
+    "IMAGE_BACKEND": None,
+})
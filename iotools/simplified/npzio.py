@@ -0,0 +1,41 @@
+import numpy as np  # pip install numpy
+from io import BytesIO
+
+
+def decode_npz(data, allow_pickle=False):
+    filelike = BytesIO(data)
+    with np.load(filelike, allow_pickle=allow_pickle) as npz:
+        ret = dict(npz)
+    filelike.close()
+    return ret
+
+
+def encode_npz(data, compress=False):
+    filelike = BytesIO()
+    write_npz(filelike, data, compress=compress)
+    ret = filelike.getvalue()
+    filelike.close()
+    return ret
+
+
+def read_npz(openfile, allow_pickle=False):
+    with np.load(openfile, allow_pickle=allow_pickle) as npz:
+        return dict(npz)
+
+
+def write_npz(openfile, data, compress=False):
+    if compress:
+        np.savez_compressed(openfile, **data)
+    else:
+        np.savez(openfile, **data)
+
+
+def load_npz(filename, allow_pickle=False):
+    with open(filename, 'rb') as f:
+        data = read_npz(f, allow_pickle=allow_pickle)
+    return data
+
+
+def save_npz(filename, data, compress=False):
+    with open(filename, 'wb') as f:
+        write_npz(f, data, compress=compress)
@@ -20,14 +20,13 @@ def encode_tar(data):
     b = BytesIO()
     t = tarfile.open(fileobj=b, mode="w")
     for subfilename, raw_data in data.items():
-        ti = tarfile.TarInfo(subfilename)
-        ti.size = len(raw_data)
         if isinstance(raw_data, str):
             raw_data = raw_data.encode('utf-8')
+        ti = tarfile.TarInfo(subfilename)
+        ti.size = len(raw_data)
         t.addfile(ti, BytesIO(raw_data))
-    b.seek(0)
-    ret = b.read()
     t.close()
+    ret = b.getvalue()
     b.close()
     return ret
 
@@ -49,14 +48,13 @@ def write_tar(openfile, data):
     b = BytesIO()
     t = tarfile.open(fileobj=b, mode="w")
     for subfilename, raw_data in data.items():
-        ti = tarfile.TarInfo(subfilename)
-        ti.size = len(raw_data)
         if isinstance(raw_data, str):
             raw_data = raw_data.encode('utf-8')
+        ti = tarfile.TarInfo(subfilename)
+        ti.size = len(raw_data)
         t.addfile(ti, BytesIO(raw_data))
-    b.seek(0)
-    openfile.write(b.read())
     t.close()
+    openfile.write(b.getvalue())
 
 
 def load_tar(filename):
@@ -73,9 +71,9 @@ def load_tar(filename):
 def save_tar(filename, data):
     t = tarfile.open(filename, mode="w")
     for subfilename, raw_data in data.items():
-        ti = tarfile.TarInfo(subfilename)
-        ti.size = len(raw_data)
         if isinstance(raw_data, str):
             raw_data = raw_data.encode('utf-8')
+        ti = tarfile.TarInfo(subfilename)
+        ti.size = len(raw_data)
         t.addfile(ti, BytesIO(raw_data))
     t.close()
@@ -3,11 +3,229 @@ This module provides io for tar files (.tar extension)
 See iotools.tario.help_tar() for more info
 """
 
+import json
+import os
+import posixpath
 import tarfile
+from collections.abc import Mapping
+from contextlib import ExitStack
 from io import BytesIO
 
 from iotools._help_utils import _help_default
 from iotools._generic_open import _generic_open
+from iotools._default_decode_encode import _bytes_reader, _default_encode_bytes
+from iotools.localfs import check_fs
+
+TAR_INDEX_EXTENSION = ".index.json"  # sidecar index written by 'build_tar_index', next to the tar file
+TAR_INDEX_VERSION = 1
+
+
+class _Tar(Mapping):
+    """
+    Lazy mapping returned by 'load_tar(..., lazy=True)': {filename: bytes}
+    Member headers are read when the archive is opened, each member data is read when its filename is accessed
+    """
+
+    def __init__(self, openfile, close_file=False, **kwargs):
+        self.closed = True  # until the archive is opened
+        self._openfile = openfile
+        self._close_file = close_file
+        try:
+            self._tar = tarfile.open(fileobj=openfile, **kwargs)
+        except Exception:
+            if close_file:
+                openfile.close()
+            raise
+        self._members = _tar_file_members(self._tar)
+        self.closed = False
+
+    def __getitem__(self, subfilename):
+        return self._tar.extractfile(self._members[subfilename]).read()
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        return "<tar archive files={}>".format(list(self._members))
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._tar.close()
+        if self._close_file:
+            self._openfile.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+class _IndexedTar(Mapping):
+    """
+    Lazy mapping returned by 'load_tar(..., lazy=True)' when the tar file has an index (see 'build_tar_index'):
+    {filename: bytes}, each file is read with a single ranged read, without reading the tar headers
+    """
+
+    def __init__(self, filename, members, fs=None):
+        self.filename = filename
+        self.fs = check_fs(fs)
+        self._members = members
+        self.closed = False
+
+    def __getitem__(self, subfilename):
+        offset, size = self._members[subfilename]
+        return self.fs.cat_file(self.filename, start=offset, end=offset + size)
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __repr__(self):
+        return "<indexed tar archive files={}>".format(list(self._members))
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _load_tar_index(filename, fs=None):
+    """
+    Load the index of a tar file, None if there is no index or if the tar file changed since it was indexed
+
+    Returns:
+        dict{filename: (offset, size)}: data offset and size of each file in the tar file
+    """
+    fs = check_fs(fs)
+    index_filename = filename + TAR_INDEX_EXTENSION
+    if not fs.exists(index_filename):
+        return None
+    with _generic_open(index_filename, 'r', fs=fs) as f:
+        index = json.load(f)
+    if index.get("version") != TAR_INDEX_VERSION or index.get("checksum") != fs.checksum(filename):
+        return None
+    return {name: (offset, size) for name, offset, size in index["members"]}
+
+
+def _tar_file_members(t):
+    """
+    Regular files of an open tar file (not opened as a stream): {filename: member}
+    Links to regular files are resolved to the member of the file they point to (as done by 'tarfile.extractfile'),
+    other members (directories, devices, links to other members or to missing files) are skipped
+    """
+    members = t.getmembers()
+    # names are normalized and the last member wins, as in 'tarfile.TarFile._find_link_target'
+    members_by_name = {posixpath.normpath(member.name): member for member in members}
+    ret = {}
+    for member in members:
+        target, seen = member, set()
+        while target is not None and (target.islnk() or target.issym()) and target.name not in seen:
+            seen.add(target.name)
+            linkname = target.linkname
+            if target.issym():  # symbolic links are relative to the directory of the link
+                linkname = "/".join(filter(None, (posixpath.dirname(target.name), linkname)))
+            target = members_by_name.get(posixpath.normpath(linkname))
+        if target is not None and target.isfile():
+            ret[member.name] = target
+    return ret
+
+
+def _read_tar_members(t):
+    return {subfilename: t.extractfile(member).read() for subfilename, member in _tar_file_members(t).items()}
+
+
+def _add_tar_member(t, subfilename, raw_data):
+    """
+    Add a file to an open tar file, its data can be bytes, str (text), a path (os.PathLike) or a file-like object
+    """
+    if isinstance(raw_data, os.PathLike):
+        t.add(os.fspath(raw_data), arcname=subfilename)
+        return
+    if isinstance(raw_data, str):
+        raw_data = raw_data.encode('utf-8')  # the size must be the number of bytes, not of characters
+    fileobj = raw_data if hasattr(raw_data, "read") else _bytes_reader(raw_data)
+    if fileobj.seekable():
+        start = fileobj.tell()
+        size = fileobj.seek(0, 2) - start
+        fileobj.seek(start)
+    else:  # the size of the file must be known before its data is written
+        fileobj = BytesIO(fileobj.read())
+        size = len(fileobj.getbuffer())
+    ti = tarfile.TarInfo(subfilename)
+    ti.size = size
+    t.addfile(ti, fileobj)
+
+
+class _TarWriter:
+    """
+    Tar writer returned by 'open_tar_writer': files are written one at a time with 'append' or 'extend',
+    and the tar file is finalized with 'close' (or when exiting a 'with' statement)
+    """
+
+    def __init__(self, filename, fs=None, makedirs=False, **kwargs):
+        self.filename = filename
+        self.fs = fs
+        self.closed = False
+        self._exit_stack = ExitStack()
+        try:
+            openfile = self._exit_stack.enter_context(_generic_open(filename, 'wb', fs=fs, makedirs=makedirs))
+            kwargs.setdefault("mode", "w")
+            self._tar = self._exit_stack.enter_context(tarfile.open(fileobj=openfile, **kwargs))
+        except BaseException:
+            self._exit_stack.close()
+            raise
+
+    def append(self, subfilename, data):
+        _add_tar_member(self._tar, subfilename, data)
+
+    def extend(self, items):
+        for subfilename, data in items.items() if isinstance(items, Mapping) else items:
+            self.append(subfilename, data)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._exit_stack.close()
+
+    def _abort(self, exc_type, exc_value, traceback):
+        """
+        Close the tar file without finalizing it, and remove the partial tar file
+        """
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._exit_stack.__exit__(exc_type, exc_value, traceback)  # 'tarfile' does not finalize on errors
+        finally:
+            if isinstance(self.filename, str):
+                fs = check_fs(self.fs)
+                if fs.exists(self.filename):
+                    fs.rm(self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._abort(exc_type, exc_value, traceback)
+        else:
+            self.close()
 
 
 def decode_tar(data, **kwargs):
@@ -22,13 +240,9 @@ def decode_tar(data, **kwargs):
     Returns:
         dict{filename: bytes}: tar data decoded
     """
-    b = BytesIO(data)
+    b = _bytes_reader(data)
     t = tarfile.open(fileobj=b, **kwargs)
-    ret = {}
-    for subfilename in t.getnames():
-        subdata = t.extractfile(subfilename)
-        if subdata is not None:
-            ret[subfilename] = subdata.read()
+    ret = _read_tar_members(t)
     t.close()
     b.close()
     return ret
@@ -46,19 +260,7 @@ def encode_tar(data, **kwargs):
     Returns:
         bytes: tar data encoded
     """
-    b = BytesIO()
-    t = tarfile.open(fileobj=b, mode="w", **kwargs)
-    for subfilename, raw_data in data.items():
-        ti = tarfile.TarInfo(subfilename)
-        ti.size = len(raw_data)
-        if isinstance(raw_data, str):
-            raw_data = raw_data.encode('utf-8')
-        t.addfile(ti, BytesIO(raw_data))
-    b.seek(0)
-    ret = b.read()
-    t.close()
-    b.close()
-    return ret
+    return _default_encode_bytes(write_tar, data, **kwargs)
 
 
 def read_tar(openfile, **kwargs):
@@ -73,7 +275,10 @@ def read_tar(openfile, **kwargs):
     Returns:
         dict{filename: bytes}: tar data read from the file provided
     """
-    return decode_tar(openfile.read(), **kwargs)
+    t = tarfile.open(fileobj=openfile, **kwargs)
+    ret = _read_tar_members(t)
+    t.close()
+    return ret
 
 
 def write_tar(openfile, data, **kwargs):
@@ -83,13 +288,17 @@ def write_tar(openfile, data, **kwargs):
 
     Args:
         openfile (file-like): file to write, must have been opened
-        data (dict{filename: bytes}): tar data to save
+        data (dict{filename: bytes} | iterable): tar data to save, it can also be an iterable of (filename, bytes).
+            Data can be bytes, str (text), a path (os.PathLike) or a file-like object, files are written one at a time
         **kwargs: same as in 'tarfile.open'
     """
-    openfile.write(encode_tar(data, **kwargs))
+    kwargs.setdefault("mode", "w")
+    with tarfile.open(fileobj=openfile, **kwargs) as t:
+        for subfilename, raw_data in data.items() if isinstance(data, Mapping) else data:
+            _add_tar_member(t, subfilename, raw_data)
 
 
-def load_tar(filename, fs=None, **kwargs):
+def load_tar(filename, fs=None, lazy=False, use_index=True, **kwargs):
     """
     Load a tar file
     Backends used: tarfile.open, tarfile.getnames, tarfile.extractfile (tarfile package)
@@ -97,11 +306,22 @@ def load_tar(filename, fs=None, **kwargs):
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        lazy (bool): if True, a mapping is returned instead of a dict, which reads each file when it is accessed.
+            The tar file is then closed with 'close()' (or when exiting a 'with' statement). Defaults to False
+        use_index (bool): if True and lazy is True, the index built by 'build_tar_index' is used if it exists,
+            each file is then read with a single ranged read instead of reading all tar headers first.
+            Defaults to True
         **kwargs: same as in 'tarfile.open'
 
     Returns:
-        dict{filename: bytes}: tar data loaded from the file provided
+        dict{filename: bytes}: tar data loaded from the file provided, with the data of the regular files.
+            Links to regular files have the data of the file they point to, other members are skipped
     """
+    if lazy:
+        members = _load_tar_index(filename, fs=fs) if use_index and isinstance(filename, str) else None
+        if members is not None:
+            return _IndexedTar(filename, members, fs=fs)
+        return _Tar(_generic_open(filename, 'rb', fs=fs), close_file=True, **kwargs)
     with _generic_open(filename, 'rb', fs=fs) as f:
         data = read_tar(f, **kwargs)
     return data
@@ -114,7 +334,8 @@ def save_tar(filename, data, fs=None, makedirs=False, **kwargs):
 
     Args:
         filename (str): file name to save data to
-        data (dict{filename: bytes}): tar data to save
+        data (dict{filename: bytes} | iterable): tar data to save, it can also be an iterable of (filename, bytes).
+            Data can be bytes, str (text), a path (os.PathLike) or a file-like object, files are written one at a time
         fs: file system to use. Defaults to None (local filesystem)
         makedirs (bool): if True, creates directory of filename (default is False)
         **kwargs: same as in 'tarfile.open'
@@ -123,6 +344,78 @@ def save_tar(filename, data, fs=None, makedirs=False, **kwargs):
         write_tar(f, data, **kwargs)
 
 
+def open_tar_writer(filename, fs=None, makedirs=False, **kwargs):
+    """
+    Open a tar file to write files one at a time, instead of saving all files at once
+    Backends used: tarfile.open, tarfile.TarInfo, tarfile.addfile (tarfile package)
+
+    Args:
+        filename (str): file name to save data to
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+        **kwargs: same as in 'tarfile.open'
+
+    Returns:
+        tar writer: writer with methods 'append(filename, data)', 'extend(items)' and 'close()'.
+            Data can be bytes, str (text), a path (os.PathLike) or a file-like object.
+            It can be used in a 'with' statement, the tar file is then closed automatically
+            (and removed if an error is raised in the 'with' statement)
+    """
+    return _TarWriter(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
+def iter_tar(filename, fs=None, as_file=False, **kwargs):
+    """
+    Iterate over the files of a tar file, reading it as a stream: only one file is held in memory at a time
+    Backends used: tarfile.open (mode 'r|*'), tarfile.extractfile (tarfile package)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+        as_file (bool): if True, a file-like object is yielded instead of bytes, it can only be read
+            until the next file is yielded. Defaults to False
+        **kwargs: same as in 'tarfile.open'
+
+    Yields:
+        tuple(str, bytes): filename and data of each regular file of the tar file. Unlike 'load_tar', links are
+            skipped, since the file they point to cannot be read again from a stream
+    """
+    kwargs.setdefault("mode", "r|*")
+    with _generic_open(filename, 'rb', fs=fs) as f, tarfile.open(fileobj=f, **kwargs) as t:
+        for member in t:
+            if not member.isfile():
+                continue
+            subdata = t.extractfile(member)
+            yield member.name, subdata if as_file else subdata.read()
+
+
+def build_tar_index(filename, fs=None):
+    """
+    Build the index of a (uncompressed) tar file, used by 'load_tar(..., lazy=True)' to read files randomly.
+    The index is saved next to the tar file, as a json file: filename + '.index.json'
+    Backends used: tarfile.open, json.dump (tarfile and json packages)
+
+    Args:
+        filename (str): tar file name to index
+        fs: file system to use. Defaults to None (local filesystem)
+
+    Returns:
+        str: file name of the index
+    """
+    fs = check_fs(fs)
+    with _generic_open(filename, 'rb', fs=fs) as f, tarfile.open(fileobj=f, mode="r:") as t:
+        members = _tar_file_members(t)
+        if any(member.issparse() for member in members.values()):
+            raise ValueError("Tar files containing sparse files cannot be indexed")
+    # links are indexed with the data offset and size of the file they point to
+    members = [[name, member.offset_data, member.size] for name, member in members.items()]
+    index = {"version": TAR_INDEX_VERSION, "checksum": fs.checksum(filename), "members": members}
+    index_filename = filename + TAR_INDEX_EXTENSION
+    with _generic_open(index_filename, 'w', fs=fs) as f:
+        json.dump(index, f, separators=(",", ":"))
+    return index_filename
+
+
 def help_tar():
     """
     Print help for tar io
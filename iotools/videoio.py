@@ -3,15 +3,27 @@ This module provides io for videos (.avi, .gif and .mp4 extensions)
 See iotools.videoio.help_video() for more info
 """
 
+import itertools
 import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
 
 from iotools.settings import settings
+from iotools._default_backend import _DefaultBackend
 from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes
 from iotools._generic_open import _generic_open, _generic_makedirs
 from iotools._help_utils import _help_default, _help_multi_packages
+from iotools._lazy_module import _is_installed, _LazyModule
 from iotools._missing_module_helper import _error_msg_sev, _EmptyModule, _warning_msg_default_sev
-from iotools._temp_filename_utils import _get_temp_filename
-from iotools.localfs import is_localfs
+from iotools._temp_filename_utils import _is_temp_in_memory, _temp_file
+from iotools._video_headers import _probe_video_file, _sniff_format
+from iotools.localfs import check_fs, is_localfs
 
 try:
     import numpy as np
@@ -24,17 +36,18 @@ except ModuleNotFoundError:
 
 _import_ok = set()
 
-try:
-    import imageio
-    import imageio_ffmpeg  # noqa
+if _is_installed("imageio", "imageio_ffmpeg"):
+    imageio = _LazyModule("imageio")
+    imageio_ffmpeg = _LazyModule("imageio_ffmpeg")
     _import_ok.add("imageio")
-except ModuleNotFoundError:
+else:
     imageio = _EmptyModule("imageio", "imageio-ffmpeg")
+    imageio_ffmpeg = _EmptyModule("imageio-ffmpeg")
 
-try:
-    import cv2
+if _is_installed("cv2"):
+    cv2 = _LazyModule("cv2")
     _import_ok.add("cv2")
-except ModuleNotFoundError:
+else:
     cv2 = _EmptyModule("opencv-python")
 
 if len(_import_ok) == 0:
@@ -59,12 +72,67 @@ DEFAULT_PROPERTIES_CV2 = {
     "gif": {"fps": 12, "codec": None},
     "mp4": {"fps": 30, "codec": "mp4v"},
 }
+CV2_MAX_FRAMES_GRABBED = 16  # above this gap between two frames to load, cv2 seeks instead of grabbing frames
+CV2_CODECS = {"avc1": "h264", "avc3": "h264", "hev1": "hevc", "hvc1": "hevc", "mp4v": "fmp4", "gif": "gif "}
+PROBE_BLOCK_SIZE = 2 ** 16  # size of the ranged reads done to read video headers on remote file systems
+PREFETCH_TIMEOUT = 0.1  # in seconds, how often the prefetching thread checks if it must stop
+PARALLEL_FORMATS = {"avi", "mp4"}  # formats whose segments can be concatenated without re-encoding
+PARALLEL_GOP_SIZE = 30  # keyframe interval of parallel encoded segments (imageio), their size is a multiple of it
+VIDEO_FORMAT_CACHE_SIZE = 4096  # maximum number of files in the video format cache
+
+_video_format_cache = {}
+_video_format_cache_lock = threading.Lock()  # the cache is shared by threads loading videos concurrently
 
 
 class _Video(dict):
     pass
 
 
+class _VideoWriter(ABC):
+    """
+    Base class of video writers: frames are written one at a time with 'append' or 'extend',
+    and the video is finalized with 'close' (or when exiting a 'with' statement)
+    """
+
+    def __init__(self, filename, fs=None, makedirs=False):
+        self.filename = filename
+        self.fs = fs
+        self.makedirs = makedirs
+        self.closed = False
+        self._aborted = False  # True if an error was raised while writing, the video is then not uploaded
+        self._exit_stack = ExitStack()
+
+    @abstractmethod
+    def append(self, frame):
+        pass
+
+    def extend(self, frames):
+        for frame in frames:
+            self.append(frame)
+
+    def _upload(self, temp_filename):
+        """
+        Copy a local temporary file to the (non-local) file system of the writer
+        """
+        if not self._aborted and os.path.exists(temp_filename):
+            with open(temp_filename, "rb") as f, _generic_open(
+                self.filename, 'wb', fs=self.fs, makedirs=self.makedirs
+            ) as remote_f:
+                shutil.copyfileobj(f, remote_f)
+
+    def close(self):
+        self.closed = True
+        self._exit_stack.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._aborted = True
+        self.close()
+
+
 def _guess_format_from_filename(filename, default_format=DEFAULT_FORMAT):
     """
     Guess format from filename
@@ -83,6 +151,53 @@ def _guess_format_from_filename(filename, default_format=DEFAULT_FORMAT):
     return default_format
 
 
+def _sniff_video_format(openfile):
+    """
+    Guess the video format from the first bytes of the file (its magic number)
+
+    Args:
+        openfile (str | file-like): local file name, or open file (its position is left unchanged)
+
+    Returns:
+        str: format guessed ('avi', 'gif' or 'mp4'). Returns None if the format cannot be guessed
+    """
+    try:
+        if isinstance(openfile, str):
+            with open(openfile, "rb") as f:
+                header = f.read(12)
+        else:
+            position = openfile.tell()
+            header = openfile.read(12)
+            openfile.seek(position)
+    except (AttributeError, OSError):  # not seekable
+        return None
+    if not isinstance(header, bytes):
+        return None
+    return _sniff_format(header)
+
+
+def _get_video_format_cache_key(filename, fs=None):
+    """
+    Key of a local file in the video format cache, None if the cache is disabled or the file is not local
+    """
+    if not settings["CACHE_VIDEO_FORMATS"] or not is_localfs(fs) or not isinstance(filename, str):
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+
+
+def _cache_video_format(key, format):
+    if key is None or format not in AVAILABLE_FORMATS:
+        return
+    with _video_format_cache_lock:
+        if key not in _video_format_cache and len(_video_format_cache) >= VIDEO_FORMAT_CACHE_SIZE:
+            del _video_format_cache[next(iter(_video_format_cache))]  # oldest entry
+        _video_format_cache[key] = format
+
+
 def _insert_properties_in_data(filename, data, kwargs, default_properties):
     """
     Insert properties from kwargs to data
@@ -139,6 +254,218 @@ def _insert_properties_in_data(filename, data, kwargs, default_properties):
     return res, kwargs
 
 
+def _get_frame_indices(start=None, stop=None, step=None, timestamps=None, fps=None):
+    """
+    Get the indices of the frames to load
+
+    Args:
+        start (int): index of the first frame to load
+        stop (int): index of the frame to stop at, excluded
+        step (int): load one frame every 'step' frames
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step
+        fps (float): frame rate of the video, used to convert timestamps to indices
+
+    Returns:
+        range | list | None: indices of the frames to load, None if all frames are loaded
+    """
+    if timestamps is not None:
+        if (start is not None) or (stop is not None) or (step is not None):
+            raise ValueError("'timestamps' cannot be used together with 'start', 'stop' or 'step'")
+        if not fps:
+            raise ValueError("Cannot convert timestamps to frames, the video frame rate is unknown")
+        if any(t < 0 for t in timestamps):
+            raise ValueError("'timestamps' must be positive")
+        return [int(round(t * fps)) for t in timestamps]
+    if (start is None) and (stop is None) and (step is None):
+        return None
+    start = 0 if start is None else start
+    stop = sys.maxsize if stop is None else stop
+    step = 1 if step is None else step
+    if start < 0 or stop < 0 or step <= 0:
+        raise ValueError("'start' and 'stop' must be positive and 'step' strictly positive")
+    return range(start, stop, step)
+
+
+def _get_nb_frames_to_load(indices=None, nframes=None):
+    """
+    Estimate the number of frames to load, used to preallocate the video array
+
+    Args:
+        indices (range | list | None): indices of the frames to load, None if all frames are loaded
+        nframes (int): number of frames of the video, None if unknown
+
+    Returns:
+        int: number of frames to load (it may be inaccurate since video headers are not always reliable)
+    """
+    if indices is None:
+        return nframes if nframes else 0
+    if isinstance(indices, range) and nframes:
+        return len(range(indices.start, min(indices.stop, nframes), indices.step))
+    if isinstance(indices, range) and indices.stop == sys.maxsize:
+        return 0
+    return len(indices)
+
+
+def _fill_video_array(video, frames):
+    """
+    Fill a preallocated video array of shape (frames, height, width, channels) with frames.
+    Frames already decoded in the video array are not copied.
+    The array is trimmed (or extended) if there are fewer (or more) frames than expected
+
+    Args:
+        video (np.array): preallocated video array
+        frames (iterable): frames to put in the video array
+
+    Returns:
+        np.array: the video array
+    """
+    count = 0
+    extra_frames = []
+    for frame in frames:
+        if count < len(video):
+            if not np.may_share_memory(frame, video[count]):
+                video[count] = frame
+        else:
+            extra_frames.append(frame)
+        count += 1
+    if len(extra_frames) > 0:
+        return np.concatenate([video, np.stack(extra_frames)])
+    return video[:count]
+
+
+def _prefetch_frames(frames, prefetch):
+    """
+    Yield frames decoded in a background thread, at most 'prefetch' frames are decoded in advance.
+    Decoding frames while the previous ones are used is faster, since video backends release the GIL
+    """
+    frames_queue = queue.Queue(maxsize=prefetch)
+    stop_event = threading.Event()
+
+    def put(item):
+        while not stop_event.is_set():
+            try:
+                frames_queue.put(item, timeout=PREFETCH_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def decode():
+        try:
+            for frame in frames:
+                if not put(("frame", frame)):
+                    return
+            put(("end", None))
+        except Exception as e:
+            put(("error", e))
+        finally:
+            frames.close()
+
+    thread = threading.Thread(target=decode, name="iotools_prefetch_frames", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = frames_queue.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop_event.set()
+        thread.join()
+
+
+def _encode_video_segment(backend, filename, frames, properties, kwargs):
+    """
+    Encode a segment of a video in a local file, it is run in a thread by '_save_video_in_parallel'
+    """
+    if backend == "imageio":
+        output_params = list(kwargs.get("output_params") or [])
+        if "-g" not in output_params:  # keyframes every PARALLEL_GOP_SIZE frames, segments are aligned on them
+            output_params += [
+                "-g", str(PARALLEL_GOP_SIZE), "-force_key_frames", "expr:eq(mod(n,{}),0)".format(PARALLEL_GOP_SIZE)
+            ]
+        kwargs = dict(kwargs, output_params=output_params)
+        _save_video_using_imageio(filename, {"video": frames, "properties": properties}, kwargs)
+    else:
+        with _VideoWriterUsingCv2(filename, properties, kwargs) as writer:
+            writer.extend(frames)
+
+
+def _get_parallel_segment_size(data, workers):
+    """
+    Number of frames of each segment encoded in parallel, None if the video cannot be encoded in parallel
+    """
+    if (workers is None) or (workers <= 1) or (data["properties"]["format"] not in PARALLEL_FORMATS):
+        return None
+    if "imageio" not in _import_ok:
+        print("Warning: encoding a video in parallel requires imageio-ffmpeg, it is encoded in a single thread.")
+        return None
+    segment_size = -(-len(data["video"]) // workers)
+    # Segments start with a keyframe, so they are aligned on the keyframe interval set when encoding with imageio,
+    # which keeps keyframes regular (cv2 does not allow to set the keyframe interval, segments are aligned anyway)
+    segment_size = -(-segment_size // PARALLEL_GOP_SIZE) * PARALLEL_GOP_SIZE
+    if segment_size >= len(data["video"]):
+        return None
+    return segment_size
+
+
+def _save_video_in_parallel(filename, data, kwargs, backend, workers, segment_size, fs=None, makedirs=False):
+    """
+    Save a video using several threads: the video is split in segments encoded in parallel,
+    which are then concatenated without re-encoding (ffmpeg concat demuxer)
+    """
+    prop = data["properties"]
+    frames = data["video"]
+    if settings["SHOW_DISK_USE_WARNINGS"] and not _is_temp_in_memory():
+        print(
+            "Warning: encoding a video in parallel creates temporary files on local hard drive"
+            + " (they are removed automatically)."
+        )
+    with ExitStack() as stack:
+        starts = range(0, len(frames), segment_size)
+        segment_filenames = [stack.enter_context(_temp_file(prop["format"])) for _ in starts]
+        # Threads are enough, since frames are encoded by ffmpeg or cv2, which release the GIL
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _encode_video_segment, backend, segment_filename, frames[start:start + segment_size], prop, kwargs)
+                for segment_filename, start in zip(segment_filenames, starts)
+            ]
+            for future in futures:
+                future.result()
+        list_filename = stack.enter_context(_temp_file("txt"))
+        with open(list_filename, "w") as f:
+            f.writelines("file '{}'\n".format(segment_filename) for segment_filename in segment_filenames)
+        if is_localfs(fs):
+            if makedirs:
+                _generic_makedirs(filename)
+            output_filename = filename
+        else:
+            output_filename = stack.enter_context(_temp_file(prop["format"]))
+        # The muxer is given explicitly, since the output filename may not have the extension of the format
+        concat = subprocess.run(
+            [
+                imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", list_filename, "-c", "copy", "-f", prop["format"], output_filename
+            ],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        if concat.returncode != 0:
+            raise RuntimeError("ffmpeg could not concatenate the video segments (exit code {}): {}".format(
+                concat.returncode, concat.stderr.decode("utf-8", errors="replace").strip()
+            ))
+        if output_filename != filename:
+            with open(output_filename, "rb") as f, _generic_open(filename, 'wb', fs=fs, makedirs=makedirs) as remote_f:
+                shutil.copyfileobj(f, remote_f)
+
+
+def _check_output(output):
+    if output not in {"list", "array"}:
+        raise ValueError("'output' must be either 'list' or 'array', got '{}'".format(output))
+
+
 ###
 
 
@@ -158,32 +485,196 @@ def _imageio_properties_to_format(properties):
 
 def _encode_video_using_imageio(data, kwargs):
     prop = data["properties"]
-    if settings["SHOW_DISK_USE_WARNINGS"]:
+    if settings["SHOW_DISK_USE_WARNINGS"] and not _is_temp_in_memory():
         print(
             "Warning: writing a '{}' video using imageio creates a temporary file".format(prop["format"])
             + " on local hard drive (it is removed automatically)."
         )
-    temp_filename = _get_temp_filename(prop["format"])
-    _save_video_using_imageio(temp_filename, data, kwargs)
-    with open(temp_filename, "rb") as f:
-        data_encoded = f.read()
-    os.remove(temp_filename)
+    with _temp_file(prop["format"]) as temp_filename:
+        _save_video_using_imageio(temp_filename, data, kwargs)
+        with open(temp_filename, "rb") as f:
+            data_encoded = f.read()
     return data_encoded
 
 
-def _save_video_using_imageio(filename, data, kwargs):
+def _get_writer_using_imageio(filename, properties, kwargs):
     prop = kwargs.copy()
-    prop.update(data["properties"])
+    prop.update(properties)
     del prop["default_properties_used"]
     if prop["format"] == "gif" and "fps" in prop:
         prop["duration"] = 1000 * 1 / prop.pop("fps")
-    writer = imageio.get_writer(filename, **prop)
+    return imageio.get_writer(filename, **prop)
+
+
+def _save_video_using_imageio(filename, data, kwargs):
+    writer = _get_writer_using_imageio(filename, data["properties"], kwargs)
     for frame in data["video"]:
         writer.append_data(frame)
     writer.close()
 
 
-def decode_video_using_imageio(data, which="video", **kwargs):
+class _VideoWriterUsingImageio(_VideoWriter):
+    """
+    Video writer returned by 'open_video_writer_using_imageio'
+    """
+
+    def __init__(self, filename, properties, kwargs, fs=None, makedirs=False):
+        super().__init__(filename, fs=fs, makedirs=makedirs)
+        self.properties = properties
+        self._temp_filename = None
+        try:
+            if is_localfs(fs):
+                if makedirs:
+                    _generic_makedirs(filename)
+                openfile = filename
+            else:
+                # mp4 and avi muxers need to seek in the output file, and aborted videos must not be uploaded,
+                # so the video is uploaded once written
+                if settings["SHOW_DISK_USE_WARNINGS"] and not _is_temp_in_memory():
+                    print(
+                        "Warning: writing a '{}' video using imageio creates".format(properties["format"])
+                        + " a temporary file on local hard drive (it is removed automatically)."
+                    )
+                self._temp_filename = self._exit_stack.enter_context(_temp_file(properties["format"]))
+                openfile = self._temp_filename
+            self._writer = _get_writer_using_imageio(openfile, properties, kwargs)
+        except BaseException:
+            self._exit_stack.close()  # removes the temporary file
+            raise
+
+    def append(self, frame):
+        self._writer.append_data(frame)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self._writer.close()
+            if self._temp_filename is not None:
+                self._upload(self._temp_filename)
+        finally:
+            super().close()
+
+
+def _get_fps_using_imageio(properties):
+    if "fps" in properties:
+        return properties["fps"]
+    if properties.get("duration"):  # gif frame duration, in ms
+        return 1000 / properties["duration"]
+    return None
+
+
+def _iter_frames_using_imageio(reader, indices=None):
+    """
+    Yield the frames of an imageio reader, seeking to the frames listed in indices
+    """
+    if indices is None:
+        yield from reader
+        return
+    for index in indices:
+        try:
+            frame = reader.get_data(index)
+        except (IndexError, EOFError):  # index after the end of the video
+            if isinstance(indices, range):
+                return
+            continue
+        yield frame
+
+
+def _frames_to_array_using_imageio(reader, properties, indices=None):
+    """
+    Load the frames of an imageio reader in a single np.array, allocated once
+    """
+    nframes = reader.get_length()
+    if nframes == float("inf"):
+        nframes = round(properties.get("duration", 0) * properties.get("fps", 0))
+    frames = _iter_frames_using_imageio(reader, indices)
+    first_frame = next(frames, None)
+    if first_frame is None:
+        return np.empty((0, 0, 0, 3), dtype=np.uint8)
+    video = np.empty((_get_nb_frames_to_load(indices, nframes),) + first_frame.shape, dtype=first_frame.dtype)
+    return _fill_video_array(video, itertools.chain([first_frame], frames))
+
+
+def _get_reader_using_imageio(openfile, kwargs, known_format=None, filename_format=None):
+    """
+    Open an imageio reader, trying several formats until one works.
+    The format is first guessed from the file magic number, to open the right reader on the first try,
+    unless it is given in kwargs. If no format works, the error of the last format tried is raised
+
+    Args:
+        openfile (str | file-like): file to read
+        kwargs (dict): same as in 'imageio.get_reader', 'format' is popped from it if present
+        known_format (str): format already detected for this file (skips guessing it), replaced by 'format'
+            if it is in kwargs. Defaults to None
+        filename_format (str): format guessed from the file name, tried if the format guessed from the
+            file content does not work. Defaults to None
+
+    Returns:
+        (reader, dict): the imageio reader and the video properties
+    """
+    formats = ["mp4", "avi", "gif"]
+    if filename_format is not None:
+        formats = [filename_format] + formats
+    if "format" in kwargs:
+        known_format = kwargs.pop("format")  # the format given by the caller is used instead of the guessed one
+    elif known_format is None:
+        known_format = _sniff_video_format(openfile)
+    if known_format is not None:
+        formats = [known_format] + formats
+    error = None
+    for format in formats:
+        try:
+            reader = imageio.get_reader(openfile, format=format, **kwargs)
+            properties = reader.get_meta_data()
+            if format == known_format:
+                # Container format is known, no need to guess it from the codec
+                properties["format"] = format
+                break
+            properties["format"] = _imageio_properties_to_format(properties)
+            if properties["format"] != format:
+                reader = imageio.get_reader(openfile, format=properties["format"], **kwargs)
+                properties = reader.get_meta_data()
+                properties["format"] = _imageio_properties_to_format(properties)
+            break
+        except ValueError as e:
+            error = e
+    else:
+        raise error
+    return reader, properties
+
+
+def _read_video_from_reader_using_imageio(reader, properties, which, start, stop, step, timestamps, output):
+    """
+    Read the data of an opened imageio reader, and close it once done
+    """
+    res = {}
+    try:
+        # Format data for user
+        if ("video" in which) or ("all" in which):
+            indices = _get_frame_indices(start, stop, step, timestamps, _get_fps_using_imageio(properties))
+            if output == "array":
+                res["video"] = _frames_to_array_using_imageio(reader, properties, indices)
+            else:
+                res["video"] = list(_iter_frames_using_imageio(reader, indices))
+    finally:
+        reader.close()
+    if ("audio" in which) or ("all" in which):
+        res["audio"] = None
+    if ("properties" in which) or ("all" in which):
+        res["properties"] = dict(properties)
+    if which == "video":
+        return res["video"]
+    if which == "audio":
+        return res["audio"]
+    if which == "properties":
+        return res["properties"]
+    return res
+
+
+def decode_video_using_imageio(
+    data, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Decode video data from bytes
     Backend used: imageio.get_reader (imageio package)
@@ -192,13 +683,22 @@ def decode_video_using_imageio(data, which="video", **kwargs):
         data (bytes): video data to decode
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data decoded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    return _default_decode_bytes(read_video_using_imageio, data, which=which, **kwargs)
+    return _default_decode_bytes(
+        read_video_using_imageio, data, which=which, start=start, stop=stop, step=step,
+        timestamps=timestamps, output=output, **kwargs)
 
 
 def encode_video_using_imageio(data, **kwargs):
@@ -220,7 +720,9 @@ def encode_video_using_imageio(data, **kwargs):
     return _encode_video_using_imageio(data, kwargs)
 
 
-def read_video_using_imageio(openfile, which="video", **kwargs):
+def read_video_using_imageio(
+    openfile, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Read an open video file
     Backend used: imageio.get_reader (imageio package)
@@ -229,43 +731,22 @@ def read_video_using_imageio(openfile, which="video", **kwargs):
         openfile (file-like): file to read, must have been opened
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data read, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    res = {}
-    # Read file and get right format
-    formats = ["mp4", "avi", "gif"]
-    if "format" in kwargs:
-        formats = [kwargs.pop("format")] + formats
-    for format in formats:
-        try:
-            reader = imageio.get_reader(openfile, format=format, **kwargs)
-            properties = reader.get_meta_data()
-            properties["format"] = _imageio_properties_to_format(properties)
-            if properties["format"] != format:
-                reader = imageio.get_reader(openfile, format=properties["format"], **kwargs)
-                properties = reader.get_meta_data()
-                properties["format"] = _imageio_properties_to_format(properties)
-            break
-        except ValueError:
-            pass
-    # Format data for user
-    if ("video" in which) or ("all" in which):
-        res["video"] = [im for im in reader]  # list(reader) does not work
-    if ("audio" in which) or ("all" in which):
-        res["audio"] = None
-    if ("properties" in which) or ("all" in which):
-        res["properties"] = dict(properties)
-    if which == "video":
-        return res["video"]
-    if which == "audio":
-        return res["audio"]
-    if which == "properties":
-        return res["properties"]
-    return res
+    _check_output(output)
+    reader, properties = _get_reader_using_imageio(openfile, kwargs)
+    return _read_video_from_reader_using_imageio(reader, properties, which, start, stop, step, timestamps, output)
 
 
 def write_video_using_imageio(openfile, data, **kwargs):
@@ -287,7 +768,9 @@ def write_video_using_imageio(openfile, data, **kwargs):
         openfile.write(data_enc)
 
 
-def load_video_using_imageio(filename, fs=None, which="video", **kwargs):
+def load_video_using_imageio(
+    filename, fs=None, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Load a video file
     Backend used: imageio.get_reader (imageio package)
@@ -297,23 +780,33 @@ def load_video_using_imageio(filename, fs=None, which="video", **kwargs):
         fs: file system to use. Defaults to None (local filesystem)
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data loaded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    if "format" not in kwargs:
-        fmt = _guess_format_from_filename(filename, default_format=None)
-        if fmt is not None:
-            kwargs["format"] = fmt
-    # Better to guess the format from the filename to give info to imageio
+    _check_output(output)
+    # The format guessed from the filename is tried after the one guessed from the file content
+    filename_format = _guess_format_from_filename(filename, default_format=None)
+    cache_key = _get_video_format_cache_key(filename, fs)
     with _generic_open(filename, 'rb', fs=fs) as f:
-        data = read_video_using_imageio(f, which=which, **kwargs)
+        reader, properties = _get_reader_using_imageio(
+            f, kwargs, known_format=_video_format_cache.get(cache_key), filename_format=filename_format)
+        _cache_video_format(cache_key, properties["format"])
+        data = _read_video_from_reader_using_imageio(
+            reader, properties, which, start, stop, step, timestamps, output)
     return data
 
 
-def save_video_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
+def save_video_using_imageio(filename, data, fs=None, makedirs=False, workers=None, **kwargs):
     """
     Save a video file
     Backend used: imageio.get_writer (imageio package)
@@ -323,10 +816,15 @@ def save_video_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
         data (dict | np.array): video data to save
         fs: file system to use. Defaults to None (local filesystem)
         makedirs (bool): if True, creates directory of filename (default is False)
+        workers (int): number of threads encoding the video: the video is split in segments encoded in
+            parallel, then concatenated (mp4 and avi only). Defaults to None (single thread)
         **kwargs: same as in 'imageio.get_writer'
     """
     data, kwargs = _insert_properties_in_data(filename, data, kwargs, DEFAULT_PROPERTIES_IMAGEIO)
-    if is_localfs(fs):
+    segment_size = _get_parallel_segment_size(data, workers)
+    if segment_size is not None:
+        _save_video_in_parallel(filename, data, kwargs, "imageio", workers, segment_size, fs=fs, makedirs=makedirs)
+    elif is_localfs(fs):
         if makedirs:
             _generic_makedirs(filename)
         _save_video_using_imageio(filename, data, kwargs)
@@ -335,6 +833,65 @@ def save_video_using_imageio(filename, data, fs=None, makedirs=False, **kwargs):
             write_video_using_imageio(f, data, **kwargs)
 
 
+def iter_video_using_imageio(
+    filename, fs=None, start=None, stop=None, step=None, timestamps=None, prefetch=0, **kwargs
+):
+    """
+    Iterate over the frames of a video file, decoding them one at a time
+    Backend used: imageio.get_reader (imageio package)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        prefetch (int): number of frames decoded in advance in a background thread, while the previous
+            frames are used. Defaults to 0 (frames are decoded when requested)
+        **kwargs: same as in 'imageio.get_reader'
+
+    Yields:
+        np.array: video frames, in order
+    """
+    if prefetch > 0:
+        yield from _prefetch_frames(iter_video_using_imageio(
+            filename, fs=fs, start=start, stop=stop, step=step, timestamps=timestamps, **kwargs), prefetch)
+        return
+    filename_format = _guess_format_from_filename(filename, default_format=None)
+    # imageio streams local files by name, whereas file-like objects are copied to a temporary file first
+    cache_key = _get_video_format_cache_key(filename, fs)
+    with nullcontext(filename) if is_localfs(fs) else _generic_open(filename, 'rb', fs=fs) as f:
+        reader, properties = _get_reader_using_imageio(
+            f, kwargs, known_format=_video_format_cache.get(cache_key), filename_format=filename_format)
+        _cache_video_format(cache_key, properties["format"])
+        try:
+            indices = _get_frame_indices(start, stop, step, timestamps, _get_fps_using_imageio(properties))
+            yield from _iter_frames_using_imageio(reader, indices)
+        finally:
+            reader.close()
+
+
+def open_video_writer_using_imageio(filename, fs=None, makedirs=False, **kwargs):
+    """
+    Open a video file to write frames one at a time, instead of saving all frames at once
+    Backend used: imageio.get_writer (imageio package)
+
+    Args:
+        filename (str): file name to save data to
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+        **kwargs: same as in 'imageio.get_writer'
+
+    Returns:
+        video writer: writer with methods 'append(frame)', 'extend(frames)' and 'close()'.
+            It can be used in a 'with' statement, the video is then closed automatically
+    """
+    data, kwargs = _insert_properties_in_data(filename, None, kwargs, DEFAULT_PROPERTIES_IMAGEIO)
+    return _VideoWriterUsingImageio(filename, data["properties"], kwargs, fs=fs, makedirs=makedirs)
+
+
 def help_video_using_imageio():
     """
     Print help for video io using imageio library
@@ -365,7 +922,135 @@ def _cv2_properties_to_format(properties):
     return "unknown"
 
 
-def decode_video_using_cv2(data, which="video", **kwargs):
+def _print_disk_use_warning_using_cv2(action, size=None):
+    if settings["SHOW_DISK_USE_WARNINGS"] and not _is_temp_in_memory(size):
+        print(
+            "Warning: {} a video using cv2 creates a temporary file on local hard drive".format(action)
+            + " (it is removed automatically)."
+        )
+
+
+def _read_frames_using_cv2(cap, indices=None, video=None):
+    """
+    Yield the frames of an opened cv2.VideoCapture in BGR, seeking to the frames listed in indices.
+    If a preallocated video array is given, frames are decoded directly in it while it is not full
+    """
+    count = 0
+
+    def read():
+        if (video is not None) and (count < len(video)):
+            return cap.read(video[count])
+        return cap.read()
+
+    if indices is None:
+        ret, frame = read()
+        while ret:
+            yield frame
+            count += 1
+            ret, frame = read()
+        return
+    position = 0
+    for index in indices:
+        if (position is None) or (index < position) or (index - position > CV2_MAX_FRAMES_GRABBED):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        else:
+            # Close frames are grabbed without being decoded, it is faster than seeking
+            for _ in range(index - position):
+                cap.grab()
+        ret, frame = read()
+        if not ret:  # index after the end of the video
+            if isinstance(indices, range):
+                return
+            position = None
+            continue
+        position = index + 1
+        yield frame
+        count += 1
+
+
+def _iter_frames_using_cv2(cap, indices=None):
+    """
+    Yield the frames of an opened cv2.VideoCapture in RGB, seeking to the frames listed in indices,
+    and release it once done
+    """
+    try:
+        for frame in _read_frames_using_cv2(cap, indices):
+            yield frame[:, :, 2::-1]
+    finally:
+        cap.release()
+
+
+def _frames_to_array_using_cv2(cap, indices=None):
+    """
+    Load the frames of an opened cv2.VideoCapture in RGB in a single np.array, allocated once,
+    and release it once done
+    """
+    nframes = _get_nb_frames_to_load(indices, max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0))
+    height, width = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    video = np.empty((nframes, height, width, 3), dtype=np.uint8)
+
+    def iter_rgb_frames():
+        for frame in _read_frames_using_cv2(cap, indices, video):
+            # Colors are converted in place, instead of returning a non-contiguous view
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+
+    try:
+        return _fill_video_array(video, iter_rgb_frames())
+    finally:
+        cap.release()
+
+
+class _VideoWriterUsingCv2(_VideoWriter):
+    """
+    Video writer returned by 'open_video_writer_using_cv2'
+    """
+
+    def __init__(self, filename, properties, kwargs, fs=None, makedirs=False):
+        super().__init__(filename, fs=fs, makedirs=makedirs)
+        if properties["codec"] is None:
+            raise ValueError("Unknown format, please provide codec")
+        self.properties = properties
+        self._kwargs = kwargs
+        self._writer = None
+        if is_localfs(fs):
+            if makedirs:
+                _generic_makedirs(filename)
+            self._local_filename = filename
+        else:
+            # As far as I know a local filename is required to save a video using cv2
+            _print_disk_use_warning_using_cv2("writing")
+            self._local_filename = self._exit_stack.enter_context(_temp_file(properties["format"]))
+
+    def append(self, frame):
+        if frame.ndim != 3:
+            raise ValueError("Frames must be 2D-images.")
+        if frame.shape[2] != 3:
+            raise ValueError("Frames must be 2D-images with 3 color channels.")
+        if "uint8" not in str(frame.dtype):
+            raise ValueError("Frames must be 2D-images with 3 color channels, of type uint8")
+        if self._writer is None:
+            # cv2 needs the frame size to open the video
+            height, width = frame.shape[:2]
+            fourcc = cv2.VideoWriter_fourcc(*self.properties["codec"])
+            self._writer = cv2.VideoWriter(
+                self._local_filename, fourcc, self.properties["fps"], (width, height), **self._kwargs)
+        self._writer.write(frame[:, :, 2::-1])
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._writer is not None:
+                self._writer.release()
+            if self._local_filename != self.filename:
+                self._upload(self._local_filename)
+        finally:
+            super().close()
+
+
+def decode_video_using_cv2(
+    data, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Decode video data from bytes
     Backend used: cv2.VideoCapture (opencv-python package)
@@ -374,23 +1059,28 @@ def decode_video_using_cv2(data, which="video", **kwargs):
         data (bytes): video data to decode
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'cv2.VideoCapture'
 
     Returns:
         dict: video data decoded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    if settings["SHOW_DISK_USE_WARNINGS"]:
-        print(
-            "Warning: reading a video using cv2 creates a temporary file on local hard drive"
-            + " (it is removed automatically)."
-        )
-    temp_filename = _get_temp_filename()
-    with open(temp_filename, "wb") as f:
-        f.write(data)
-    prop = {k: v for k, v in kwargs.items() if k not in {"codec", "format", "fps"}}
-    data_decoded = load_video_using_cv2(temp_filename, fs=None, which=which, **prop)
-    os.remove(temp_filename)
+    size = memoryview(data).nbytes
+    _print_disk_use_warning_using_cv2("reading", size)
+    with _temp_file(size=size) as temp_filename:
+        with open(temp_filename, "wb") as f:
+            f.write(data)
+        prop = {k: v for k, v in kwargs.items() if k not in {"codec", "format", "fps"}}
+        data_decoded = load_video_using_cv2(
+            temp_filename, fs=None, which=which, start=start, stop=stop, step=step,
+            timestamps=timestamps, output=output, **prop)
     return data_decoded
 
 
@@ -408,20 +1098,17 @@ def encode_video_using_cv2(data, **kwargs):
     """
     if not isinstance(data, _Video):
         data, kwargs = _insert_properties_in_data(None, data, kwargs, DEFAULT_PROPERTIES_CV2)
-    if settings["SHOW_DISK_USE_WARNINGS"]:
-        print(
-            "Warning: writing a video using cv2 creates a temporary file on local hard drive"
-            + " (it is removed automatically)."
-        )
-    temp_filename = _get_temp_filename(data["properties"]["format"])
-    save_video_using_cv2(temp_filename, data, fs=None, makedirs=False, **kwargs)
-    with open(temp_filename, "rb") as f:
-        data_encoded = f.read()
-    os.remove(temp_filename)
+    _print_disk_use_warning_using_cv2("writing")
+    with _temp_file(data["properties"]["format"]) as temp_filename:
+        save_video_using_cv2(temp_filename, data, fs=None, makedirs=False, **kwargs)
+        with open(temp_filename, "rb") as f:
+            data_encoded = f.read()
     return data_encoded
 
 
-def read_video_using_cv2(openfile, which="video", **kwargs):
+def read_video_using_cv2(
+    openfile, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Read an open video file
     Backend used: cv2.VideoCapture (opencv-python package)
@@ -430,14 +1117,29 @@ def read_video_using_cv2(openfile, which="video", **kwargs):
         openfile (file-like): file to read, must have been opened
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'cv2.VideoCapture'
 
     Returns:
         dict: video data read, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    data_encoded = openfile.read()
-    return decode_video_using_cv2(data_encoded, which=which, **kwargs)
+    _print_disk_use_warning_using_cv2("reading")
+    with _temp_file() as temp_filename:
+        # The file is copied by chunks, instead of being read in memory at once
+        with open(temp_filename, "wb") as f:
+            shutil.copyfileobj(openfile, f)
+        prop = {k: v for k, v in kwargs.items() if k not in {"codec", "format", "fps"}}
+        data_decoded = load_video_using_cv2(
+            temp_filename, fs=None, which=which, start=start, stop=stop, step=step,
+            timestamps=timestamps, output=output, **prop)
+    return data_decoded
 
 
 def write_video_using_cv2(openfile, data, **kwargs):
@@ -456,7 +1158,9 @@ def write_video_using_cv2(openfile, data, **kwargs):
     openfile.write(data_encoded)
 
 
-def load_video_using_cv2(filename, fs=None, which="video", **kwargs):
+def load_video_using_cv2(
+    filename, fs=None, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Load a video file
     Backend used: cv2.VideoCapture (opencv-python package)
@@ -466,12 +1170,20 @@ def load_video_using_cv2(filename, fs=None, which="video", **kwargs):
         fs: file system to use. Defaults to None (local filesystem)
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'cv2.VideoCapture'
 
     Returns:
         dict: video data loaded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
+    _check_output(output)
     if is_localfs(fs):
         # As far as I know a local filename is required to load a video using cv2
         if "format" in kwargs:
@@ -483,15 +1195,14 @@ def load_video_using_cv2(filename, fs=None, which="video", **kwargs):
             if "format" not in res["properties"]:
                 res["properties"]["format"] = _cv2_properties_to_format(res["properties"])
         if "video" in which or "all" in which:
-            video = []
-            ret = True
-            while ret:
-                ret, frame = cap.read()
-                video.append(frame)
-            cap.release()
-            res["video"] = [frame[:, :, 2::-1] for frame in video[:-1]]
+            indices = _get_frame_indices(start, stop, step, timestamps, cap.get(cv2.CAP_PROP_FPS))
+            if output == "array":
+                res["video"] = _frames_to_array_using_cv2(cap, indices)
+            else:
+                res["video"] = list(_iter_frames_using_cv2(cap, indices))
         if "audio" in which or "all" in which:
             res["audio"] = None
+        cap.release()
         if which == "video":
             return res["video"]
         if which == "audio":
@@ -500,12 +1211,24 @@ def load_video_using_cv2(filename, fs=None, which="video", **kwargs):
             return res["properties"]
         return res
     # If file is not on local filesystem
+    if which == "properties":
+        # Only the headers are downloaded, instead of the whole video
+        try:
+            probe = probe_video(filename, fs=fs)
+        except ValueError:  # unknown format or invalid headers, the video is read instead
+            probe = None
+        if probe is not None and probe["codec"] is not None:
+            codec = probe["codec"].lower()
+            properties = {"fps": probe["fps"], "codec": CV2_CODECS.get(codec, codec)}
+            properties["format"] = _cv2_properties_to_format(properties)
+            return properties
     with _generic_open(filename, 'rb', fs=fs) as f:
-        data = read_video_using_cv2(f, which=which, **kwargs)
+        data = read_video_using_cv2(
+            f, which=which, start=start, stop=stop, step=step, timestamps=timestamps, output=output, **kwargs)
     return data
 
 
-def save_video_using_cv2(filename, data, fs=None, makedirs=False, **kwargs):
+def save_video_using_cv2(filename, data, fs=None, makedirs=False, workers=None, **kwargs):
     """
     Save a video file
     Backend used: cv2.VideoWriter (opencv-python package)
@@ -515,35 +1238,85 @@ def save_video_using_cv2(filename, data, fs=None, makedirs=False, **kwargs):
         data (dict | np.array): video data to save
         fs: file system to use. Defaults to None (local filesystem)
         makedirs (bool): if True, creates directory of filename (default is False)
+        workers (int): number of threads encoding the video: the video is split in segments encoded in
+            parallel, then concatenated (mp4 and avi only). Defaults to None (single thread)
         **kwargs: same as in 'cv2.VideoWriter'
     """
     if not isinstance(data, _Video):
         data, kwargs = _insert_properties_in_data(filename, data, kwargs, DEFAULT_PROPERTIES_CV2)
-    if is_localfs(fs):
-        if makedirs:
-            _generic_makedirs(filename)
-        prop = data["properties"]
-        if prop["codec"] is None:
+    segment_size = _get_parallel_segment_size(data, workers)
+    if segment_size is not None:
+        if data["properties"]["codec"] is None:
             raise ValueError("Unknown format, please provide codec")
-        frames = data["video"]
-        height = len(frames[0])
-        width = len(frames[0][0])
-        fourcc = cv2.VideoWriter_fourcc(*prop["codec"])
-        out = cv2.VideoWriter(filename, fourcc, prop["fps"], (width, height), **kwargs)
-        for frame in frames:
-            if frame.ndim != 3:
-                raise ValueError("Frames must be 2D-images.")
-            if frame.shape[2] != 3:
-                raise ValueError("Frames must be 2D-images with 3 color channels.")
-            if "uint8" not in str(frame.dtype):
-                raise ValueError("Frames must be 2D-images with 3 color channels, of type uint8")
-            out.write(frame[:, :, 2::-1])
-        out.release()
+        _save_video_in_parallel(filename, data, kwargs, "cv2", workers, segment_size, fs=fs, makedirs=makedirs)
+    elif is_localfs(fs):
+        with _VideoWriterUsingCv2(filename, data["properties"], kwargs, makedirs=makedirs) as writer:
+            writer.extend(data["video"])
     else:
         with _generic_open(filename, 'wb', fs=fs, makedirs=makedirs) as f:
             write_video_using_cv2(f, data, **kwargs)
 
 
+def iter_video_using_cv2(filename, fs=None, start=None, stop=None, step=None, timestamps=None, prefetch=0, **kwargs):
+    """
+    Iterate over the frames of a video file, decoding them one at a time
+    Backend used: cv2.VideoCapture (opencv-python package)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        prefetch (int): number of frames decoded in advance in a background thread, while the previous
+            frames are used. Defaults to 0 (frames are decoded when requested)
+        **kwargs: same as in 'cv2.VideoCapture'
+
+    Yields:
+        np.array: video frames, in order
+    """
+    if prefetch > 0:
+        yield from _prefetch_frames(iter_video_using_cv2(
+            filename, fs=fs, start=start, stop=stop, step=step, timestamps=timestamps, **kwargs), prefetch)
+        return
+    kwargs = {k: v for k, v in kwargs.items() if k not in {"codec", "format", "fps"}}
+    if is_localfs(fs):
+        temp_context = nullcontext(filename)
+    else:
+        # As far as I know a local filename is required to load a video using cv2
+        size = check_fs(fs).size(filename) if isinstance(filename, str) else None
+        _print_disk_use_warning_using_cv2("reading", size)
+        temp_context = _temp_file(size=size)
+    with temp_context as local_filename:
+        if local_filename != filename:
+            with _generic_open(filename, 'rb', fs=fs) as f, open(local_filename, "wb") as temp_f:
+                shutil.copyfileobj(f, temp_f)
+        cap = cv2.VideoCapture(local_filename, **kwargs)
+        indices = _get_frame_indices(start, stop, step, timestamps, cap.get(cv2.CAP_PROP_FPS))
+        yield from _iter_frames_using_cv2(cap, indices)
+
+
+def open_video_writer_using_cv2(filename, fs=None, makedirs=False, **kwargs):
+    """
+    Open a video file to write frames one at a time, instead of saving all frames at once
+    Backend used: cv2.VideoWriter (opencv-python package)
+
+    Args:
+        filename (str): file name to save data to
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+        **kwargs: same as in 'cv2.VideoWriter'
+
+    Returns:
+        video writer: writer with methods 'append(frame)', 'extend(frames)' and 'close()'.
+            It can be used in a 'with' statement, the video is then closed automatically
+    """
+    data, kwargs = _insert_properties_in_data(filename, None, kwargs, DEFAULT_PROPERTIES_CV2)
+    return _VideoWriterUsingCv2(filename, data["properties"], kwargs, fs=fs, makedirs=makedirs)
+
+
 def help_video_using_cv2():
     """
     Print help for video io using cv2 library
@@ -556,32 +1329,55 @@ def help_video_using_cv2():
 # +------------------+
 
 
-def decode_video(data, which="video", **kwargs):
+def _video_default(function_name, using_imageio, using_cv2):
+    """
+    Default backend of a video function: imageio, or else cv2
+    """
+    warning_msg = _warning_msg_default_sev(function_name, ["imageio", "imageio-ffmpeg"], using_cv2.__name__)
+    backends = [(imageio, using_imageio, None), (cv2, using_cv2, warning_msg)]
+    return _DefaultBackend(
+        backends, _error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+
+
+_decode_video_default = _video_default("decode_video", decode_video_using_imageio, decode_video_using_cv2)
+_encode_video_default = _video_default("encode_video", encode_video_using_imageio, encode_video_using_cv2)
+_read_video_default = _video_default("read_video", read_video_using_imageio, read_video_using_cv2)
+_write_video_default = _video_default("write_video", write_video_using_imageio, write_video_using_cv2)
+_load_video_default = _video_default("load_video", load_video_using_imageio, load_video_using_cv2)
+_save_video_default = _video_default("save_video", save_video_using_imageio, save_video_using_cv2)
+_iter_video_default = _video_default("iter_video", iter_video_using_imageio, iter_video_using_cv2)
+_open_video_writer_default = _video_default(
+    "open_video_writer", open_video_writer_using_imageio, open_video_writer_using_cv2)
+
+
+def decode_video(data, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs):
     """
     Decode video data from bytes
     It tries the following libraries (in the same order):
         imageio.get_reader
         cv2.VideoCapture
-    If 'imageio.get_reader' does not work, a warning is printed since this function may have a
+    If 'imageio.get_reader' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
         data (bytes): video data to decode
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data decoded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    if not isinstance(imageio, _EmptyModule):
-        return decode_video_using_imageio(data, which=which, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("decode_video", ["imageio", "imageio-ffmpeg"], "decode_video_using_cv2"))
-        return decode_video_using_cv2(data, which=which, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _decode_video_default(
+        data, which=which, start=start, stop=stop, step=step, timestamps=timestamps, output=output, **kwargs)
 
 
 def encode_video(data, **kwargs):
@@ -590,7 +1386,7 @@ def encode_video(data, **kwargs):
     It tries the following libraries (in the same order):
         imageio.get_writer
         cv2.VideoWriter
-    If 'imageio.get_writer' does not work, a warning is printed since this function may have a
+    If 'imageio.get_writer' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -600,41 +1396,37 @@ def encode_video(data, **kwargs):
     Returns:
         bytes: video data encoded
     """
-    if not isinstance(imageio, _EmptyModule):
-        return encode_video_using_imageio(data, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("encode_video", ["imageio", "imageio-ffmpeg"], "encode_video_using_cv2"))
-        return encode_video_using_cv2(data, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _encode_video_default(data, **kwargs)
 
 
-def read_video(openfile, which="video", **kwargs):
+def read_video(openfile, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs):
     """
     Read an open video file
     It tries the following libraries (in the same order):
         imageio.get_reader
         cv2.VideoCapture
-    If 'imageio.get_reader' does not work, a warning is printed since this function may have a
+    If 'imageio.get_reader' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
         openfile (file-like): file to read, must have been opened
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data read, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    if not isinstance(imageio, _EmptyModule):
-        return read_video_using_imageio(openfile, which=which, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("read_video", ["imageio", "imageio-ffmpeg"], "read_video_using_cv2"))
-        return read_video_using_cv2(openfile, which=which, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _read_video_default(
+        openfile, which=which, start=start, stop=stop, step=step, timestamps=timestamps, output=output, **kwargs)
 
 
 def write_video(openfile, data, **kwargs):
@@ -643,7 +1435,7 @@ def write_video(openfile, data, **kwargs):
     It tries the following libraries (in the same order):
         imageio.get_writer
         cv2.VideoWriter
-    If 'imageio.get_writer' does not work, a warning is printed since this function may have a
+    If 'imageio.get_writer' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -651,22 +1443,18 @@ def write_video(openfile, data, **kwargs):
         data (dict | np.array): video data to write
         **kwargs: same as in 'imageio.get_writer'
     """
-    if not isinstance(imageio, _EmptyModule):
-        return write_video_using_imageio(openfile, data, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("write_video", ["imageio", "imageio-ffmpeg"], "write_video_using_cv2"))
-        return write_video_using_cv2(openfile, data, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _write_video_default(openfile, data, **kwargs)
 
 
-def load_video(filename, fs=None, which="video", **kwargs):
+def load_video(
+    filename, fs=None, which="video", start=None, stop=None, step=None, timestamps=None, output="list", **kwargs
+):
     """
     Load a video file
     It tries the following libraries (in the same order):
         imageio.get_reader
         cv2.VideoCapture
-    If 'imageio.get_reader' does not work, a warning is printed since this function may have a
+    If 'imageio.get_reader' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -674,28 +1462,31 @@ def load_video(filename, fs=None, which="video", **kwargs):
         fs: file system to use. Defaults to None (local filesystem)
         which (str | list): which data to load, either 'video', 'audio', 'properties' or 'all'.
             Can also be a list of these str (example: which=['audio', 'video']). Defaults to 'video'
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        output (str): 'list' to load the video as a list of frames, 'array' to load it as a single np.array
+            of shape (frames, height, width, channels). Defaults to 'list'
         **kwargs: same as in 'imageio.get_reader'
 
     Returns:
         dict: video data loaded, as a dict containing the keys 'video', 'audio' and 'properties'.
             If 'which' is a single element (example: which='video'), the dict value is returned instead
     """
-    if not isinstance(imageio, _EmptyModule):
-        return load_video_using_imageio(filename, fs=fs, which=which, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("load_video", ["imageio", "imageio-ffmpeg"], "load_video_using_cv2"))
-        return load_video_using_cv2(filename, fs=fs, which=which, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _load_video_default(
+        filename, fs=fs, which=which, start=start, stop=stop, step=step,
+        timestamps=timestamps, output=output, **kwargs)
 
 
-def save_video(filename, data, fs=None, makedirs=False, **kwargs):
+def save_video(filename, data, fs=None, makedirs=False, workers=None, **kwargs):
     """
     Save a video file
     It tries the following libraries (in the same order):
         imageio.get_writer
         cv2.VideoWriter
-    If 'imageio.get_writer' does not work, a warning is printed since this function may have a
+    If 'imageio.get_writer' does not work, a warning is emitted once since this function may have a
     different behavior in other environments
 
     Args:
@@ -703,15 +1494,80 @@ def save_video(filename, data, fs=None, makedirs=False, **kwargs):
         data (dict | np.array): video data to save
         fs: file system to use. Defaults to None (local filesystem)
         makedirs (bool): if True, creates directory of filename (default is False)
+        workers (int): number of threads encoding the video: the video is split in segments encoded in
+            parallel, then concatenated (mp4 and avi only). Defaults to None (single thread)
         **kwargs: same as in 'imageio.get_writer'
     """
-    if not isinstance(imageio, _EmptyModule):
-        return save_video_using_imageio(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    if not isinstance(cv2, _EmptyModule):
-        if settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]:
-            print(_warning_msg_default_sev("save_video", ["imageio", "imageio-ffmpeg"], "save_video_using_cv2"))
-        return save_video_using_cv2(filename, data, fs=fs, makedirs=makedirs, **kwargs)
-    raise ModuleNotFoundError(_error_msg_sev("iotools.videoio", ["imageio", "imageio-ffmpeg"], "opencv-python"))
+    return _save_video_default(filename, data, fs=fs, makedirs=makedirs, workers=workers, **kwargs)
+
+
+def iter_video(filename, fs=None, start=None, stop=None, step=None, timestamps=None, prefetch=0, **kwargs):
+    """
+    Iterate over the frames of a video file, decoding them one at a time
+    It tries the following libraries (in the same order):
+        imageio.get_reader
+        cv2.VideoCapture
+    If 'imageio.get_reader' does not work, a warning is emitted once since this function may have a
+    different behavior in other environments
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+        start (int): index of the first frame to load. Defaults to None (first frame)
+        stop (int): index of the frame to stop at, excluded. Defaults to None (end of the video)
+        step (int): load one frame every 'step' frames. Defaults to None (every frame)
+        timestamps (list): times (in seconds) of the frames to load, instead of start, stop and step.
+            Defaults to None
+        prefetch (int): number of frames decoded in advance in a background thread, while the previous
+            frames are used. Defaults to 0 (frames are decoded when requested)
+        **kwargs: same as in 'imageio.get_reader'
+
+    Yields:
+        np.array: video frames, in order
+    """
+    return _iter_video_default(
+        filename, fs=fs, start=start, stop=stop, step=step, timestamps=timestamps, prefetch=prefetch, **kwargs)
+
+
+def open_video_writer(filename, fs=None, makedirs=False, **kwargs):
+    """
+    Open a video file to write frames one at a time, instead of saving all frames at once
+    It tries the following libraries (in the same order):
+        imageio.get_writer
+        cv2.VideoWriter
+    If 'imageio.get_writer' does not work, a warning is emitted once since this function may have a
+    different behavior in other environments
+
+    Args:
+        filename (str): file name to save data to
+        fs: file system to use. Defaults to None (local filesystem)
+        makedirs (bool): if True, creates directory of filename (default is False)
+        **kwargs: same as in 'imageio.get_writer'
+
+    Returns:
+        video writer: writer with methods 'append(frame)', 'extend(frames)' and 'close()'.
+            It can be used in a 'with' statement, the video is then closed automatically
+    """
+    return _open_video_writer_default(filename, fs=fs, makedirs=makedirs, **kwargs)
+
+
+def probe_video(filename, fs=None):
+    """
+    Load the properties of a video file, reading only its headers (no frame is decoded).
+    On remote file systems, only the bytes of the headers are downloaded, even if they are
+    at the end of the file (mp4 'moov' box). gif files have no such header, so they are read entirely
+    Backend used: none (mp4, avi and gif headers are parsed by iotools)
+
+    Args:
+        filename (str): file name to load
+        fs: file system to use. Defaults to None (local filesystem)
+
+    Returns:
+        dict: video properties, with the keys 'format', 'codec', 'fps', 'nframes', 'duration' (in seconds),
+            'width' and 'height'. Properties missing from the headers are None
+    """
+    with _generic_open(filename, 'rb', fs=fs, block_size=PROBE_BLOCK_SIZE) as f:
+        return _probe_video_file(f)
 
 
 def help_video():
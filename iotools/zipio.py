@@ -4,10 +4,73 @@ See iotools.zipio.help_zip() for more info
 """
 
 import zipfile
+from collections.abc import Mapping
 
 from iotools._help_utils import _help_default
 from iotools._generic_open import _generic_open
-from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes
+from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes, _default_encode_bytes_into
+
+
+class _Zip(Mapping):
+    """
+    Lazy mapping returned by 'load_zip(..., lazy=True)': {filename: bytes}
+    Only the central directory is read when the archive is opened, each member is read (and decompressed)
+    when its filename is accessed. Metadata is available with 'namelist()' and 'getinfo(filename)'
+    """
+
+    def __init__(self, openfile, close_file=False, **kwargs):
+        self.closed = True  # until the archive is opened
+        self._openfile = openfile
+        self._close_file = close_file
+        try:
+            self._zip = zipfile.ZipFile(openfile, **kwargs)
+        except Exception:
+            if close_file:
+                openfile.close()
+            raise
+        self._names = [fn for fn in self._zip.namelist() if not fn.endswith("/")]
+        self.closed = False
+
+    def namelist(self):
+        return list(self._names)
+
+    def getinfo(self, subfilename):
+        return self._zip.getinfo(subfilename)
+
+    def __getitem__(self, subfilename):
+        if subfilename.endswith("/"):
+            raise KeyError(subfilename)
+        with self._zip.open(subfilename, "r") as subf:
+            return subf.read()
+
+    def __contains__(self, subfilename):
+        return subfilename in self._zip.NameToInfo and not subfilename.endswith("/")
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return "<zip archive files={}>".format(self._names)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._zip.close()
+        if self._close_file:
+            self._openfile.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
 
 
 def decode_zip(data, **kwargs):
@@ -40,6 +103,23 @@ def encode_zip(data, **kwargs):
     return _default_encode_bytes(write_zip, data, **kwargs)
 
 
+def encode_zip_into(buffer, data, **kwargs):
+    """
+    Encode zip data in a preallocated buffer, without allocating bytes
+    Backend used: zipfile.ZipFile (zipfile package)
+
+    Args:
+        buffer (bytearray | memoryview | mmap.mmap | numpy.ndarray): writable buffer to encode data into,
+            ValueError is raised if it is too small
+        data (dict{filename: bytes}): zip data to encode
+        **kwargs: same as in 'zipfile.ZipFile'
+
+    Returns:
+        int: number of bytes written at the beginning of buffer
+    """
+    return _default_encode_bytes_into(write_zip, buffer, data, **kwargs)
+
+
 def read_zip(openfile, **kwargs):
     """
     Read a open zip file
@@ -80,7 +160,7 @@ def write_zip(openfile, data, **kwargs):
     z.close()
 
 
-def load_zip(filename, fs=None, **kwargs):
+def load_zip(filename, fs=None, lazy=False, **kwargs):
     """
     Load a zip file
     Backend used: zipfile.ZipFile (zipfile package)
@@ -88,11 +168,17 @@ def load_zip(filename, fs=None, **kwargs):
     Args:
         filename (str): file name to load
         fs: file system to use. Defaults to None (local filesystem)
+        lazy (bool): if True, a mapping is returned instead of a dict, which reads each file when it is accessed:
+            only the central directory of the zip file is read when it is opened (with ranged reads on fsspec
+            file systems). The zip file is then closed with 'close()' (or when exiting a 'with' statement).
+            Defaults to False
         **kwargs: same as in 'zipfile.ZipFile'
 
     Returns:
         dict{filename: bytes}: zip data loaded from the file provided
     """
+    if lazy:
+        return _Zip(_generic_open(filename, 'rb', fs=fs), close_file=True, **kwargs)
     with _generic_open(filename, 'rb', fs=fs) as f:
         data = read_zip(f, **kwargs)
     return data
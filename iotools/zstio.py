@@ -5,7 +5,7 @@ See iotools.zstio.help_zst() for more info
 
 from iotools._help_utils import _help_default
 from iotools._generic_open import _generic_open
-from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes
+from iotools._default_decode_encode import _default_decode_bytes, _default_encode_bytes, _default_encode_bytes_into
 
 try:
     import zstandard
@@ -47,6 +47,23 @@ def encode_zst(data, **kwargs):
     return _default_encode_bytes(write_zst, data, **kwargs)
 
 
+def encode_zst_into(buffer, data, **kwargs):
+    """
+    Encode zst data in a preallocated buffer, without allocating bytes
+    Backend used: zstandard.ZstdCompressor (zstandard package)
+
+    Args:
+        buffer (bytearray | memoryview | mmap.mmap | numpy.ndarray): writable buffer to encode data into,
+            ValueError is raised if it is too small
+        data (bytes | str): zst data to encode
+        **kwargs: same as in 'zstandard.ZstdCompressor'
+
+    Returns:
+        int: number of bytes written at the beginning of buffer
+    """
+    return _default_encode_bytes_into(write_zst, buffer, data, **kwargs)
+
+
 def read_zst(openfile, **kwargs):
     """
     Read a open zst file
@@ -6,11 +6,12 @@ from iotools.bytesio import load_bytes
 from iotools.aviio import (
     decode_avi_using_imageio, encode_avi_using_imageio,
     read_avi_using_imageio, write_avi_using_imageio,
-    load_avi_using_imageio, save_avi_using_imageio, help_avi_using_imageio,
+    load_avi_using_imageio, save_avi_using_imageio, iter_avi_using_imageio, open_avi_writer_using_imageio,
+    help_avi_using_imageio,
     decode_avi_using_cv2, encode_avi_using_cv2,
     read_avi_using_cv2, write_avi_using_cv2,
-    load_avi_using_cv2, save_avi_using_cv2, help_avi_using_cv2,
-    decode_avi, encode_avi, read_avi, write_avi, load_avi, save_avi, help_avi
+    load_avi_using_cv2, save_avi_using_cv2, iter_avi_using_cv2, open_avi_writer_using_cv2, help_avi_using_cv2,
+    decode_avi, encode_avi, read_avi, write_avi, load_avi, save_avi, iter_avi, open_avi_writer, probe_avi, help_avi
 )
 
 
@@ -209,6 +210,25 @@ def test_save_avi_using_imageio():
     os.remove(filename)
 
 
+def test_iter_avi_using_imageio():
+    for i in range(len(data)):
+        filename = FILENAMES_AVI.format(i)
+        ldata = list(iter_avi_using_imageio(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_open_avi_writer_using_imageio():
+    filename = FILENAMES_AVI.format("write")
+    for i in range(len(data)):
+        frames = load_avi_using_imageio(FILENAMES_AVI.format(i))
+        with open_avi_writer_using_imageio(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_avi_using_imageio(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_avi_using_imageio():
     help_avi_using_imageio()
 
@@ -363,6 +383,25 @@ def test_save_avi_using_cv2():
     os.remove(filename)
 
 
+def test_iter_avi_using_cv2():
+    for i in range(len(data)):
+        filename = FILENAMES_AVI.format(i)
+        ldata = list(iter_avi_using_cv2(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_open_avi_writer_using_cv2():
+    filename = FILENAMES_AVI.format("write")
+    for i in range(len(data)):
+        frames = load_avi_using_cv2(FILENAMES_AVI.format(i))
+        with open_avi_writer_using_cv2(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_avi_using_cv2(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_avi_using_cv2():
     help_avi_using_cv2()
 
@@ -513,5 +552,34 @@ def test_save_avi():
     os.remove(filename)
 
 
+def test_iter_avi():
+    for i in range(len(data)):
+        filename = FILENAMES_AVI.format(i)
+        ldata = list(iter_avi(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_probe_avi():
+    for i in range(len(data)):
+        filename = FILENAMES_AVI.format(i)
+        properties = probe_avi(filename)
+        assert properties["format"] == "avi"
+        assert properties["nframes"] == len(data[i])
+        assert (properties["width"], properties["height"]) == (48, 32)
+        assert abs(properties["fps"] - 3) < 0.1
+
+
+def test_open_avi_writer():
+    filename = FILENAMES_AVI.format("write")
+    for i in range(len(data)):
+        frames = load_avi(FILENAMES_AVI.format(i))
+        with open_avi_writer(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_avi(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_avi():
     help_avi()
@@ -6,8 +6,9 @@ from iotools.bytesio import load_bytes
 from iotools.gifio import (
     decode_gif_using_imageio, encode_gif_using_imageio,
     read_gif_using_imageio, write_gif_using_imageio,
-    load_gif_using_imageio, save_gif_using_imageio, help_gif_using_imageio,
-    decode_gif, encode_gif, read_gif, write_gif, load_gif, save_gif, help_gif
+    load_gif_using_imageio, save_gif_using_imageio, iter_gif_using_imageio, open_gif_writer_using_imageio,
+    help_gif_using_imageio,
+    decode_gif, encode_gif, read_gif, write_gif, load_gif, save_gif, iter_gif, open_gif_writer, probe_gif, help_gif
 )
 
 
@@ -206,6 +207,25 @@ def test_save_gif_using_imageio():
     os.remove(filename)
 
 
+def test_iter_gif_using_imageio():
+    for i in range(len(data)):
+        filename = FILENAMES_GIF.format(i)
+        ldata = list(iter_gif_using_imageio(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_open_gif_writer_using_imageio():
+    filename = FILENAMES_GIF.format("write")
+    for i in range(len(data)):
+        frames = load_gif_using_imageio(FILENAMES_GIF.format(i))
+        with open_gif_writer_using_imageio(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_gif_using_imageio(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_gif_using_imageio():
     help_gif_using_imageio()
 
@@ -356,5 +376,34 @@ def test_save_gif():
     os.remove(filename)
 
 
+def test_iter_gif():
+    for i in range(len(data)):
+        filename = FILENAMES_GIF.format(i)
+        ldata = list(iter_gif(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_probe_gif():
+    for i in range(len(data)):
+        filename = FILENAMES_GIF.format(i)
+        properties = probe_gif(filename)
+        assert properties["format"] == "gif"
+        assert properties["nframes"] == len(data[i])
+        assert (properties["width"], properties["height"]) == (48, 32)
+        assert abs(properties["fps"] - 3) < 0.1
+
+
+def test_open_gif_writer():
+    filename = FILENAMES_GIF.format("write")
+    for i in range(len(data)):
+        frames = load_gif(FILENAMES_GIF.format(i))
+        with open_gif_writer(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_gif(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_gif():
     help_gif()
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+
+from iotools.bytesio import load_bytes
+from iotools.simplified.npzio import decode_npz, encode_npz, read_npz, write_npz, load_npz, save_npz
+
+
+TEST_DATA_PATH = "tests/data_for_tests/"
+
+FILENAMES_NPZ = os.path.join(TEST_DATA_PATH, "npz", "example_npz_{}.npz")
+
+data = {}
+data[0] = {"x": np.asarray([1, 3]), "y": np.asarray([[1, 2, 3.6], [4, 7.6, 8.89]])}
+data[1] = {"features": np.arange(24, dtype=np.float32).reshape(4, 6), "labels": np.asarray([0, 1, 1, 0])}
+
+
+def _equal(ldata, data):
+    return set(ldata) == set(data) and all(np.array_equal(ldata[k], v) for k, v in data.items())
+
+
+def test_help_decode_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        txt = load_bytes(filename)
+        ldata = decode_npz(txt)
+        assert _equal(ldata, data[i]), "Error while decoding npz file nbr {}".format(i)
+
+
+def test_help_encode_npz():
+    for i in range(len(data)):
+        txt = encode_npz(data[i], compress=i == 1)
+        ldata = decode_npz(txt)
+        assert _equal(ldata, data[i]), "Error while encoding npz file nbr {}".format(i)
+
+
+def test_help_read_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        with open(filename, "rb") as f:
+            ldata = read_npz(f)
+        assert _equal(ldata, data[i]), "Error while reading npz file nbr {}".format(i)
+
+
+def test_help_write_npz():
+    filename = FILENAMES_NPZ.format("write")
+    for i in range(len(data)):
+        with open(filename, "wb") as f:
+            write_npz(f, data[i])
+        with open(filename, "rb") as f:
+            ldata = read_npz(f)
+        assert _equal(ldata, data[i]), "Error while writing npz file nbr {}".format(i)
+    os.remove(filename)
+
+
+def test_help_load_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        ldata = load_npz(filename)
+        assert _equal(ldata, data[i]), "Error while loading npz file nbr {}".format(i)
+
+
+def test_help_save_npz():
+    filename = FILENAMES_NPZ.format("write")
+    for i in range(len(data)):
+        save_npz(filename, data[i], compress=i == 1)
+        ldata = load_npz(filename)
+        assert _equal(ldata, data[i]), "Error while saving npz file nbr {}".format(i)
+    os.remove(filename)
+
+
+def test_help_examples_npz():
+    save_npz("filename.npz", data[0])
+    import iotools.examples.examples_npz  # noqa
+    os.remove("filename.npz")
@@ -1,23 +1,36 @@
 
 import os
+import subprocess
+import sys
+import tempfile
+import warnings
 import numpy as np
 import PIL.Image as PilImage
+from fsspec.implementations.memory import MemoryFileSystem
 
 from iotools.bytesio import load_bytes
+from iotools.settings import settings
+from iotools._default_backend import _DefaultBackend
+from iotools._missing_module_helper import _EmptyModule
 from iotools.imageio import (
     decode_image_using_imageio, encode_image_using_imageio,
     read_image_using_imageio, write_image_using_imageio,
     load_image_using_imageio, save_image_using_imageio, help_image_using_imageio,
+    decode_images_using_imageio, load_images_using_imageio,
     decode_image_using_skimage, encode_image_using_skimage,
     read_image_using_skimage, write_image_using_skimage,
     load_image_using_skimage, save_image_using_skimage, help_image_using_skimage,
+    decode_images_using_skimage, load_images_using_skimage,
     decode_image_using_pil, encode_image_using_pil,
     read_image_using_pil, write_image_using_pil,
     load_image_using_pil, save_image_using_pil, help_image_using_pil,
+    decode_images_using_pil, load_images_using_pil,
     decode_image_using_cv2, encode_image_using_cv2,
     read_image_using_cv2, write_image_using_cv2,
     load_image_using_cv2, save_image_using_cv2, help_image_using_cv2,
-    decode_image, encode_image, read_image, write_image, load_image, save_image, help_image
+    decode_images_using_cv2, load_images_using_cv2,
+    decode_image, encode_image, read_image, write_image, load_image, save_image, help_image,
+    decode_images, load_images, probe_image, autotune, IMAGE_BACKENDS
 )
 
 
@@ -62,6 +75,17 @@ for i in range(4):
     data_png[i] = image[i].copy()
 
 
+def _large_jpg(filename=None):
+    # DCT scaling needs images larger than the 8x8 jpg blocks
+    img = np.zeros((48, 64, 3), dtype=np.uint8)
+    img[:, :, 0] = np.arange(64)[np.newaxis, :] * 4
+    img[:, :, 1] = np.arange(48)[:, np.newaxis] * 5
+    if filename is not None:
+        PilImage.fromarray(img).save(filename, format="jpeg")
+        return img
+    return img, encode_image_using_pil(PilImage.fromarray(img), format="jpg")
+
+
 def _format_image(img):
     if not isinstance(img, np.ndarray):
         img = np.asarray(img)
@@ -174,6 +198,28 @@ def test_save_image_using_imageio():
         os.remove(filename)
 
 
+def test_decode_images_using_imageio():
+    for filenames_image, data, ext in read_list_of_args:
+        rawbytes = [load_bytes(filenames_image.format(i)) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = decode_images_using_imageio(rawbytes, workers=workers)
+            assert len(ldata) == len(data), "Error while decoding {} images".format(ext)
+            for i in range(len(data)):
+                expected = decode_image_using_imageio(rawbytes[i])
+                assert np.array_equal(ldata[i], expected), "Error while decoding image nbr {}{}".format(i, ext)
+
+
+def test_load_images_using_imageio():
+    for filenames_image, data, ext in read_list_of_args:
+        filenames = [filenames_image.format(i) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = load_images_using_imageio(filenames, workers=workers)
+            assert len(ldata) == len(data), "Error while loading {} images".format(ext)
+            for i in range(len(data)):
+                expected = load_image_using_imageio(filenames[i])
+                assert np.array_equal(ldata[i], expected), "Error while loading image nbr {}{}".format(i, ext)
+
+
 def test_help_image_using_imageio():
     help_image_using_imageio()
 
@@ -257,6 +303,28 @@ def test_save_image_using_skimage():
         os.remove(filename)
 
 
+def test_decode_images_using_skimage():
+    for filenames_image, data, ext in read_list_of_args:
+        rawbytes = [load_bytes(filenames_image.format(i)) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = decode_images_using_skimage(rawbytes, workers=workers)
+            assert len(ldata) == len(data), "Error while decoding {} images".format(ext)
+            for i in range(len(data)):
+                expected = decode_image_using_skimage(rawbytes[i])
+                assert np.array_equal(ldata[i], expected), "Error while decoding image nbr {}{}".format(i, ext)
+
+
+def test_load_images_using_skimage():
+    for filenames_image, data, ext in read_list_of_args:
+        filenames = [filenames_image.format(i) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = load_images_using_skimage(filenames, workers=workers)
+            assert len(ldata) == len(data), "Error while loading {} images".format(ext)
+            for i in range(len(data)):
+                expected = load_image_using_skimage(filenames[i])
+                assert np.array_equal(ldata[i], expected), "Error while loading image nbr {}{}".format(i, ext)
+
+
 def test_help_image_using_skimage():
     help_image_using_skimage()
 
@@ -331,6 +399,17 @@ def test_load_image_using_pil():
                 assert _image_distance(ldata, data[i]) == 0, "Error while loading image file nbr {}{}".format(i, ext)
 
 
+def test_decode_image_using_pil_reduced():
+    img, rawbytes = _large_jpg()
+    for kwargs, shape in [({}, (48, 64)), ({"scale": 1 / 2}, (24, 32)), ({"scale": 1 / 8}, (6, 8)),
+                          ({"max_size": 12}, (12, 16)), ({"max_size": 17}, (24, 32))]:
+        ldata = np.asarray(decode_image_using_pil(rawbytes, **kwargs))
+        assert ldata.shape[:2] == shape, "Error while decoding reduced image with {}".format(kwargs)
+    small = np.asarray(decode_image_using_pil(rawbytes, scale=1 / 4))
+    expected = np.asarray(PilImage.fromarray(img).resize((16, 12), PilImage.BOX))
+    assert np.abs(small.astype(int) - expected).mean() < 8, "Error while decoding reduced image"
+
+
 def test_save_image_using_pil():
     for filenames_image, data, ext, kwargs in write_list_of_args:
         filename = filenames_image.format("write")
@@ -346,6 +425,28 @@ def test_save_image_using_pil():
         os.remove(filename)
 
 
+def test_decode_images_using_pil():
+    for filenames_image, data, ext in read_list_of_args:
+        rawbytes = [load_bytes(filenames_image.format(i)) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = decode_images_using_pil(rawbytes, workers=workers)
+            assert len(ldata) == len(data), "Error while decoding {} images".format(ext)
+            for i in range(len(data)):
+                expected = decode_image_using_pil(rawbytes[i])
+                assert np.array_equal(ldata[i], expected), "Error while decoding image nbr {}{}".format(i, ext)
+
+
+def test_load_images_using_pil():
+    for filenames_image, data, ext in read_list_of_args:
+        filenames = [filenames_image.format(i) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = load_images_using_pil(filenames, workers=workers)
+            assert len(ldata) == len(data), "Error while loading {} images".format(ext)
+            for i in range(len(data)):
+                expected = load_image_using_pil(filenames[i])
+                assert np.array_equal(ldata[i], expected), "Error while loading image nbr {}{}".format(i, ext)
+
+
 def test_help_image_using_pil():
     help_image_using_pil()
 
@@ -422,6 +523,32 @@ def test_load_image_using_cv2():
                 assert _image_distance(ldata, data[i]) == 0, "Error while loading image file nbr {}{}".format(i, ext)
 
 
+def test_load_image_using_cv2_reduced():
+    filename = FILENAMES_JPG.format("write")
+    _large_jpg(filename)
+    for kwargs, shape in [({}, (48, 64)), ({"scale": 1 / 2}, (24, 32)), ({"scale": 1 / 8}, (6, 8)),
+                          ({"max_size": 12}, (12, 16)), ({"max_size": 17}, (24, 32))]:
+        ldata = load_image_using_cv2(filename, **kwargs)
+        assert ldata.shape[:2] == shape, "Error while loading reduced image with {}".format(kwargs)
+    for decode in [lambda **kwargs: load_image_using_cv2(filename, **kwargs),
+                   lambda **kwargs: decode_image_using_cv2(load_bytes(filename), **kwargs)]:
+        try:
+            decode(scale=1 / 2, flags=0)
+            raise AssertionError("'flags' cannot be used with 'scale'")
+        except ValueError:
+            pass
+    os.remove(filename)
+
+
+def test_load_image_using_cv2_flags():
+    filename = FILENAMES_PNG.format("write")
+    PilImage.fromarray(np.zeros((4, 5, 4), dtype=np.uint8)).save(filename)
+    assert load_image_using_cv2(filename).shape == (4, 5, 3), "cv2.imread must convert images to BGR by default"
+    assert load_image_using_cv2(filename, flags=-1).shape == (4, 5, 4), "Error while loading image with flags"
+    assert decode_image_using_cv2(load_bytes(filename)).shape == (4, 5, 4), "cv2.imdecode must keep alpha channel"
+    os.remove(filename)
+
+
 def test_save_image_using_cv2():
     for filenames_image, data, ext, kwargs in write_list_of_args:
         filename = filenames_image.format("write")
@@ -435,6 +562,28 @@ def test_save_image_using_cv2():
         os.remove(filename)
 
 
+def test_decode_images_using_cv2():
+    for filenames_image, data, ext in read_list_of_args:
+        rawbytes = [load_bytes(filenames_image.format(i)) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = decode_images_using_cv2(rawbytes, workers=workers)
+            assert len(ldata) == len(data), "Error while decoding {} images".format(ext)
+            for i in range(len(data)):
+                expected = decode_image_using_cv2(rawbytes[i])
+                assert np.array_equal(ldata[i], expected), "Error while decoding image nbr {}{}".format(i, ext)
+
+
+def test_load_images_using_cv2():
+    for filenames_image, data, ext in read_list_of_args:
+        filenames = [filenames_image.format(i) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = load_images_using_cv2(filenames, workers=workers)
+            assert len(ldata) == len(data), "Error while loading {} images".format(ext)
+            for i in range(len(data)):
+                expected = load_image_using_cv2(filenames[i])
+                assert np.array_equal(ldata[i], expected), "Error while loading image nbr {}{}".format(i, ext)
+
+
 def test_help_image_using_cv2():
     help_image_using_cv2()
 
@@ -505,6 +654,17 @@ def test_load_image():
                 assert _image_distance(ldata, data[i]) == 0, "Error while loading image file nbr {}{}".format(i, ext)
 
 
+def test_decode_image_reduced():
+    img, rawbytes = _large_jpg()
+    for kwargs, shape in [({}, (48, 64)), ({"scale": 1 / 2}, (24, 32)), ({"scale": 1 / 8}, (6, 8)),
+                          ({"max_size": 12}, (12, 16)), ({"max_size": 17}, (24, 32))]:
+        ldata = np.asarray(decode_image(rawbytes, **kwargs))
+        assert ldata.shape[:2] == shape, "Error while decoding reduced image with {}".format(kwargs)
+    small = np.asarray(decode_image(rawbytes, scale=1 / 4))
+    expected = np.asarray(PilImage.fromarray(img).resize((16, 12), PilImage.BOX))
+    assert np.abs(small.astype(int) - expected).mean() < 8, "Error while decoding reduced image"
+
+
 def test_save_image():
     for filenames_image, data, ext, kwargs in write_list_of_args:
         filename = filenames_image.format("write")
@@ -518,5 +678,138 @@ def test_save_image():
         os.remove(filename)
 
 
+def test_decode_images():
+    for filenames_image, data, ext in read_list_of_args:
+        rawbytes = [load_bytes(filenames_image.format(i)) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = decode_images(rawbytes, workers=workers)
+            assert len(ldata) == len(data), "Error while decoding {} images".format(ext)
+            for i in range(len(data)):
+                expected = decode_image(rawbytes[i])
+                assert np.array_equal(ldata[i], expected), "Error while decoding image nbr {}{}".format(i, ext)
+
+
+def test_load_images():
+    for filenames_image, data, ext in read_list_of_args:
+        filenames = [filenames_image.format(i) for i in range(len(data))]
+        for workers in [1, 4]:
+            ldata = load_images(filenames, workers=workers)
+            assert len(ldata) == len(data), "Error while loading {} images".format(ext)
+            for i in range(len(data)):
+                expected = load_image(filenames[i])
+                assert np.array_equal(ldata[i], expected), "Error while loading image nbr {}{}".format(i, ext)
+
+
+def test_probe_image():
+    memfs = MemoryFileSystem()
+    for filenames_image, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_image.format(i)
+            properties = probe_image(filename)
+            image_pil = load_image_using_pil(filename)
+            assert properties["format"] == ext
+            assert (properties["width"], properties["height"]) == image_pil.size
+            assert properties["channels"] == len(image_pil.getbands())
+            assert properties["bit_depth"] == 8
+            memfs.pipe("/probe/image." + ext, load_bytes(filename))
+            assert probe_image("/probe/image." + ext, fs=memfs) == properties
+    memfs.rm("/probe", recursive=True)
+
+
+def test_image_backends_imported_lazily():
+    # a fresh interpreter is needed, since backends are already imported by the other tests
+    code = "import sys; from iotools import imageio, jpgio, pngio; " \
+           "print(sorted(set(sys.modules) & {'cv2', 'imageio', 'PIL', 'skimage'}))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]", "Backends imported with the module: {}".format(output)
+
+
+def test_default_backend_warning():
+    rawbytes = load_bytes(FILENAMES_PNG.format(0))
+    backends = [(_EmptyModule("imageio"), decode_image_using_imageio, None), (np, decode_image_using_pil, "pil used")]
+    backend = _DefaultBackend(backends, "error")
+    show_warnings = settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"]
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"] = True
+            for _ in range(3):
+                assert _image_distance(backend(rawbytes), image[0]) == 0
+            assert [str(w.message) for w in caught] == ["pil used"], "Warning must be emitted once"
+            settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"] = True  # the backend is selected again when settings change
+            backend(rawbytes)
+            assert len(caught) == 2
+            settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"] = False
+            backend(rawbytes)
+            assert len(caught) == 2
+    finally:
+        settings["SHOW_DEFAULT_BEHAVIOR_WARNINGS"] = show_warnings
+    backend = _DefaultBackend([(_EmptyModule("imageio"), decode_image_using_imageio, None)], "no backend installed")
+    try:
+        backend(rawbytes)
+        assert False, "An error must be raised when no backend is installed"
+    except ModuleNotFoundError as e:
+        assert str(e) == "no backend installed"
+
+
+def test_settings_version():
+    saved = dict(settings)
+    try:
+        for modify in [
+            lambda: settings.pop("IMAGE_BACKEND"), lambda: settings.setdefault("IMAGE_BACKEND", None),
+            lambda: settings.popitem(), settings.clear, lambda: settings.update(saved),
+        ]:
+            version = settings.version
+            modify()
+            assert settings.version > version, "Settings version must change when settings are modified"
+        version = settings.version
+        settings.setdefault("IMAGE_BACKEND", "pil")
+        assert settings.version == version and settings["IMAGE_BACKEND"] is None
+        merged = settings
+        merged |= {"IMAGE_BACKEND": "pil"}
+        assert merged is settings and settings.version > version and settings["IMAGE_BACKEND"] == "pil"
+    finally:
+        settings.clear()
+        settings.update(saved)
+
+
+def test_autotune():
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    image_backend = settings["IMAGE_BACKEND"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["XDG_CACHE_HOME"] = tmpdir
+        try:
+            results = autotune(force=True)
+            assert set(results) == {"decode", "encode"}
+            assert set(results["decode"]) == set(results["encode"]) == {"jpg", "png"}
+            assert all(backend in IMAGE_BACKENDS for r in results.values() for backend in r.values())
+            assert os.path.isfile(os.path.join(tmpdir, "iotools", "image_backends.json"))
+            assert autotune() == results, "Results must be loaded from the cache file"
+            # With 'auto', any backend returns the same images as imageio
+            settings["IMAGE_BACKEND"] = "auto"
+            for filenames_image, data, ext in read_list_of_args:
+                for i in range(len(data)):
+                    filename = filenames_image.format(i)
+                    expected = load_image_using_imageio(filename)
+                    rawbytes = load_bytes(filename)
+                    buffers = [memoryview(rawbytes), np.frombuffer(rawbytes, dtype=np.uint8)]
+                    for ldata in [
+                        load_image(filename), decode_image(rawbytes), load_images([filename])[0],
+                        *[decode_image(buffer) for buffer in buffers], *decode_images(buffers)
+                    ]:
+                        assert ldata.shape == expected.shape, "Error while loading image nbr {}{}".format(i, ext)
+                        assert _image_distance(ldata, expected) < 4, "Error while loading image nbr {}{}".format(i, ext)
+                    filename = filenames_image.format("write")
+                    save_image(filename, expected)
+                    assert _image_distance(load_image_using_imageio(filename), expected) < 32
+                    os.remove(filename)
+        finally:
+            settings["IMAGE_BACKEND"] = image_backend
+            if cache_home is None:
+                del os.environ["XDG_CACHE_HOME"]
+            else:
+                os.environ["XDG_CACHE_HOME"] = cache_home
+
+
 def test_help_image():
     help_image()
@@ -8,16 +8,21 @@ from iotools.jpgio import (
     decode_jpg_using_imageio, encode_jpg_using_imageio,
     read_jpg_using_imageio, write_jpg_using_imageio,
     load_jpg_using_imageio, save_jpg_using_imageio, help_jpg_using_imageio,
+    decode_jpgs_using_imageio, load_jpgs_using_imageio,
     decode_jpg_using_skimage, encode_jpg_using_skimage,
     read_jpg_using_skimage, write_jpg_using_skimage,
     load_jpg_using_skimage, save_jpg_using_skimage, help_jpg_using_skimage,
+    decode_jpgs_using_skimage, load_jpgs_using_skimage,
     decode_jpg_using_pil, encode_jpg_using_pil,
     read_jpg_using_pil, write_jpg_using_pil,
     load_jpg_using_pil, save_jpg_using_pil, help_jpg_using_pil,
+    decode_jpgs_using_pil, load_jpgs_using_pil,
     decode_jpg_using_cv2, encode_jpg_using_cv2,
     read_jpg_using_cv2, write_jpg_using_cv2,
     load_jpg_using_cv2, save_jpg_using_cv2, help_jpg_using_cv2,
-    decode_jpg, encode_jpg, read_jpg, write_jpg, load_jpg, save_jpg, help_jpg
+    decode_jpgs_using_cv2, load_jpgs_using_cv2,
+    decode_jpg, encode_jpg, read_jpg, write_jpg, load_jpg, save_jpg, help_jpg,
+    decode_jpgs, load_jpgs, probe_jpg
 )
 
 
@@ -136,6 +141,22 @@ def test_save_jpg_using_imageio():
     os.remove(filename)
 
 
+def test_decode_jpgs_using_imageio():
+    rawbytes = [load_bytes(FILENAMES_JPG.format(i)) for i in range(len(data))]
+    ldata = decode_jpgs_using_imageio(rawbytes)
+    for i in range(len(data)):
+        expected = decode_jpg_using_imageio(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding jpg image nbr {}".format(i)
+
+
+def test_load_jpgs_using_imageio():
+    filenames = [FILENAMES_JPG.format(i) for i in range(len(data))]
+    ldata = load_jpgs_using_imageio(filenames)
+    for i in range(len(data)):
+        expected = load_jpg_using_imageio(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading jpg image nbr {}".format(i)
+
+
 def test_help_jpg_using_imageio():
     help_jpg_using_imageio()
 
@@ -198,6 +219,22 @@ def test_save_jpg_using_skimage():
     os.remove(filename)
 
 
+def test_decode_jpgs_using_skimage():
+    rawbytes = [load_bytes(FILENAMES_JPG.format(i)) for i in range(len(data))]
+    ldata = decode_jpgs_using_skimage(rawbytes)
+    for i in range(len(data)):
+        expected = decode_jpg_using_skimage(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding jpg image nbr {}".format(i)
+
+
+def test_load_jpgs_using_skimage():
+    filenames = [FILENAMES_JPG.format(i) for i in range(len(data))]
+    ldata = load_jpgs_using_skimage(filenames)
+    for i in range(len(data)):
+        expected = load_jpg_using_skimage(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading jpg image nbr {}".format(i)
+
+
 def test_help_jpg_using_skimage():
     help_jpg_using_skimage()
 
@@ -266,6 +303,22 @@ def test_save_jpg_using_pil():
     os.remove(filename)
 
 
+def test_decode_jpgs_using_pil():
+    rawbytes = [load_bytes(FILENAMES_JPG.format(i)) for i in range(len(data))]
+    ldata = decode_jpgs_using_pil(rawbytes)
+    for i in range(len(data)):
+        expected = decode_jpg_using_pil(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding jpg image nbr {}".format(i)
+
+
+def test_load_jpgs_using_pil():
+    filenames = [FILENAMES_JPG.format(i) for i in range(len(data))]
+    ldata = load_jpgs_using_pil(filenames)
+    for i in range(len(data)):
+        expected = load_jpg_using_pil(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading jpg image nbr {}".format(i)
+
+
 def test_help_jpg_using_pil():
     help_jpg_using_pil()
 
@@ -334,6 +387,22 @@ def test_save_jpg_using_cv2():
     os.remove(filename)
 
 
+def test_decode_jpgs_using_cv2():
+    rawbytes = [load_bytes(FILENAMES_JPG.format(i)) for i in range(len(data))]
+    ldata = decode_jpgs_using_cv2(rawbytes)
+    for i in range(len(data)):
+        expected = decode_jpg_using_cv2(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding jpg image nbr {}".format(i)
+
+
+def test_load_jpgs_using_cv2():
+    filenames = [FILENAMES_JPG.format(i) for i in range(len(data))]
+    ldata = load_jpgs_using_cv2(filenames)
+    for i in range(len(data)):
+        expected = load_jpg_using_cv2(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading jpg image nbr {}".format(i)
+
+
 def test_help_jpg_using_cv2():
     help_jpg_using_cv2()
 
@@ -386,6 +455,29 @@ def test_load_jpg():
         assert _image_distance(ldata, data[i]) < 32, "Error while loading jpg image nbr {}".format(i)
 
 
+def test_load_jpg_reduced():
+    filename = FILENAMES_JPG.format("write")
+    PilImage.fromarray(np.zeros((48, 64, 3), dtype=np.uint8)).save(filename, format="jpeg")
+    for kwargs, shape in [({}, (48, 64)), ({"scale": 1 / 4}, (12, 16)), ({"max_size": 17}, (24, 32))]:
+        ldata = load_jpg(filename, **kwargs)
+        assert ldata.shape[:2] == shape, "Error while loading reduced jpg image with {}".format(kwargs)
+    os.remove(filename)
+
+
+def test_save_jpg_check_alpha(capsys):
+    filename = FILENAMES_JPG.format("write")
+    img = data[0].copy()
+    save_jpg(filename, img)
+    assert "alpha channel" not in capsys.readouterr().out
+    img[0, 0, 3] = 0
+    save_jpg(filename, img)
+    assert "alpha channel" in capsys.readouterr().out
+    save_jpg(filename, img, check_alpha=False)
+    assert "alpha channel" not in capsys.readouterr().out
+    assert _image_distance(load_jpg(filename), data[0]) < 32, "Error while saving jpg image without alpha check"
+    os.remove(filename)
+
+
 def test_save_jpg():
     filename = FILENAMES_JPG.format("write")
     for kwargs in [{}, {"quality": 95}]:
@@ -396,5 +488,28 @@ def test_save_jpg():
     os.remove(filename)
 
 
+def test_decode_jpgs():
+    rawbytes = [load_bytes(FILENAMES_JPG.format(i)) for i in range(len(data))]
+    ldata = decode_jpgs(rawbytes)
+    for i in range(len(data)):
+        expected = decode_jpg(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding jpg image nbr {}".format(i)
+
+
+def test_load_jpgs():
+    filenames = [FILENAMES_JPG.format(i) for i in range(len(data))]
+    ldata = load_jpgs(filenames)
+    for i in range(len(data)):
+        expected = load_jpg(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading jpg image nbr {}".format(i)
+
+
+def test_probe_jpg():
+    for i in range(len(data)):
+        properties = probe_jpg(FILENAMES_JPG.format(i))
+        assert properties["format"] == "jpg"
+        assert (properties["height"], properties["width"]) == data[i].shape[:2]
+
+
 def test_help_jpg():
     help_jpg()
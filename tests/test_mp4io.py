@@ -6,11 +6,12 @@ from iotools.bytesio import load_bytes
 from iotools.mp4io import (
     decode_mp4_using_imageio, encode_mp4_using_imageio,
     read_mp4_using_imageio, write_mp4_using_imageio,
-    load_mp4_using_imageio, save_mp4_using_imageio, help_mp4_using_imageio,
+    load_mp4_using_imageio, save_mp4_using_imageio, iter_mp4_using_imageio, open_mp4_writer_using_imageio,
+    help_mp4_using_imageio,
     decode_mp4_using_cv2, encode_mp4_using_cv2,
     read_mp4_using_cv2, write_mp4_using_cv2,
-    load_mp4_using_cv2, save_mp4_using_cv2, help_mp4_using_cv2,
-    decode_mp4, encode_mp4, read_mp4, write_mp4, load_mp4, save_mp4, help_mp4
+    load_mp4_using_cv2, save_mp4_using_cv2, iter_mp4_using_cv2, open_mp4_writer_using_cv2, help_mp4_using_cv2,
+    decode_mp4, encode_mp4, read_mp4, write_mp4, load_mp4, save_mp4, iter_mp4, open_mp4_writer, probe_mp4, help_mp4
 )
 
 
@@ -209,6 +210,25 @@ def test_save_mp4_using_imageio():
     os.remove(filename)
 
 
+def test_iter_mp4_using_imageio():
+    for i in range(len(data)):
+        filename = FILENAMES_MP4.format(i)
+        ldata = list(iter_mp4_using_imageio(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_open_mp4_writer_using_imageio():
+    filename = FILENAMES_MP4.format("write")
+    for i in range(len(data)):
+        frames = load_mp4_using_imageio(FILENAMES_MP4.format(i))
+        with open_mp4_writer_using_imageio(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_mp4_using_imageio(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_mp4_using_imageio():
     help_mp4_using_imageio()
 
@@ -363,6 +383,25 @@ def test_save_mp4_using_cv2():
     os.remove(filename)
 
 
+def test_iter_mp4_using_cv2():
+    for i in range(len(data)):
+        filename = FILENAMES_MP4.format(i)
+        ldata = list(iter_mp4_using_cv2(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_open_mp4_writer_using_cv2():
+    filename = FILENAMES_MP4.format("write")
+    for i in range(len(data)):
+        frames = load_mp4_using_cv2(FILENAMES_MP4.format(i))
+        with open_mp4_writer_using_cv2(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_mp4_using_cv2(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_mp4_using_cv2():
     help_mp4_using_cv2()
 
@@ -513,5 +552,34 @@ def test_save_mp4():
     os.remove(filename)
 
 
+def test_iter_mp4():
+    for i in range(len(data)):
+        filename = FILENAMES_MP4.format(i)
+        ldata = list(iter_mp4(filename))
+        assert _video_distance(ldata, data[i]) < 16
+
+
+def test_probe_mp4():
+    for i in range(len(data)):
+        filename = FILENAMES_MP4.format(i)
+        properties = probe_mp4(filename)
+        assert properties["format"] == "mp4"
+        assert properties["nframes"] == len(data[i])
+        assert (properties["width"], properties["height"]) == (48, 32)
+        assert abs(properties["fps"] - 3) < 0.1
+
+
+def test_open_mp4_writer():
+    filename = FILENAMES_MP4.format("write")
+    for i in range(len(data)):
+        frames = load_mp4(FILENAMES_MP4.format(i))
+        with open_mp4_writer(filename, fps=3) as writer:
+            for frame in frames:
+                writer.append(frame)
+        ldata = load_mp4(filename)
+        assert _video_distance(ldata, data[i]) < 16
+    os.remove(filename)
+
+
 def test_help_mp4():
     help_mp4()
@@ -1,9 +1,15 @@
 
 import os
 import numpy as np
+from fsspec.implementations.memory import MemoryFileSystem
 
 from iotools.bytesio import load_bytes
-from iotools.npyio import decode_npy, encode_npy, read_npy, write_npy, load_npy, save_npy, help_npy
+from iotools._default_decode_encode import _bytes_reader
+from iotools.localfs import check_fs
+from iotools._temp_filename_utils import TEMP_FILENAME
+from iotools.npyio import (
+    decode_npy, encode_npy, encode_npy_into, read_npy, write_npy, load_npy, save_npy, open_npy_appender, help_npy
+)
 
 
 TEST_DATA_PATH = "tests/data_for_tests/"
@@ -24,6 +30,25 @@ def test_decode_npy():
         assert np.all(ldata == data[i]), "Error while encoding npy file nbr {}".format(i)
 
 
+def test_decode_npy_zero_copy():
+    for array in [np.arange(12.).reshape(3, 4), np.asfortranarray(np.arange(12).reshape(3, 4)), np.asarray(5)]:
+        rawbytes = encode_npy(array)
+        for buffer in [rawbytes, bytearray(rawbytes), memoryview(rawbytes), np.frombuffer(rawbytes, np.uint8)]:
+            ldata = decode_npy(buffer)
+            assert ldata.dtype == array.dtype and np.array_equal(ldata, array), "Error while decoding npy buffer"
+        buffer = bytearray(rawbytes)
+        ldata = decode_npy(buffer, copy=False)
+        assert np.shares_memory(ldata, np.frombuffer(buffer, np.uint8)), "Decoded array must not be a copy"
+        ldata = decode_npy(buffer)
+        assert not np.shares_memory(ldata, np.frombuffer(buffer, np.uint8)), "Decoded array must be a copy"
+        assert decode_npy(rawbytes).flags.writeable, "Arrays decoded by default must be writeable"
+        assert not decode_npy(rawbytes, copy=False).flags.writeable, "Arrays decoded from bytes must be read-only"
+        buffer = bytearray(rawbytes)
+        with _bytes_reader(buffer) as f:
+            f.read(len(rawbytes))
+        buffer.extend(b"0")  # the buffer must be released when the reader is closed, even if it is still referenced
+
+
 def test_encode_npy():
     for i in range(len(data)):
         txt = encode_npy(data[i])
@@ -31,6 +56,20 @@ def test_encode_npy():
         assert np.all(ldata == data[i]), "Error while decoding npy file nbr {}".format(i)
 
 
+def test_encode_npy_into():
+    for i in range(len(data)):
+        rawbytes = encode_npy(data[i])
+        for buffer in [bytearray(len(rawbytes) + 10), np.zeros(len(rawbytes), dtype=np.uint8)]:
+            size = encode_npy_into(buffer, data[i])
+            assert size == len(rawbytes), "Wrong number of bytes written for npy data nbr {}".format(i)
+            assert bytes(buffer[:size]) == rawbytes, "Error while encoding npy data nbr {} into a buffer".format(i)
+    try:
+        encode_npy_into(bytearray(10), data[0])
+        raise AssertionError("A too small buffer should raise an error")
+    except ValueError:
+        pass
+
+
 def test_read_npy():
     for i in range(len(data)):
         filename = FILENAMES_NPY.format(i)
@@ -57,6 +96,42 @@ def test_load_npy():
         assert np.all(ldata == data[i]), "Error while loading npy file nbr {}".format(i)
 
 
+def test_load_npy_mmap():
+    filename = FILENAMES_NPY.format("mmap")
+    save_npy(filename, data[1])
+    ldata = load_npy(filename, mmap_mode="r")
+    assert isinstance(ldata, np.memmap) and np.all(ldata == data[1]), "Error while memory-mapping npy file"
+    ldata = load_npy(filename, mmap_mode="r+")
+    ldata[0, 0] = 5
+    ldata.flush()
+    del ldata
+    assert load_npy(filename)[0, 0] == 5, "Error while writing in memory-mapped npy file"
+    os.remove(filename)
+
+
+def test_load_npy_mmap_remote():
+    memfs = MemoryFileSystem()
+    arrays = [
+        np.arange(2 * 3 * 4 * 5, dtype=">i4").reshape(2, 3, 4, 5),
+        np.asfortranarray(np.arange(60.).reshape(3, 4, 5)),
+        np.asarray(5),
+    ]
+    keys = [(), 1, -1, (0, 2), (1, slice(1, None, 2)), (Ellipsis, 3), (slice(None, None, -1), 1), (slice(3, 1),)]
+    for i, array in enumerate(arrays):
+        filename = "/npy/example_npy_{}.npy".format(i)
+        save_npy(filename, array, fs=memfs, makedirs=True)
+        ldata = load_npy(filename, fs=memfs, mmap_mode="r")
+        assert ldata.shape == array.shape and ldata.dtype == array.dtype, "Wrong shape or dtype of lazy npy array"
+        assert np.array_equal(np.asarray(ldata), array), "Error while reading lazy npy array"
+        for key in keys[:1] if array.ndim == 0 else keys:
+            assert np.array_equal(ldata[key], array[key]), "Error while slicing lazy npy array with {}".format(key)
+    try:
+        load_npy(filename, fs=memfs, mmap_mode="r+")
+        raise AssertionError("Remote npy files cannot be memory-mapped in 'r+' mode")
+    except ValueError:
+        pass
+
+
 def test_save_npy():
     filename = FILENAMES_NPY.format("write")
     for i in range(len(data)):
@@ -66,5 +141,43 @@ def test_save_npy():
     os.remove(filename)
 
 
+def test_open_npy_appender():
+    memfs = MemoryFileSystem()
+    array = np.arange(7 * 3 * 2, dtype=np.float32).reshape(7, 3, 2)
+    for filename, fs in [(FILENAMES_NPY.format("append"), None), ("/npy/example_npy_append.npy", memfs)]:
+        with open_npy_appender(filename, np.float32, (3, 2), fs=fs, makedirs=True) as appender:
+            appender.append(array[0])
+            appender.extend(array[1:4])
+            appender.extend(row for row in array[4:6])
+            appender.append(array[6].tolist())
+            assert appender.shape == array.shape, "Wrong shape of npy appender"
+            if fs is not None:
+                assert appender._temp_filename.startswith(TEMP_FILENAME), "Temporary file must be on disk"
+        ldata = load_npy(filename, fs=fs)
+        assert ldata.dtype == array.dtype and np.array_equal(ldata, array), "Error while appending to npy file"
+        with open_npy_appender(filename, "<i8", fs=fs) as appender:
+            pass
+        ldata = load_npy(filename, fs=fs)
+        assert ldata.shape == (0,) and ldata.dtype == np.int64, "Error while appending no rows to npy file"
+        check_fs(fs).rm(filename)
+        # A npy file is not kept if an error is raised while writing it
+        try:
+            with open_npy_appender(filename, np.float32, (3, 2), fs=fs) as appender:
+                appender.extend(array)
+                raise RuntimeError("error while writing")
+        except RuntimeError:
+            pass
+        assert not check_fs(fs).exists(filename), "Aborted npy file must be removed"
+        if fs is not None:
+            assert not os.path.exists(appender._temp_filename), "Temporary file must be removed"
+    try:
+        with open_npy_appender(FILENAMES_NPY.format("append"), np.float32, (3, 2)) as appender:
+            appender.append(np.zeros((2, 3)))
+        raise AssertionError("Rows of wrong shape should raise an error")
+    except ValueError:
+        pass
+    assert not os.path.exists(FILENAMES_NPY.format("append")), "Aborted npy file must be removed"
+
+
 def test_help_npy():
     help_npy()
@@ -0,0 +1,101 @@
+import os
+import numpy as np
+from fsspec.implementations.memory import MemoryFileSystem
+
+from iotools.bytesio import load_bytes
+from iotools.npzio import decode_npz, encode_npz, read_npz, write_npz, load_npz, save_npz, help_npz
+
+
+TEST_DATA_PATH = "tests/data_for_tests/"
+
+FILENAMES_NPZ = os.path.join(TEST_DATA_PATH, "npz", "example_npz_{}.npz")
+
+data = {}
+data[0] = {"x": np.asarray([1, 3]), "y": np.asarray([[1, 2, 3.6], [4, 7.6, 8.89]])}
+data[1] = {"features": np.arange(24, dtype=np.float32).reshape(4, 6), "labels": np.asarray([0, 1, 1, 0])}
+
+
+def _equal(ldata, data):
+    return set(ldata) == set(data) and all(np.array_equal(ldata[k], v) for k, v in data.items())
+
+
+def test_decode_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        txt = load_bytes(filename)
+        ldata = decode_npz(txt)
+        assert _equal(ldata, data[i]), "Error while decoding npz file nbr {}".format(i)
+
+
+def test_encode_npz():
+    for i in range(len(data)):
+        for compress in [False, True]:
+            txt = encode_npz(data[i], compress=compress)
+            ldata = decode_npz(txt)
+            assert _equal(ldata, data[i]), "Error while encoding npz file nbr {}".format(i)
+
+
+def test_read_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        with open(filename, "rb") as f:
+            ldata = read_npz(f)
+            assert _equal(ldata, data[i]), "Error while reading npz file nbr {}".format(i)
+
+
+def test_write_npz():
+    filename = FILENAMES_NPZ.format("write")
+    for i in range(len(data)):
+        with open(filename, "wb") as f:
+            write_npz(f, data[i])
+        with open(filename, "rb") as f:
+            ldata = read_npz(f)
+            assert _equal(ldata, data[i]), "Error while writing npz file nbr {}".format(i)
+    os.remove(filename)
+
+
+def test_load_npz():
+    for i in range(len(data)):
+        filename = FILENAMES_NPZ.format(i)
+        with load_npz(filename) as ldata:
+            assert _equal(ldata, data[i]), "Error while loading npz file nbr {}".format(i)
+            assert _equal(ldata.load(workers=2), data[i]), "Error while loading npz arrays in parallel"
+            assert _equal(ldata.load(["x"] if i == 0 else ["labels"], workers=1), {
+                k: v for k, v in data[i].items() if k in ["x", "labels"]
+            }), "Error while loading some npz arrays"
+
+
+def test_load_npz_mmap():
+    memfs = MemoryFileSystem()
+    for filename, fs in [(FILENAMES_NPZ.format("mmap"), None), ("/npz/example_npz_mmap.npz", memfs)]:
+        save_npz(filename, data[1], fs=fs, makedirs=True)
+        with load_npz(filename, fs=fs, mmap_mode="r") as ldata:
+            assert _equal(ldata, data[1]), "Error while memory-mapping npz file"
+            if fs is None:
+                assert isinstance(ldata["features"], np.memmap), "Uncompressed npz arrays should be memory-mapped"
+            assert np.array_equal(ldata["features"][1:3, 2], data[1]["features"][1:3, 2]), "Error while slicing"
+        if fs is None:
+            os.remove(filename)
+    with load_npz(FILENAMES_NPZ.format(1), mmap_mode="r") as ldata:
+        assert not isinstance(ldata["features"], np.memmap), "Compressed npz arrays cannot be memory-mapped"
+        assert _equal(ldata, data[1]), "Error while loading compressed npz file with mmap_mode"
+    for mode in ["r+", "w+"]:
+        try:
+            load_npz(FILENAMES_NPZ.format(1), mmap_mode=mode)
+            raise AssertionError("mmap_mode '{}' should raise an error".format(mode))
+        except ValueError:
+            pass
+
+
+def test_save_npz():
+    filename = FILENAMES_NPZ.format("write")
+    for i in range(len(data)):
+        for compress in [False, True]:
+            save_npz(filename, data[i], compress=compress)
+            with load_npz(filename) as ldata:
+                assert _equal(ldata, data[i]), "Error while saving npz file nbr {}".format(i)
+    os.remove(filename)
+
+
+def test_help_npz():
+    help_npz()
@@ -8,16 +8,21 @@ from iotools.pngio import (
     decode_png_using_imageio, encode_png_using_imageio,
     read_png_using_imageio, write_png_using_imageio,
     load_png_using_imageio, save_png_using_imageio, help_png_using_imageio,
+    decode_pngs_using_imageio, load_pngs_using_imageio,
     decode_png_using_skimage, encode_png_using_skimage,
     read_png_using_skimage, write_png_using_skimage,
     load_png_using_skimage, save_png_using_skimage, help_png_using_skimage,
+    decode_pngs_using_skimage, load_pngs_using_skimage,
     decode_png_using_pil, encode_png_using_pil,
     read_png_using_pil, write_png_using_pil,
     load_png_using_pil, save_png_using_pil, help_png_using_pil,
+    decode_pngs_using_pil, load_pngs_using_pil,
     decode_png_using_cv2, encode_png_using_cv2,
     read_png_using_cv2, write_png_using_cv2,
     load_png_using_cv2, save_png_using_cv2, help_png_using_cv2,
-    decode_png, encode_png, read_png, write_png, load_png, save_png, help_png
+    decode_pngs_using_cv2, load_pngs_using_cv2,
+    decode_png, encode_png, read_png, write_png, load_png, save_png, help_png,
+    decode_pngs, load_pngs, probe_png
 )
 
 
@@ -133,6 +138,22 @@ def test_save_png_using_imageio():
     os.remove(filename)
 
 
+def test_decode_pngs_using_imageio():
+    rawbytes = [load_bytes(FILENAMES_PNG.format(i)) for i in range(len(data))]
+    ldata = decode_pngs_using_imageio(rawbytes)
+    for i in range(len(data)):
+        expected = decode_png_using_imageio(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding png image nbr {}".format(i)
+
+
+def test_load_pngs_using_imageio():
+    filenames = [FILENAMES_PNG.format(i) for i in range(len(data))]
+    ldata = load_pngs_using_imageio(filenames)
+    for i in range(len(data)):
+        expected = load_png_using_imageio(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading png image nbr {}".format(i)
+
+
 def test_help_png_using_imageio():
     help_png_using_imageio()
 
@@ -192,6 +213,22 @@ def test_save_png_using_skimage():
     os.remove(filename)
 
 
+def test_decode_pngs_using_skimage():
+    rawbytes = [load_bytes(FILENAMES_PNG.format(i)) for i in range(len(data))]
+    ldata = decode_pngs_using_skimage(rawbytes)
+    for i in range(len(data)):
+        expected = decode_png_using_skimage(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding png image nbr {}".format(i)
+
+
+def test_load_pngs_using_skimage():
+    filenames = [FILENAMES_PNG.format(i) for i in range(len(data))]
+    ldata = load_pngs_using_skimage(filenames)
+    for i in range(len(data)):
+        expected = load_png_using_skimage(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading png image nbr {}".format(i)
+
+
 def test_help_png_using_skimage():
     help_png_using_skimage()
 
@@ -257,6 +294,22 @@ def test_save_png_using_pil():
     os.remove(filename)
 
 
+def test_decode_pngs_using_pil():
+    rawbytes = [load_bytes(FILENAMES_PNG.format(i)) for i in range(len(data))]
+    ldata = decode_pngs_using_pil(rawbytes)
+    for i in range(len(data)):
+        expected = decode_png_using_pil(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding png image nbr {}".format(i)
+
+
+def test_load_pngs_using_pil():
+    filenames = [FILENAMES_PNG.format(i) for i in range(len(data))]
+    ldata = load_pngs_using_pil(filenames)
+    for i in range(len(data)):
+        expected = load_png_using_pil(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading png image nbr {}".format(i)
+
+
 def test_help_png_using_pil():
     help_png_using_pil()
 
@@ -322,6 +375,22 @@ def test_save_png_using_cv2():
     os.remove(filename)
 
 
+def test_decode_pngs_using_cv2():
+    rawbytes = [load_bytes(FILENAMES_PNG.format(i)) for i in range(len(data))]
+    ldata = decode_pngs_using_cv2(rawbytes)
+    for i in range(len(data)):
+        expected = decode_png_using_cv2(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding png image nbr {}".format(i)
+
+
+def test_load_pngs_using_cv2():
+    filenames = [FILENAMES_PNG.format(i) for i in range(len(data))]
+    ldata = load_pngs_using_cv2(filenames)
+    for i in range(len(data)):
+        expected = load_png_using_cv2(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading png image nbr {}".format(i)
+
+
 def test_help_png_using_cv2():
     help_png_using_cv2()
 
@@ -381,5 +450,28 @@ def test_save_png():
     os.remove(filename)
 
 
+def test_decode_pngs():
+    rawbytes = [load_bytes(FILENAMES_PNG.format(i)) for i in range(len(data))]
+    ldata = decode_pngs(rawbytes)
+    for i in range(len(data)):
+        expected = decode_png(rawbytes[i])
+        assert np.array_equal(ldata[i], expected), "Error while decoding png image nbr {}".format(i)
+
+
+def test_load_pngs():
+    filenames = [FILENAMES_PNG.format(i) for i in range(len(data))]
+    ldata = load_pngs(filenames)
+    for i in range(len(data)):
+        expected = load_png(filenames[i])
+        assert np.array_equal(ldata[i], expected), "Error while loading png image nbr {}".format(i)
+
+
+def test_probe_png():
+    for i in range(len(data)):
+        properties = probe_png(FILENAMES_PNG.format(i))
+        assert properties["format"] == "png"
+        assert (properties["height"], properties["width"]) == data[i].shape[:2]
+
+
 def test_help_png():
     help_png()
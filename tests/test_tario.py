@@ -1,14 +1,22 @@
 
+import io
 import os
+import pathlib
+import tarfile
 import numpy as np
+from fsspec.implementations.memory import MemoryFileSystem
 
 from iotools.bytesio import load_bytes
+from iotools.localfs import check_fs
 from iotools.txtio import decode_txt, encode_txt
 from iotools.npyio import decode_npy, encode_npy
 from iotools.pngio import decode_png, encode_png
 from iotools.jsonio import decode_json, encode_json
 from iotools.pickleio import decode_pickle, encode_pickle
-from iotools.tario import decode_tar, encode_tar, read_tar, write_tar, load_tar, save_tar, help_tar
+from iotools.tario import (
+    decode_tar, encode_tar, read_tar, write_tar, load_tar, save_tar, iter_tar, open_tar_writer, build_tar_index,
+    help_tar
+)
 
 
 TEST_DATA_PATH = "tests/data_for_tests/"
@@ -120,6 +128,75 @@ def test_load_tar():
         assert ldata == data[i], "Error while loading tar file nbr {}".format(i)
 
 
+def test_load_tar_lazy():
+    for i in range(len(data)):
+        filename = FILENAMES_TAR.format(i)
+        with load_tar(filename, lazy=True) as ldata:
+            assert set(ldata) == set(data[i]), "Wrong file names in lazy tar file nbr {}".format(i)
+            ldata = _decode_sub_files(ldata)
+        assert ldata == data[i], "Error while lazily loading tar file nbr {}".format(i)
+
+
+def test_build_tar_index():
+    memfs = MemoryFileSystem()
+    for i in range(len(data)):
+        filename = "/tar/example_tar_{}.tar".format(i)
+        memfs.pipe(filename, load_bytes(FILENAMES_TAR.format(i)))
+        index_filename = build_tar_index(filename, fs=memfs)
+        assert memfs.exists(index_filename), "Index of tar file nbr {} was not saved".format(i)
+        with load_tar(filename, fs=memfs, lazy=True) as ldata:
+            assert type(ldata).__name__ == "_IndexedTar", "Index of tar file nbr {} was not used".format(i)
+            ldata = _decode_sub_files(ldata)
+        assert ldata == data[i], "Error while loading indexed tar file nbr {}".format(i)
+        memfs.pipe(filename, encode_tar({"example_txt_0.txt": b"changed"}))
+        with load_tar(filename, fs=memfs, lazy=True) as ldata:
+            assert dict(ldata) == {"example_txt_0.txt": b"changed"}, "Outdated tar index should not be used"
+
+
+def test_iter_tar():
+    memfs = MemoryFileSystem()
+    for i in range(len(data)):
+        filename = FILENAMES_TAR.format(i)
+        ldata = _decode_sub_files(dict(iter_tar(filename)))
+        assert ldata == data[i], "Error while iterating over tar file nbr {}".format(i)
+        memfs.pipe("/tar/example_tar_{}.tar".format(i), load_bytes(filename))
+        ldata = {name: f.read() for name, f in iter_tar("/tar/example_tar_{}.tar".format(i), fs=memfs, as_file=True)}
+        assert _decode_sub_files(ldata) == data[i], "Error while iterating over remote tar file nbr {}".format(i)
+
+
+def _tar_with_links():
+    b = io.BytesIO()
+    with tarfile.open(fileobj=b, mode="w") as t:
+        for name, type, linkname in [
+            ("dir", tarfile.DIRTYPE, ""), ("dir/a.txt", tarfile.REGTYPE, ""), ("b.txt", tarfile.LNKTYPE, "dir/a.txt"),
+            ("dir/c.txt", tarfile.SYMTYPE, "a.txt"), ("d.txt", tarfile.SYMTYPE, "missing.txt"),
+            ("e", tarfile.SYMTYPE, "dir"), ("dir/sub/f.txt", tarfile.SYMTYPE, "../a.txt"),
+            ("g.txt", tarfile.SYMTYPE, "./dir/a.txt"),
+        ]:
+            ti = tarfile.TarInfo(name)
+            ti.type, ti.linkname = type, linkname
+            ti.size = 5 if type == tarfile.REGTYPE else 0
+            t.addfile(ti, io.BytesIO(b"hello") if type == tarfile.REGTYPE else None)
+    return b.getvalue()
+
+
+def test_tar_links():
+    memfs = MemoryFileSystem()
+    filename = "/tar/example_tar_links.tar"
+    memfs.pipe(filename, _tar_with_links())
+    expected = {name: b"hello" for name in ["dir/a.txt", "b.txt", "dir/c.txt", "dir/sub/f.txt", "g.txt"]}
+    assert decode_tar(memfs.cat_file(filename)) == expected, "Links to files should be resolved"
+    assert load_tar(filename, fs=memfs) == expected, "Links to files should be resolved"
+    with load_tar(filename, fs=memfs, lazy=True) as ldata:
+        assert dict(ldata) == expected, "Links to files should be resolved in lazy tar files"
+    build_tar_index(filename, fs=memfs)
+    with load_tar(filename, fs=memfs, lazy=True) as ldata:
+        assert type(ldata).__name__ == "_IndexedTar", "Index of tar file was not used"
+        assert dict(ldata) == expected, "Links to files should be resolved in indexed tar files"
+    ldata = dict(iter_tar(filename, fs=memfs))
+    assert ldata == {"dir/a.txt": b"hello"}, "Links and directories should be skipped when iterating over tar file"
+
+
 def test_save_tar():
     filename = FILENAMES_TAR.format("write")
     for i in range(len(data)):
@@ -130,5 +207,40 @@ def test_save_tar():
     os.remove(filename)
 
 
+def test_save_tar_iterable():
+    filename = FILENAMES_TAR.format("write")
+    for i in range(len(data)):
+        save_tar(filename, ((k, v) for k, v in _encode_sub_files(data[i]).items()))
+        ldata = _decode_sub_files(load_tar(filename))
+        assert ldata == data[i], "Error while saving tar file nbr {} from an iterable".format(i)
+    os.remove(filename)
+
+
+def test_open_tar_writer():
+    memfs = MemoryFileSystem()
+    text = "tyué#þ€è"
+    for filename, fs in [(FILENAMES_TAR.format("write"), None), ("/tar/example_tar_write.tar", memfs)]:
+        with open_tar_writer(filename, fs=fs, makedirs=True) as writer:
+            writer.append("example_txt_0.txt", text)
+            writer.append("example_bytes_0", io.BytesIO(b"0123456789"))
+            writer.append("example_tar_0.tar", pathlib.Path(FILENAMES_TAR.format(0)))
+            writer.extend({"example_npy_0.npy": encode_npy(np.arange(4))})
+        ldata = load_tar(filename, fs=fs)
+        assert ldata["example_txt_0.txt"].decode("utf-8") == text, "Error while writing non-ascii text in tar file"
+        assert ldata["example_bytes_0"] == b"0123456789", "Error while writing file-like object in tar file"
+        assert ldata["example_tar_0.tar"] == load_bytes(FILENAMES_TAR.format(0)), "Error while writing path in tar file"
+        assert np.array_equal(decode_npy(ldata["example_npy_0.npy"]), np.arange(4)), "Error while extending tar file"
+        if fs is None:
+            os.remove(filename)
+        # A tar file is not kept if an error is raised while writing it
+        try:
+            with open_tar_writer(filename, fs=fs) as writer:
+                writer.append("example_txt_0.txt", text)
+                raise RuntimeError("error while writing")
+        except RuntimeError:
+            pass
+        assert not check_fs(fs).exists(filename), "Aborted tar file must be removed"
+
+
 def test_help_tar():
     help_tar()
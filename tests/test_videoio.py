@@ -1,17 +1,27 @@
 
 import os
+import subprocess
+import sys
+import threading
+import types
 import numpy as np
+from fsspec.implementations.memory import MemoryFileSystem
 
 from iotools.bytesio import load_bytes
+from iotools.settings import settings
+from iotools._temp_filename_utils import MEMORY_TEMP_DIR, MEMORY_TEMP_FILENAME, TEMP_FILENAME, _get_temp_filename
 from iotools.videoio import (
-    DEFAULT_PROPERTIES_CV2,
+    DEFAULT_PROPERTIES_CV2, _video_format_cache, _cache_video_format,
     decode_video_using_imageio, encode_video_using_imageio,
     read_video_using_imageio, write_video_using_imageio,
-    load_video_using_imageio, save_video_using_imageio, help_video_using_imageio,
+    load_video_using_imageio, save_video_using_imageio, iter_video_using_imageio, open_video_writer_using_imageio,
+    help_video_using_imageio,
     decode_video_using_cv2, encode_video_using_cv2,
     read_video_using_cv2, write_video_using_cv2,
-    load_video_using_cv2, save_video_using_cv2, help_video_using_cv2,
-    decode_video, encode_video, read_video, write_video, load_video, save_video, help_video
+    load_video_using_cv2, save_video_using_cv2, iter_video_using_cv2, open_video_writer_using_cv2, help_video_using_cv2,
+    decode_video, encode_video, read_video, write_video, load_video, save_video, iter_video,
+    open_video_writer, probe_video,
+    help_video
 )
 
 
@@ -228,6 +238,92 @@ def test_load_video_using_imageio():
             assert ldata["properties"]["format"] == ext
 
 
+def test_load_video_using_imageio_selected_frames():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video_using_imageio(filename, start=1, stop=5, step=3)
+            assert _video_distance(ldata, data[i][1:5:3]) < 16
+            ldata = decode_video_using_imageio(load_bytes(filename), step=2)
+            assert _video_distance(ldata, data[i][::2]) < 16
+            ldata = list(iter_video_using_imageio(filename, start=4))
+            assert _video_distance(ldata, data[i][4:]) < 16
+            ldata = load_video_using_imageio(filename, timestamps=[1, 0, 60])
+            assert _video_distance(ldata, [data[i][3], data[i][0]]) < 16
+            assert len(load_video_using_imageio(filename, start=60)) == 0
+
+
+def test_load_video_using_imageio_as_array():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video_using_imageio(filename, output="array")
+            assert isinstance(ldata, np.ndarray) and ldata.flags["C_CONTIGUOUS"]
+            assert ldata.shape[0] == len(data[i]) and ldata.dtype == np.uint8
+            assert _video_distance(list(ldata), data[i]) < 16
+            assert np.array_equal(ldata, np.stack(load_video_using_imageio(filename)))
+            ldata = decode_video_using_imageio(load_bytes(filename), start=1, step=2, output="array")
+            assert _video_distance(list(ldata), data[i][1::2]) < 16
+            ldata = load_video_using_imageio(filename, which="all", output="array")
+            assert isinstance(ldata["video"], np.ndarray)
+            assert len(load_video_using_imageio(filename, start=60, output="array")) == 0
+    try:
+        load_video_using_imageio(FILENAMES_MP4.format(0), output="tensor")
+        assert False
+    except ValueError:
+        pass
+
+
+def test_load_video_using_imageio_format_detection():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            # The format is detected from the file content, unless it is given
+            for kwargs in [{}, {"format": ext}]:
+                ldata = decode_video_using_imageio(load_bytes(filename), which="all", **kwargs)
+                assert ldata["properties"]["format"] == ext
+                assert _video_distance(ldata["video"], data[i]) < 16
+    cache_videos_formats = settings["CACHE_VIDEO_FORMATS"]
+    try:
+        settings["CACHE_VIDEO_FORMATS"] = True
+        for filenames_video, data, ext in read_list_of_args:
+            for i in range(len(data)):
+                filename = filenames_video.format(i)
+                for _ in range(2):
+                    ldata = load_video_using_imageio(filename, which="all")
+                    assert ldata["properties"]["format"] == ext
+                    assert _video_distance(ldata["video"], data[i]) < 16
+                assert ext in _video_format_cache.values()
+    finally:
+        settings["CACHE_VIDEO_FORMATS"] = cache_videos_formats
+        _video_format_cache.clear()
+
+
+def test_video_format_cache_threads():
+    import iotools.videoio
+    cache_size = iotools.videoio.VIDEO_FORMAT_CACHE_SIZE
+    errors = []
+
+    def cache_formats(n):
+        try:
+            for j in range(500):
+                _cache_video_format(("file_{}_{}".format(n, j), 0, 0), "mp4")
+        except Exception as e:
+            errors.append(e)
+
+    try:
+        iotools.videoio.VIDEO_FORMAT_CACHE_SIZE = 8
+        threads = [threading.Thread(target=cache_formats, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors and len(_video_format_cache) <= 8
+    finally:
+        iotools.videoio.VIDEO_FORMAT_CACHE_SIZE = cache_size
+        _video_format_cache.clear()
+
+
 def test_save_video_using_imageio():
     for filenames_video, data, ext in write_list_of_args:
         filename = filenames_video.format("write")
@@ -248,6 +344,144 @@ def test_save_video_using_imageio():
         os.remove(filename)
 
 
+def test_save_video_using_imageio_in_parallel():
+    frames = [np.zeros((32, 48, 3), dtype=np.uint8) for _ in range(95)]
+    for i, frame in enumerate(frames):
+        frame[(i % 2) * 16:(i % 2) * 16 + 16, (i % 3) * 16:(i % 3) * 16 + 16, :] = [55, 155, 255]
+    memfs = MemoryFileSystem()
+    for ext in ["mp4", "avi"]:
+        filename = os.path.join(TEST_DATA_PATH, "video", "example_parallel." + ext)
+        save_video_using_imageio(filename, frames, fps=30, workers=3)
+        ldata = load_video_using_imageio(filename, which="all")
+        assert ldata["properties"]["fps"] == 30
+        assert _video_distance(ldata["video"], list(frames)) < 16
+        os.remove(filename)
+        save_video_using_imageio("/" + filename, frames, fs=memfs, fps=30, workers=2)
+        assert _video_distance(decode_video_using_imageio(memfs.cat("/" + filename)), list(frames)) < 16
+        memfs.rm("/" + filename)
+
+
+def test_iter_video_using_imageio():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            frames = iter_video_using_imageio(filename)
+            assert isinstance(frames, types.GeneratorType)
+            assert _video_distance(list(frames), data[i]) < 16
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            memfs.pipe("/" + filename, load_bytes(filename))
+            ldata = list(iter_video_using_imageio("/" + filename, fs=memfs))
+            assert _video_distance(ldata, data[i]) < 16
+            memfs.rm("/" + filename)
+
+
+def test_iter_video_using_imageio_prefetch():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = list(iter_video_using_imageio(filename, prefetch=2))
+            assert _video_distance(ldata, data[i]) < 16
+            ldata = list(iter_video_using_imageio(filename, step=2, prefetch=1))
+            assert _video_distance(ldata, data[i][::2]) < 16
+            # Stopping early stops the background thread
+            frames = iter_video_using_imageio(filename, prefetch=1)
+            next(frames)
+            frames.close()
+    assert "iotools_prefetch_frames" not in [thread.name for thread in threading.enumerate()]
+    try:
+        list(iter_video_using_imageio(FILENAMES_MP4.format(0), start=1, timestamps=[0], prefetch=2))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_open_video_writer_using_imageio():
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in write_list_of_args:
+        filename = filenames_video.format("write")
+        for i in range(len(data)):
+            frames = load_video_using_imageio(filenames_video.format(i))
+            with open_video_writer_using_imageio(filename, fps=3) as writer:
+                writer.append(frames[0])
+                writer.extend(frames[1:])
+            assert _video_distance(load_video_using_imageio(filename), data[i]) < 16
+            # Videos can also be written on other file systems
+            writer = open_video_writer_using_imageio("/" + filename, fs=memfs, fps=3)
+            writer.extend(iter(frames))
+            writer.close()
+            ldata = decode_video_using_imageio(memfs.cat("/" + filename), which="all")
+            assert ldata["properties"]["format"] == ext
+            assert _video_distance(ldata["video"], data[i]) < 16
+            memfs.rm("/" + filename)
+        os.remove(filename)
+
+
+def _iotools_temp_files():
+    import tempfile
+    return {
+        f for d in [tempfile.gettempdir(), MEMORY_TEMP_DIR] if os.path.isdir(d)
+        for f in os.listdir(d) if f.startswith("iotools_")
+    }
+
+
+def test_open_video_writer_using_imageio_errors():
+    import iotools.videoio
+    memfs = MemoryFileSystem()
+    frames = load_video_using_imageio(FILENAMES_MP4.format(0))
+    temp_files = _iotools_temp_files()
+    # A video is not uploaded if an error is raised while writing it
+    for filename in ["/video.mp4", "/video.gif"]:
+        try:
+            with open_video_writer_using_imageio(filename, fs=memfs, fps=3) as writer:
+                writer.append(frames[0])
+                raise RuntimeError("error while writing")
+        except RuntimeError:
+            pass
+        assert not memfs.exists(filename), "Aborted video {} must not be uploaded".format(filename)
+
+    # The temporary file is removed if the writer cannot be opened
+    def get_writer_error(*args):
+        raise RuntimeError("writer cannot be opened")
+
+    get_writer_using_imageio = iotools.videoio._get_writer_using_imageio
+    try:
+        iotools.videoio._get_writer_using_imageio = get_writer_error
+        open_video_writer_using_imageio("/video.mp4", fs=memfs, fps=3)
+        assert False
+    except RuntimeError:
+        pass
+    finally:
+        iotools.videoio._get_writer_using_imageio = get_writer_using_imageio
+    assert _iotools_temp_files() == temp_files
+
+
+def test_get_reader_using_imageio_formats():
+    import types
+    import iotools.videoio
+    formats = []
+
+    def get_reader(openfile, format=None, **kwargs):
+        formats.append(format)
+        raise ValueError("cannot read {}".format(format))
+
+    imageio = iotools.videoio.imageio
+    try:
+        iotools.videoio.imageio = types.SimpleNamespace(get_reader=get_reader)
+        for kwargs, first_format in [({}, "mp4"), ({"format": "gif"}, "gif")]:
+            formats.clear()
+            try:
+                iotools.videoio._get_reader_using_imageio(FILENAMES_MP4.format(0), kwargs)
+                raise AssertionError("An error must be raised when no format can be read")
+            except ValueError as e:
+                assert str(e) == "cannot read gif", "The error of the last format tried must be raised"
+            assert formats[0] == first_format, "The format given must be tried first, else the guessed one"
+    finally:
+        iotools.videoio.imageio = imageio
+
+
 def test_help_video_using_imageio():
     help_video_using_imageio()
 
@@ -289,6 +523,41 @@ def test_decode_video_using_cv2():
             assert ldata["properties"]["format"] == ext
 
 
+def test_decode_video_using_cv2_temp_files():
+    use_memory_temp_files = settings["USE_MEMORY_TEMP_FILES"]
+    try:
+        for use_memory in [True, False]:
+            settings["USE_MEMORY_TEMP_FILES"] = use_memory
+            for filenames_video, data, ext in read_list_of_args:
+                for i in range(len(data)):
+                    filename = filenames_video.format(i)
+                    ldata = decode_video_using_cv2(load_bytes(filename))
+                    assert _video_distance(ldata, data[i]) < 16
+            for filenames_video, data, ext in write_list_of_args:
+                if DEFAULT_PROPERTIES_CV2[ext]["codec"] is not None:
+                    for i in range(len(data)):
+                        datai = decode_video_using_cv2(load_bytes(filenames_video.format(i)))
+                        txt = encode_video_using_cv2(datai, format=ext)
+                        assert _video_distance(decode_video_using_cv2(txt), data[i]) < 16
+    finally:
+        settings["USE_MEMORY_TEMP_FILES"] = use_memory_temp_files
+    if os.path.isdir(MEMORY_TEMP_DIR):
+        assert not [f for f in os.listdir(MEMORY_TEMP_DIR) if f.startswith("iotools_")]
+
+
+def test_temp_files_too_large_for_memory():
+    use_memory_temp_files = settings["USE_MEMORY_TEMP_FILES"]
+    try:
+        settings["USE_MEMORY_TEMP_FILES"] = True
+        assert _get_temp_filename("mp4", size=2 ** 60).startswith(TEMP_FILENAME)
+        assert _get_temp_filename("mp4", in_memory=False).startswith(TEMP_FILENAME)
+        assert _get_temp_filename("mp4").startswith(TEMP_FILENAME), "Files of unknown size must be on disk"
+        if os.path.isdir(MEMORY_TEMP_DIR) and os.access(MEMORY_TEMP_DIR, os.W_OK):
+            assert _get_temp_filename("mp4", size=1).startswith(MEMORY_TEMP_FILENAME)
+    finally:
+        settings["USE_MEMORY_TEMP_FILES"] = use_memory_temp_files
+
+
 def test_encode_video_using_cv2():
     for filenames_video, data, ext in write_list_of_args:
         if DEFAULT_PROPERTIES_CV2[ext]["codec"] is not None:
@@ -403,6 +672,42 @@ def test_load_video_using_cv2():
             assert ldata["properties"]["format"] == ext
 
 
+def test_load_video_using_cv2_selected_frames():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video_using_cv2(filename, start=1, stop=5, step=3)
+            assert _video_distance(ldata, data[i][1:5:3]) < 16
+            ldata = decode_video_using_cv2(load_bytes(filename), step=2)
+            assert _video_distance(ldata, data[i][::2]) < 16
+            ldata = list(iter_video_using_cv2(filename, start=4))
+            assert _video_distance(ldata, data[i][4:]) < 16
+            ldata = load_video_using_cv2(filename, timestamps=[1, 0, 60])
+            assert _video_distance(ldata, [data[i][3], data[i][0]]) < 16
+            assert len(load_video_using_cv2(filename, start=60)) == 0
+
+
+def test_load_video_using_cv2_as_array():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video_using_cv2(filename, output="array")
+            assert isinstance(ldata, np.ndarray) and ldata.flags["C_CONTIGUOUS"]
+            assert ldata.shape[0] == len(data[i]) and ldata.dtype == np.uint8
+            assert _video_distance(list(ldata), data[i]) < 16
+            assert np.array_equal(ldata, np.stack(load_video_using_cv2(filename)))
+            ldata = decode_video_using_cv2(load_bytes(filename), start=1, step=2, output="array")
+            assert _video_distance(list(ldata), data[i][1::2]) < 16
+            ldata = load_video_using_cv2(filename, which="all", output="array")
+            assert isinstance(ldata["video"], np.ndarray)
+            assert len(load_video_using_cv2(filename, start=60, output="array")) == 0
+    try:
+        load_video_using_cv2(FILENAMES_MP4.format(0), output="tensor")
+        assert False
+    except ValueError:
+        pass
+
+
 def test_save_video_using_cv2():
     for filenames_video, data, ext in write_list_of_args:
         if DEFAULT_PROPERTIES_CV2[ext]["codec"] is not None:
@@ -426,6 +731,82 @@ def test_save_video_using_cv2():
             os.remove(filename)
 
 
+def test_save_video_using_cv2_in_parallel():
+    frames = [np.zeros((32, 48, 3), dtype=np.uint8) for _ in range(95)]
+    for i, frame in enumerate(frames):
+        frame[(i % 2) * 16:(i % 2) * 16 + 16, (i % 3) * 16:(i % 3) * 16 + 16, :] = [55, 155, 255]
+    memfs = MemoryFileSystem()
+    for ext in ["mp4", "avi"]:
+        filename = os.path.join(TEST_DATA_PATH, "video", "example_parallel." + ext)
+        save_video_using_cv2(filename, frames, fps=30, workers=3)
+        ldata = load_video_using_cv2(filename, which="all")
+        assert ldata["properties"]["fps"] == 30
+        assert _video_distance(ldata["video"], list(frames)) < 16
+        os.remove(filename)
+        save_video_using_cv2("/" + filename, frames, fs=memfs, fps=30, workers=2)
+        assert _video_distance(decode_video_using_cv2(memfs.cat("/" + filename)), list(frames)) < 16
+        memfs.rm("/" + filename)
+
+
+def test_iter_video_using_cv2():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            frames = iter_video_using_cv2(filename)
+            assert isinstance(frames, types.GeneratorType)
+            assert _video_distance(list(frames), data[i]) < 16
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            memfs.pipe("/" + filename, load_bytes(filename))
+            ldata = list(iter_video_using_cv2("/" + filename, fs=memfs))
+            assert _video_distance(ldata, data[i]) < 16
+            memfs.rm("/" + filename)
+
+
+def test_iter_video_using_cv2_prefetch():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = list(iter_video_using_cv2(filename, prefetch=2))
+            assert _video_distance(ldata, data[i]) < 16
+            ldata = list(iter_video_using_cv2(filename, step=2, prefetch=1))
+            assert _video_distance(ldata, data[i][::2]) < 16
+            # Stopping early stops the background thread
+            frames = iter_video_using_cv2(filename, prefetch=1)
+            next(frames)
+            frames.close()
+    assert "iotools_prefetch_frames" not in [thread.name for thread in threading.enumerate()]
+    try:
+        list(iter_video_using_cv2(FILENAMES_MP4.format(0), start=1, timestamps=[0], prefetch=2))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_open_video_writer_using_cv2():
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in write_list_of_args:
+        if DEFAULT_PROPERTIES_CV2[ext]["codec"] is not None:
+            filename = filenames_video.format("write")
+            for i in range(len(data)):
+                frames = load_video_using_cv2(filenames_video.format(i))
+                with open_video_writer_using_cv2(filename, fps=3) as writer:
+                    writer.append(frames[0])
+                    writer.extend(frames[1:])
+                assert _video_distance(load_video_using_cv2(filename), data[i]) < 16
+                # Videos can also be written on other file systems
+                writer = open_video_writer_using_cv2("/" + filename, fs=memfs, fps=3)
+                writer.extend(iter(frames))
+                writer.close()
+                ldata = decode_video_using_cv2(memfs.cat("/" + filename), which="all")
+                assert ldata["properties"]["format"] == ext
+                assert _video_distance(ldata["video"], data[i]) < 16
+                memfs.rm("/" + filename)
+            os.remove(filename)
+
+
 def test_help_video_using_cv2():
     help_video_using_cv2()
 
@@ -574,6 +955,48 @@ def test_load_video():
             assert ldata["properties"]["format"] == ext
 
 
+def test_load_video_selected_frames():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video(filename, start=1, stop=5, step=3)
+            assert _video_distance(ldata, data[i][1:5:3]) < 16
+            ldata = decode_video(load_bytes(filename), step=2)
+            assert _video_distance(ldata, data[i][::2]) < 16
+            ldata = list(iter_video(filename, start=4))
+            assert _video_distance(ldata, data[i][4:]) < 16
+            ldata = load_video(filename, timestamps=[1, 0, 60])
+            assert _video_distance(ldata, [data[i][3], data[i][0]]) < 16
+            assert len(load_video(filename, start=60)) == 0
+            for kwargs in [{"timestamps": [1, -1]}, {"start": -1}, {"stop": -2}, {"step": 0}]:
+                try:
+                    load_video(filename, **kwargs)
+                    assert False, "Negative frame selection {} should raise an error".format(kwargs)
+                except ValueError:
+                    pass
+
+
+def test_load_video_as_array():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = load_video(filename, output="array")
+            assert isinstance(ldata, np.ndarray) and ldata.flags["C_CONTIGUOUS"]
+            assert ldata.shape[0] == len(data[i]) and ldata.dtype == np.uint8
+            assert _video_distance(list(ldata), data[i]) < 16
+            assert np.array_equal(ldata, np.stack(load_video(filename)))
+            ldata = decode_video(load_bytes(filename), start=1, step=2, output="array")
+            assert _video_distance(list(ldata), data[i][1::2]) < 16
+            ldata = load_video(filename, which="all", output="array")
+            assert isinstance(ldata["video"], np.ndarray)
+            assert len(load_video(filename, start=60, output="array")) == 0
+    try:
+        load_video(FILENAMES_MP4.format(0), output="tensor")
+        assert False
+    except ValueError:
+        pass
+
+
 def test_save_video():
     for filenames_video, data, ext in write_list_of_args:
         filename = filenames_video.format("write")
@@ -594,5 +1017,131 @@ def test_save_video():
         os.remove(filename)
 
 
+def test_save_video_in_parallel():
+    frames = [np.zeros((32, 48, 3), dtype=np.uint8) for _ in range(95)]
+    for i, frame in enumerate(frames):
+        frame[(i % 2) * 16:(i % 2) * 16 + 16, (i % 3) * 16:(i % 3) * 16 + 16, :] = [55, 155, 255]
+    memfs = MemoryFileSystem()
+    for ext in ["mp4", "avi"]:
+        filename = os.path.join(TEST_DATA_PATH, "video", "example_parallel." + ext)
+        save_video(filename, frames, fps=30, workers=3)
+        ldata = load_video(filename, which="all")
+        assert ldata["properties"]["fps"] == 30
+        assert _video_distance(ldata["video"], list(frames)) < 16
+        os.remove(filename)
+        save_video("/" + filename, frames, fs=memfs, fps=30, workers=2)
+        assert _video_distance(decode_video(memfs.cat("/" + filename)), list(frames)) < 16
+        memfs.rm("/" + filename)
+        # The format can differ from the filename extension
+        filename = os.path.join(TEST_DATA_PATH, "video", "example_parallel.bin")
+        save_video(filename, frames, fps=30, format=ext, workers=3)
+        ldata = load_video(filename, which="all", format=ext)
+        assert ldata["properties"]["format"] == ext
+        assert _video_distance(ldata["video"], list(frames)) < 16
+        os.remove(filename)
+
+
+def test_iter_video():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            frames = iter_video(filename)
+            assert isinstance(frames, types.GeneratorType)
+            assert _video_distance(list(frames), data[i]) < 16
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            memfs.pipe("/" + filename, load_bytes(filename))
+            ldata = list(iter_video("/" + filename, fs=memfs))
+            assert _video_distance(ldata, data[i]) < 16
+            memfs.rm("/" + filename)
+
+
+def test_probe_video():
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            properties = probe_video(filename)
+            assert properties["format"] == ext
+            assert properties["nframes"] == len(data[i])
+            assert (properties["width"], properties["height"]) == (48, 32)
+            assert abs(properties["fps"] - 3) < 0.1
+            assert abs(properties["duration"] - 2) < 0.1
+            memfs.pipe("/probe/video." + ext, load_bytes(filename))
+            assert probe_video("/probe/video." + ext, fs=memfs) == properties
+            # Properties of remote videos are read from their headers, without downloading them
+            prop_remote = load_video_using_cv2("/probe/video." + ext, fs=memfs, which="properties")
+            prop_local = load_video_using_cv2(filename, which="properties")
+            assert prop_remote["format"] == prop_local["format"] == ext
+            assert prop_remote["codec"] == prop_local["codec"]
+            assert abs(prop_remote["fps"] - prop_local["fps"]) < 1e-6
+    memfs.rm("/probe", recursive=True)
+
+
+def test_probe_video_truncated():
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in read_list_of_args:
+        rawbytes = load_bytes(filenames_video.format(0))
+        for size in [12, 16, 30, 100]:
+            memfs.pipe("/probe/video." + ext, rawbytes[:size])
+            try:
+                probe_video("/probe/video." + ext, fs=memfs)
+                raise AssertionError("Truncated {} headers should raise an error".format(ext))
+            except ValueError:
+                pass
+    memfs.rm("/probe", recursive=True)
+
+
+def test_iter_video_prefetch():
+    for filenames_video, data, ext in read_list_of_args:
+        for i in range(len(data)):
+            filename = filenames_video.format(i)
+            ldata = list(iter_video(filename, prefetch=2))
+            assert _video_distance(ldata, data[i]) < 16
+            ldata = list(iter_video(filename, step=2, prefetch=1))
+            assert _video_distance(ldata, data[i][::2]) < 16
+            # Stopping early stops the background thread
+            frames = iter_video(filename, prefetch=1)
+            next(frames)
+            frames.close()
+    assert "iotools_prefetch_frames" not in [thread.name for thread in threading.enumerate()]
+    try:
+        list(iter_video(FILENAMES_MP4.format(0), start=1, timestamps=[0], prefetch=2))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_open_video_writer():
+    memfs = MemoryFileSystem()
+    for filenames_video, data, ext in write_list_of_args:
+        filename = filenames_video.format("write")
+        for i in range(len(data)):
+            frames = load_video(filenames_video.format(i))
+            with open_video_writer(filename, fps=3) as writer:
+                writer.append(frames[0])
+                writer.extend(frames[1:])
+            assert _video_distance(load_video(filename), data[i]) < 16
+            # Videos can also be written on other file systems
+            writer = open_video_writer("/" + filename, fs=memfs, fps=3)
+            writer.extend(iter(frames))
+            writer.close()
+            ldata = decode_video(memfs.cat("/" + filename), which="all")
+            assert ldata["properties"]["format"] == ext
+            assert _video_distance(ldata["video"], data[i]) < 16
+            memfs.rm("/" + filename)
+        os.remove(filename)
+
+
+def test_video_backends_imported_lazily():
+    # a fresh interpreter is needed, since backends are already imported by the other tests
+    code = "import sys; from iotools import videoio, mp4io, aviio, gifio; " \
+           "print(sorted(set(sys.modules) & {'cv2', 'imageio', 'PIL', 'skimage'}))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]", "Backends imported with the module: {}".format(output)
+
+
 def test_help_video():
     help_video()
@@ -1,6 +1,7 @@
 
 import os
 import numpy as np
+from fsspec.implementations.memory import MemoryFileSystem
 
 from iotools.bytesio import load_bytes
 from iotools.txtio import decode_txt, encode_txt
@@ -8,7 +9,7 @@ from iotools.npyio import decode_npy, encode_npy
 from iotools.pngio import decode_png, encode_png
 from iotools.jsonio import decode_json, encode_json
 from iotools.pickleio import decode_pickle, encode_pickle
-from iotools.zipio import decode_zip, encode_zip, read_zip, write_zip, load_zip, save_zip, help_zip
+from iotools.zipio import decode_zip, encode_zip, encode_zip_into, read_zip, write_zip, load_zip, save_zip, help_zip
 
 
 TEST_DATA_PATH = "tests/data_for_tests/"
@@ -81,6 +82,8 @@ def test_decode_zip():
         ldata = decode_zip(txt)
         ldata = _decode_sub_files(ldata)
         assert ldata == data[i], "Error while decoding zip file nbr {}".format(i)
+        ldata = _decode_sub_files(decode_zip(memoryview(bytearray(txt))))
+        assert ldata == data[i], "Error while decoding zip buffer nbr {}".format(i)
 
 
 def test_encode_zip():
@@ -91,6 +94,14 @@ def test_encode_zip():
         assert ldata == data[i], "Error while encoding zip file nbr {}".format(i)
 
 
+def test_encode_zip_into():
+    buffer = bytearray(2 ** 14)
+    for i in range(len(data)):
+        size = encode_zip_into(buffer, _encode_sub_files(data[i]))
+        ldata = _decode_sub_files(decode_zip(bytes(buffer[:size])))
+        assert ldata == data[i], "Error while encoding zip file nbr {} into a buffer".format(i)
+
+
 def test_read_zip():
     for i in range(len(data)):
         filename = FILENAMES_ZIP.format(i)
@@ -120,6 +131,18 @@ def test_load_zip():
         assert ldata == data[i], "Error while loading zip file nbr {}".format(i)
 
 
+def test_load_zip_lazy():
+    memfs = MemoryFileSystem()
+    for i in range(len(data)):
+        memfs.pipe("/zip/example_zip_{}.zip".format(i), load_bytes(FILENAMES_ZIP.format(i)))
+        for filename, fs in [(FILENAMES_ZIP.format(i), None), ("/zip/example_zip_{}.zip".format(i), memfs)]:
+            with load_zip(filename, fs=fs, lazy=True) as ldata:
+                assert set(ldata.namelist()) == set(data[i]), "Wrong file names in lazy zip file nbr {}".format(i)
+                assert all(ldata.getinfo(fn).file_size == len(ldata[fn]) for fn in ldata), "Wrong zip file info"
+                ldata = _decode_sub_files(ldata)
+            assert ldata == data[i], "Error while lazily loading zip file nbr {}".format(i)
+
+
 def test_save_zip():
     filename = FILENAMES_ZIP.format("write")
     for i in range(len(data)):
@@ -4,7 +4,7 @@ import os
 from iotools.bytesio import load_bytes
 from iotools.jsonio import decode_json, encode_json
 from iotools.pickleio import decode_pickle, encode_pickle
-from iotools.zstio import decode_zst, encode_zst, read_zst, write_zst, load_zst, save_zst, help_zst
+from iotools.zstio import decode_zst, encode_zst, encode_zst_into, read_zst, write_zst, load_zst, save_zst, help_zst
 
 
 TEST_DATA_PATH = "tests/data_for_tests/"
@@ -53,6 +53,14 @@ def test_encode_zst():
             assert ldata == data[i], "Error while encoding zst file nbr {}".format(i)
 
 
+def test_encode_zst_into():
+    buffer = bytearray(2 ** 12)
+    for i in range(len(data_json)):
+        size = encode_zst_into(buffer, encode_json(data_json[i]))
+        ldata = decode_json(decode_zst(memoryview(buffer)[:size]))
+        assert ldata == data_json[i], "Error while encoding zst data nbr {} into a buffer".format(i)
+
+
 def test_read_zst():
     for filenames_zst, data, decode_func in zip(
             [FILENAMES_JSON_ZST, FILENAMES_PICKLE_ZST],